@@ -1,21 +1,63 @@
 from __future__ import annotations
 
+import atexit
 import logging
+import logging.handlers
+import queue
 from pathlib import Path
 
 LOG_PATH = Path("./logs/autopublisher.log")
 LOG_PATH.parent.mkdir(exist_ok=True)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    handlers=[
-        logging.FileHandler(LOG_PATH, encoding="utf-8"),
-        logging.StreamHandler(),
-    ],
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+
+class _DeferredFlushFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler, der nur bei ERROR und höher sofort flusht.
+
+    Der Standard-Handler flusht nach jedem Record; niedrigere Level
+    bleiben hier im Stream-Puffer, bis dieser voll ist oder ein Fehler folgt.
+    """
+
+    _defer_flush: bool = False
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self._defer_flush = record.levelno < logging.ERROR
+        try:
+            super().emit(record)
+        finally:
+            self._defer_flush = False
+
+    def flush(self) -> None:
+        if not self._defer_flush:
+            super().flush()
+
+
+_formatter = logging.Formatter(LOG_FORMAT)
+
+_file_handler = _DeferredFlushFileHandler(
+    LOG_PATH, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding="utf-8"
 )
+_file_handler.setFormatter(_formatter)
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(_formatter)
+
+# Aufrufer legen Records nur in die Queue; Formatierung und Datei-I/O
+# übernimmt der Listener-Thread, inklusive der Rollover-Prüfung.
+_log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler], force=True)
+
+_listener = logging.handlers.QueueListener(
+    _log_queue, _file_handler, _stream_handler, respect_handler_level=True
+)
+_listener.start()
+atexit.register(_listener.stop)
 
 
 def log_event(message: str) -> None:
     logging.getLogger("autopublisher").info(message)
-
@@ -1,30 +1,61 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any, Callable, Mapping
+import os
+from typing import Any, Callable, Collection, Mapping
 
+from apscheduler.executors.asyncio import AsyncIOExecutor
 from apscheduler.executors.pool import ThreadPoolExecutor
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.schedulers.base import BaseScheduler
 from apscheduler.schedulers.blocking import BlockingScheduler
 
+try:
+    from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+except ImportError:  # pragma: no cover - SQLAlchemy ist optional
+    SQLAlchemyJobStore = None
+
 LOGGER = logging.getLogger(__name__)
 
 
-def _build_scheduler(settings: Mapping[str, Any]) -> BlockingScheduler:
-    """Erzeugt einen BlockingScheduler mit optionaler Persistenz."""
+def _default_max_workers() -> int:
+    """Threadpool-Größe für IO-lastige Upload-Jobs (analog concurrent.futures)."""
+    return min(32, (os.cpu_count() or 1) * 5)
+
+
+def _build_scheduler(
+    settings: Mapping[str, Any], event_loop: asyncio.AbstractEventLoop | None = None
+) -> BaseScheduler:
+    """Erzeugt den Scheduler mit optionaler Persistenz.
+
+    Mit ``event_loop`` entsteht ein AsyncIOScheduler, dessen Jobs über den
+    Default-Executor des Loops laufen; ansonsten ein BlockingScheduler mit
+    eigenem Threadpool.
+    """
     jobstores = {}
     jobstore_url = settings.get("scheduler_jobstore_url")
     if jobstore_url:
+        if SQLAlchemyJobStore is None:
+            error_msg = (
+                "Scheduler: 'scheduler_jobstore_url' gesetzt, aber SQLAlchemy ist nicht installiert."
+            )
+            LOGGER.error(error_msg)
+            raise RuntimeError(error_msg)
         try:
-            from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
-
             jobstores["default"] = SQLAlchemyJobStore(url=jobstore_url)
         except Exception as exc:  # pragma: no cover - direkte Fehlermeldung genügt
             LOGGER.error("Scheduler: Jobstore konnte nicht initialisiert werden: %s", exc)
             raise
 
-    executors = {
-        "default": ThreadPoolExecutor(settings.get("scheduler_max_workers", 4)),
-    }
+    if event_loop is not None:
+        executors = {"default": AsyncIOExecutor()}
+    else:
+        executors = {
+            "default": ThreadPoolExecutor(
+                settings.get("scheduler_max_workers") or _default_max_workers()
+            ),
+        }
     job_defaults = {
         "coalesce": True,
         "max_instances": settings.get("scheduler_max_instances", 1),
@@ -39,6 +70,8 @@ def _build_scheduler(settings: Mapping[str, Any]) -> BlockingScheduler:
     if jobstores:
         kwargs["jobstores"] = jobstores
 
+    if event_loop is not None:
+        return AsyncIOScheduler(event_loop=event_loop, **kwargs)
     return BlockingScheduler(**kwargs)
 
 
@@ -57,11 +90,19 @@ def _parse_schedule_entry(entry: Any) -> tuple[str, str | None]:
     raise TypeError(f"Scheduler: Ungültiger Upload-Zeit-Eintrag: {entry!r}")
 
 
-def start_scheduler(tasks: Mapping[str, Callable[[], None]], settings: dict) -> None:
-    """Startet den dauerhaften Scheduler mit den angegebenen Tasks."""
-    scheduler = _build_scheduler(settings)
+def start_scheduler(
+    task: Callable[[str], None], platforms: Collection[str], settings: dict
+) -> None:
+    """Startet den dauerhaften Scheduler.
 
-    for platform, entry in settings.get("upload_times", {}).items():
+    Für jede Plattform wird ``task`` als Cron-Job mit der Plattform als
+    Argument registriert. Mit ``scheduler_async`` läuft der Scheduler auf
+    einem asyncio-Loop statt im BlockingScheduler.
+    """
+    event_loop = asyncio.new_event_loop() if settings.get("scheduler_async", False) else None
+    scheduler = _build_scheduler(settings, event_loop)
+
+    for platform, entry in sorted(settings.get("upload_times", {}).items()):
         try:
             time_str, day_of_week = _parse_schedule_entry(entry)
             hour, minute = [int(part) for part in time_str.split(":")]
@@ -69,8 +110,8 @@ def start_scheduler(tasks: Mapping[str, Callable[[], None]], settings: dict) ->
             LOGGER.warning("Scheduler: Ungültige Konfiguration für %s: %s", platform, entry)
             continue
 
-        if platform not in tasks:
-            LOGGER.warning("Scheduler: Keine Task-Funktion für Plattform %s gefunden.", platform)
+        if platform not in platforms:
+            LOGGER.warning("Scheduler: Plattform %s nicht freigegeben – übersprungen.", platform)
             continue
 
         trigger_args = {"hour": hour, "minute": minute}
@@ -78,7 +119,8 @@ def start_scheduler(tasks: Mapping[str, Callable[[], None]], settings: dict) ->
             trigger_args["day_of_week"] = day_of_week
 
         scheduler.add_job(
-            func=tasks[platform],
+            func=task,
+            args=(platform,),
             trigger="cron",
             id=f"upload_{platform}",
             name=f"{platform}-upload",
@@ -92,6 +134,20 @@ def start_scheduler(tasks: Mapping[str, Callable[[], None]], settings: dict) ->
         )
 
     scheduler.print_jobs()
-    LOGGER.info("Scheduler: Starte BlockingScheduler (CTRL+C zum Beenden).")
+    if event_loop is None:
+        LOGGER.info("Scheduler: Starte BlockingScheduler (CTRL+C zum Beenden).")
+        scheduler.start()
+        return
+
+    LOGGER.info("Scheduler: Starte AsyncIOScheduler (CTRL+C zum Beenden).")
+    asyncio.set_event_loop(event_loop)
     scheduler.start()
+    try:
+        event_loop.run_forever()
+    finally:
+        # Scheduler vor dem Loop stoppen: sein Timer hängt am Loop, und
+        # shutdown() wird per call_soon_threadsafe im Loop ausgeführt
+        scheduler.shutdown(wait=False)
+        event_loop.run_until_complete(asyncio.sleep(0))
+        event_loop.close()
 
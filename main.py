@@ -11,16 +11,19 @@ from __future__ import annotations
 
 import argparse
 import logging
+import os
 import sys
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Callable, Iterable
 
-from automation.cleanup import cleanup
+from automation.cleanup import cleanup_many
 from automation.logger import log_event
 from automation.scheduler import start_scheduler
 from ui import settings_manager
 from render.pipeline import render_videos
+from scraper.downloader import DOWNLOAD_MAX_WORKERS
 from scraper.reddit import RedditScraper
 from upload.clapper import upload_to_clapper
 from upload.tiktok import upload_to_tiktok
@@ -32,12 +35,21 @@ logger = logging.getLogger(__name__)
 # Type Alias für Upload-Funktionen
 UploadFunction = Callable[[str, dict], None]
 
+# Bereits angelegte/geprüfte Verzeichnisse (siehe _ensure_dir)
+_ensured_dirs: set[str] = set()
+
+# Zeitstempel-Format für output_filename_template ({timestamp})
+TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
 UPLOAD_FUNCTIONS: dict[str, UploadFunction] = {
     "youtube": upload_to_youtube,
     "tiktok": upload_to_tiktok,
     "clapper": upload_to_clapper,
 }
 
+# Standard-Zielplattformen, wenn run_once keine Auswahl erhält
+DEFAULT_PLATFORMS: tuple[str, ...] = tuple(UPLOAD_FUNCTIONS)
+
 
 class PipelineError(Exception):
     """Basisexception für Pipeline-Fehler."""
@@ -63,6 +75,23 @@ class UploadError(PipelineError):
     pass
 
 
+def _ensure_dir(folder: str) -> Path:
+    """Legt ein Verzeichnis an, prüft das Dateisystem aber nur einmal pro Prozess.
+
+    Args:
+        folder: Verzeichnispfad aus den Settings
+
+    Returns:
+        Path-Objekt des Verzeichnisses
+    """
+    path = Path(folder)
+    if folder not in _ensured_dirs:
+        if not os.path.isdir(folder):
+            path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(folder)
+    return path
+
+
 def _collect_clips(settings: dict) -> tuple[list[str], Path, Path]:
     """Sammelt Clips aus Reddit und bereitet Ordnerstruktur vor.
 
@@ -76,40 +105,80 @@ def _collect_clips(settings: dict) -> tuple[list[str], Path, Path]:
         ScraperError: Bei Fehler beim Scraping oder der Authentifizierung
     """
     try:
-        # Ordner vorbereiten
-        video_folder = Path(settings.get("video_folder", "./output"))
-        video_folder.mkdir(parents=True, exist_ok=True)
-        logger.debug(f"Video-Ordner erstellt/überprüft: {video_folder}")
-
-        temp_folder = Path(settings.get("temp_folder", "./temp"))
-        temp_folder.mkdir(parents=True, exist_ok=True)
-        logger.debug(f"Temp-Ordner erstellt/überprüft: {temp_folder}")
-
-        # Scraper initialisieren
+        video_folder_setting = settings.get("video_folder", "./output")
+        temp_folder_setting = settings.get("temp_folder", "./temp")
         subreddit_setting = (
             settings.get("reddit_subreddits") 
             or settings.get("reddit_subreddit", "memes")
         )
+        reddit_limit = settings.get("reddit_limit", 10)
+
+        # Ordner vorbereiten
+        video_folder = _ensure_dir(video_folder_setting)
+        logger.debug("Video-Ordner erstellt/überprüft: %s", video_folder)
+
+        temp_folder = _ensure_dir(temp_folder_setting)
+        logger.debug("Temp-Ordner erstellt/überprüft: %s", temp_folder)
+
+        # Scraper initialisieren
         scraper = RedditScraper(
             subreddit=subreddit_setting,
-            limit=settings.get("reddit_limit", 10),
+            limit=reddit_limit,
+            cache_ttl=settings.get("reddit_cache_ttl", 0),
+            download_workers=settings.get(
+                "reddit_download_workers", DOWNLOAD_MAX_WORKERS
+            ),
         )
         
-        logger.info(f"Starte Reddit-Scraper für Subreddit(s): {subreddit_setting}")
-        scraper.authenticate()
-        logger.debug("Authentifizierung erfolgreich")
-        
-        clips = scraper.scrape(temp_folder.as_posix())
-        logger.info(f"Erfolgreich {len(clips)} Clips gescraped")
+        logger.info("Starte Reddit-Scraper für Subreddit(s): %s", subreddit_setting)
+        try:
+            scraper.authenticate()
+            logger.debug("Authentifizierung erfolgreich")
+
+            clips = scraper.scrape(temp_folder.as_posix())
+        finally:
+            scraper.close()
+        logger.info("Erfolgreich %d Clips gescraped", len(clips))
         
         return clips, temp_folder, video_folder
         
     except Exception as exc:
         error_msg = f"Fehler beim Scraping: {exc}"
-        logger.error(error_msg, exc_info=True)
+        logger.error(error_msg, exc_info=logger.isEnabledFor(logging.DEBUG))
         raise ScraperError(error_msg) from exc
 
 
+def _upload_to_platform(
+    platform: str, upload_func: UploadFunction, final_video: str, settings: dict
+) -> str | None:
+    """Lädt das Video auf eine Plattform hoch und protokolliert das Ergebnis.
+
+    Args:
+        platform: Name der Zielplattform
+        upload_func: Upload-Funktion der Plattform
+        final_video: Pfad zur finalen Video-Datei
+        settings: Konfigurationsdictionary
+
+    Returns:
+        None bei Erfolg, sonst die Fehlermeldung
+    """
+    logger.info("Starte Upload zu %s", platform)
+    try:
+        upload_func(final_video, settings)
+        logger.info("Upload zu %s erfolgreich", platform)
+        return None
+    except NotImplementedError as exc:
+        msg = f"{platform}: Funktion noch nicht implementiert"
+        logger.warning("%s: %s", msg, exc)
+        log_event(f"{msg} ({exc})")
+        return str(exc)
+    except Exception as exc:
+        msg = f"{platform}: Upload fehlgeschlagen"
+        logger.error("%s: %s", msg, exc, exc_info=logger.isEnabledFor(logging.DEBUG))
+        log_event(f"{msg} ({exc})")
+        return str(exc)
+
+
 def run_once(settings: dict, *, platforms: Iterable[str] | None = None) -> str:
     """Führt die komplette Pipeline einmal aus.
 
@@ -131,6 +200,9 @@ def run_once(settings: dict, *, platforms: Iterable[str] | None = None) -> str:
         RenderError: Bei Video-Rendering-Fehlern
     """
     logger.info("Starte Pipeline-Ausführung (once)")
+
+    render_vertical = settings.get("render_vertical", True)
+    filename_template = settings.get("output_filename_template", "final_{timestamp}.mp4")
     
     try:
         # Phase 1: Clips sammeln
@@ -144,19 +216,19 @@ def run_once(settings: dict, *, platforms: Iterable[str] | None = None) -> str:
         
         # Phase 2: Video rendern
         logger.debug("Phase 2: Video-Rendering startet")
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename_template = settings.get("output_filename_template", "final_{timestamp}.mp4")
+        timestamp = time.strftime(TIMESTAMP_FORMAT)
         final_filename = filename_template.format(timestamp=timestamp)
-        final_video_path = video_folder.joinpath(final_filename).as_posix()
+        video_folder_str = video_folder.as_posix()
+        final_video_path = f"{video_folder_str}/{final_filename}"
         
         try:
             final_video = render_videos(
                 clips,
                 output_path=final_video_path,
-                vertical=settings.get("render_vertical", True),
+                vertical=render_vertical,
                 settings=settings,
             )
-            logger.info(f"Video erfolgreich gerendert: {final_video}")
+            logger.info("Video erfolgreich gerendert: %s", final_video)
         except Exception as exc:
             error_msg = f"Video-Rendering fehlgeschlagen: {exc}"
             logger.error(error_msg, exc_info=True)
@@ -164,43 +236,55 @@ def run_once(settings: dict, *, platforms: Iterable[str] | None = None) -> str:
 
         # Phase 3: Uploads durchführen
         logger.debug("Phase 3: Plattform-Uploads starten")
-        selected_platforms = list(platforms) if platforms else list(UPLOAD_FUNCTIONS.keys())
+        selected_platforms = tuple(platforms) if platforms else DEFAULT_PLATFORMS
         upload_failures: dict[str, str] = {}
-        
-        for platform in selected_platforms:
-            upload_func = UPLOAD_FUNCTIONS.get(platform)
-            if not upload_func:
-                msg = f"Unbekannte Plattform '{platform}' – kein Upload durchgeführt"
-                logger.warning(msg)
-                log_event(msg)
-                continue
-
-            logger.info(f"Starte Upload zu {platform}")
-            try:
-                upload_func(final_video, settings)
-                logger.info(f"Upload zu {platform} erfolgreich")
-            except NotImplementedError as exc:
-                msg = f"{platform}: Funktion noch nicht implementiert"
-                logger.warning(f"{msg}: {exc}")
-                log_event(f"{msg} ({exc})")
-                upload_failures[platform] = str(exc)
-            except Exception as exc:
-                msg = f"{platform}: Upload fehlgeschlagen"
-                logger.error(f"{msg}: {exc}", exc_info=True)
-                log_event(f"{msg} ({exc})")
-                upload_failures[platform] = str(exc)
+
+        upload_pairs = [
+            (platform, UPLOAD_FUNCTIONS[platform])
+            for platform in selected_platforms
+            if platform in UPLOAD_FUNCTIONS
+        ]
+        if len(upload_pairs) != len(selected_platforms):
+            for platform in selected_platforms:
+                if platform not in UPLOAD_FUNCTIONS:
+                    msg = f"Unbekannte Plattform '{platform}' – kein Upload durchgeführt"
+                    logger.warning(msg)
+                    log_event(msg)
+
+        if len(upload_pairs) == 1:
+            platform, upload_func = upload_pairs[0]
+            error = _upload_to_platform(platform, upload_func, final_video, settings)
+            if error is not None:
+                upload_failures[platform] = error
+        elif upload_pairs:
+            # Uploads sind IO-lastig und unabhängig voneinander → parallel ausführen
+            with ThreadPoolExecutor(max_workers=len(upload_pairs)) as executor:
+                futures = {
+                    executor.submit(
+                        _upload_to_platform, platform, upload_func, final_video, settings
+                    ): platform
+                    for platform, upload_func in upload_pairs
+                }
+                for future in as_completed(futures):
+                    error = future.result()
+                    if error is not None:
+                        upload_failures[futures[future]] = error
         
         if upload_failures:
-            logger.warning(f"Uploads zu {len(upload_failures)} Plattformen fehlgeschlagen")
+            logger.warning("Uploads zu %d Plattformen fehlgeschlagen", len(upload_failures))
 
         # Phase 4: Cleanup
         logger.debug("Phase 4: Cleanup startet")
         try:
-            cleanup(temp_folder.as_posix(), delete_extensions={".mp4"})
-            cleanup(video_folder.as_posix(), preserve_files={Path(final_video).name})
+            cleanup_many(
+                [
+                    (temp_folder.as_posix(), {"delete_extensions": {".mp4"}}),
+                    (video_folder_str, {"preserve_files": {os.path.basename(final_video)}}),
+                ]
+            )
             logger.debug("Cleanup erfolgreich")
         except Exception as exc:
-            logger.error(f"Cleanup-Fehler (nicht kritisch): {exc}")
+            logger.error("Cleanup-Fehler (nicht kritisch): %s", exc)
         
         logger.info("Pipeline-Ausführung erfolgreich abgeschlossen")
         return final_video
@@ -235,13 +319,16 @@ def _parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--platform",
-        action="append",
+        action="extend",
+        nargs="+",
         dest="platforms",
-        help="Zielplattform(en) für den Upload. Kann mehrfach angegeben werden. "
+        help="Zielplattform(en) für den Upload, z.B. '--platform youtube tiktok'. "
+             "Kann auch mehrfach angegeben werden. "
              "Ohne Angabe werden alle verfügbaren Plattformen genutzt.",
     )
     parser.add_argument(
         "--log-level",
+        type=str.upper,
         choices=("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"),
         default="INFO",
         help="Logging-Level (Standard: INFO)",
@@ -262,18 +349,17 @@ def main() -> None:
     args = _parse_args()
     
     # Logging-Level konfigurieren
-    if hasattr(args, 'log_level'):
-        logging.getLogger().setLevel(args.log_level)
-        logger.info(f"Logging-Level gesetzt auf {args.log_level}")
+    logging.getLogger().setLevel(args.log_level)
+    logger.info("Logging-Level gesetzt auf %s", args.log_level)
     
     logger.info("="*60)
     logger.info("Social Video AutoPublisher gestartet")
-    logger.info(f"Modus: {args.mode}")
+    logger.info("Modus: %s", args.mode)
     
     try:
         # Einstellungen laden
         settings = settings_manager.load_settings()
-        logger.debug(f"Einstellungen geladen erfolgreich")
+        logger.debug("Einstellungen geladen erfolgreich")
         
         if args.mode == "schedule":
             logger.info("Starte Scheduler-Modus")
@@ -288,10 +374,10 @@ def main() -> None:
         logger.warning("Anwendung durch Benutzer unterbrochen (Ctrl+C)")
         sys.exit(0)
     except PipelineError as exc:
-        logger.error(f"Pipeline-Fehler: {exc}")
+        logger.error("Pipeline-Fehler: %s", exc)
         sys.exit(1)
     except Exception as exc:
-        logger.critical(f"Kritischer Fehler: {exc}", exc_info=True)
+        logger.critical("Kritischer Fehler: %s", exc, exc_info=True)
         sys.exit(2)
     finally:
         logger.info("="*60)
@@ -315,6 +401,23 @@ def _run_once_mode(settings: dict, platforms: list[str] | None) -> None:
         raise
 
 
+def _platform_task(platform: str) -> None:
+    """Scheduler-Job: Führt die Pipeline für eine einzelne Plattform aus.
+
+    Eine modulweite Funktion statt einer Closure pro Plattform; APScheduler
+    übergibt die Plattform als Job-Argument (und kann den Job so auch in
+    einem persistenten Jobstore serialisieren).
+
+    Args:
+        platform: Zielplattform des Jobs
+    """
+    try:
+        logger.info("Scheduler-Task für %s ausgelöst", platform)
+        run_once(settings_manager.get_settings(), platforms=[platform])
+    except Exception as exc:
+        logger.error("Scheduler-Task für %s fehlgeschlagen: %s", platform, exc, exc_info=True)
+
+
 def _run_scheduler_mode(settings: dict) -> None:
     """Führt die Pipeline im Scheduler-Modus aus.
 
@@ -331,35 +434,21 @@ def _run_scheduler_mode(settings: dict) -> None:
         logger.error(error_msg)
         raise SystemExit(error_msg)
     
-    # Tasks für Scheduler vorbereiten
-    tasks: dict[str, Callable[[], None]] = {}
+    # Plattformen für Scheduler vorbereiten
+    platforms: list[str] = []
     for platform in upload_times:
         if platform not in UPLOAD_FUNCTIONS:
-            logger.warning(f"Plattform '{platform}' nicht unterstützt, wird übersprungen")
+            logger.warning("Plattform '%s' nicht unterstützt, wird übersprungen", platform)
             continue
-        
-        # Closure für jede Plattform erstellen
-        def create_task(plat: str) -> Callable[[], None]:
-            def task() -> None:
-                try:
-                    logger.info(f"Scheduler-Task für {plat} ausgelöst")
-                    run_once(
-                        settings_manager.load_settings(),
-                        platforms=[plat]
-                    )
-                except Exception as exc:
-                    logger.error(f"Scheduler-Task für {plat} fehlgeschlagen: {exc}", exc_info=True)
-            return task
-        
-        tasks[platform] = create_task(platform)
+        platforms.append(platform)
     
-    if not tasks:
+    if not platforms:
         error_msg = "Keine gültigen Plattformen für den Scheduler konfiguriert"
         logger.error(error_msg)
         raise SystemExit(error_msg)
     
-    logger.info(f"Starte Scheduler mit {len(tasks)} Task(s)")
-    start_scheduler(tasks, settings)
+    logger.info("Starte Scheduler mit %d Task(s)", len(platforms))
+    start_scheduler(_platform_task, platforms, settings)
 
 
 if __name__ == "__main__":
@@ -10,15 +10,28 @@ Orchestriert die Erstellung von Video-Compilations mit:
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import json
 import logging
 import os
+import shutil
+import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Iterable, Optional, Tuple
 from uuid import uuid4
 
 import ffmpeg
 
+try:
+    import av
+except ImportError:  # pragma: no cover - PyAV ist optional
+    av = None
+
 logger = logging.getLogger(__name__)
 
 # Debug-Flag für FFmpeg-Ausgabe
@@ -31,6 +44,24 @@ DEFAULT_LOUDNESS: Dict[str, float] = {
     "target_lra": 11.0,  # Loudness Range
 }
 
+# Messwerte einer ebur128/loudnorm-Analyse für linearen Single-Pass-Modus
+MEASURED_LOUDNESS_KEYS: Tuple[str, ...] = (
+    "measured_i",
+    "measured_tp",
+    "measured_lra",
+    "measured_thresh",
+)
+
+# Wo loudnorm angewendet wird (render_loudness_stage)
+LOUDNESS_STAGES: Tuple[str, ...] = ("per_segment", "final", "both")
+
+# Gemeinsame FFmpeg Output-Parameter aller Encodes
+OUTPUT_ARGS_TEMPLATE: Dict[str, Any] = {
+    "movflags": "+faststart",
+    "pix_fmt": "yuv420p",
+    "ac": 2,
+}
+
 # Wasserzeichen-Positionen (x, y Koordinaten)
 WATERMARK_POSITIONS: Dict[str, Tuple[str, str]] = {
     "top-left": ("{margin}", "{margin}"),
@@ -44,6 +75,46 @@ WATERMARK_POSITIONS: Dict[str, Tuple[str, str]] = {
 VERTICAL_FORMAT: Tuple[int, int] = (1080, 1920)  # 9:16 für mobile
 HORIZONTAL_FORMAT: Tuple[int, int] = (1920, 1080)  # 16:9 für Desktop
 
+# Hardware-Encoder in Prioritätsreihenfolge (render_hwaccel="auto")
+HW_ENCODERS: Tuple[str, ...] = ("h264_nvenc", "h264_qsv")
+SOFTWARE_ENCODER = "libx264"
+# Preset ohne render_preset: Durchsatz vor maximaler Kompression
+DEFAULT_PRESET = "veryfast"
+# Explizit über render_hwaccel wählbar (zusätzlich zu "auto"/"none")
+SELECTABLE_ENCODERS: Tuple[str, ...] = (*HW_ENCODERS, "hevc_nvenc", SOFTWARE_ENCODER)
+
+# x264-Presets → NVENC-Presets (p1 = schnellste, p7 = beste Qualität)
+NVENC_PRESETS: Dict[str, str] = {
+    "ultrafast": "p1",
+    "superfast": "p1",
+    "veryfast": "p2",
+    "faster": "p3",
+    "fast": "p3",
+    "medium": "p4",
+    "slow": "p5",
+    "slower": "p6",
+    "veryslow": "p7",
+}
+
+# x264-Presets → Quick-Sync-Presets (QSV kennt nur veryfast bis veryslow)
+QSV_PRESETS: Dict[str, str] = {
+    "ultrafast": "veryfast",
+    "superfast": "veryfast",
+    "veryfast": "veryfast",
+    "faster": "faster",
+    "fast": "fast",
+    "medium": "medium",
+    "slow": "slow",
+    "slower": "slower",
+    "veryslow": "veryslow",
+}
+
+# Maximal parallel laufende ffprobe-Prozesse
+PROBE_MAX_WORKERS: int = 8
+
+# Richtwert für CPU-Kerne pro parallel laufendem FFmpeg-Prozess (Phase 2)
+FFMPEG_THREADS_PER_SEGMENT: int = 4
+
 
 class RenderError(Exception):
     """Exception für Rendering-Fehler."""
@@ -57,11 +128,325 @@ class FFmpegError(RenderError):
     pass
 
 
-def _has_audio_track(path: Path) -> bool:
+def _probe_pyav(path_str: str) -> Optional[Dict[str, Any]]:
+    """Liest Stream-Informationen in-process mit PyAV (ohne ffprobe-Prozess).
+
+    Das Ergebnis ist wie die ffprobe-JSON-Ausgabe aufgebaut, soweit die
+    Pipeline Felder daraus liest.
+
+    Args:
+        path_str: Pfad zur Mediendatei
+
+    Returns:
+        Probe-Ergebnis oder None bei Fehler
+    """
+    try:
+        with av.open(path_str) as container:
+            streams: list[Dict[str, Any]] = []
+            for stream in container.streams:
+                codec = stream.codec_context
+                entry: Dict[str, Any] = {
+                    "codec_type": stream.type,
+                    "codec_name": codec.name if codec else None,
+                }
+                if stream.type == "video":
+                    rate = stream.base_rate or stream.average_rate
+                    entry.update(
+                        width=codec.width,
+                        height=codec.height,
+                        pix_fmt=codec.pix_fmt,
+                        r_frame_rate=f"{rate.numerator}/{rate.denominator}"
+                        if rate
+                        else "0/1",
+                    )
+                elif stream.type == "audio":
+                    entry.update(
+                        sample_rate=str(codec.sample_rate),
+                        channels=codec.channels,
+                    )
+                streams.append(entry)
+            fmt: Dict[str, Any] = {}
+            if container.duration is not None:
+                fmt["duration"] = str(container.duration / av.time_base)
+            return {"streams": streams, "format": fmt}
+    except (av.error.FFmpegError, OSError) as exc:
+        logger.debug(f"PyAV-Probe fehlgeschlagen für {path_str}: {exc}")
+        return None
+
+
+@lru_cache(maxsize=512)
+def _probe_cached(path_str: str, mtime_ns: int, size: int) -> Optional[Dict[str, Any]]:
+    """Probt eine Mediendatei; Ergebnis gilt pro (Pfad, mtime, Größe).
+
+    Ist PyAV installiert, wird in-process geprobt; ffprobe dient dann nur
+    noch als Fallback.
+
+    Args:
+        path_str: Pfad zur Mediendatei
+        mtime_ns: Änderungszeitpunkt (nur Cache-Schlüssel)
+        size: Dateigröße (nur Cache-Schlüssel)
+
+    Returns:
+        Probe-Ergebnis oder None bei Probe-Fehler
+
+    Logs:
+        DEBUG: Probe-Fehler
+    """
+    if av is not None:
+        probe = _probe_pyav(path_str)
+        if probe is not None:
+            return probe
+    try:
+        return ffmpeg.probe(path_str)
+    except (ffmpeg.Error, OSError) as exc:
+        logger.debug(f"Probe fehlgeschlagen für {path_str}: {exc}")
+        return None
+
+
+def _probe_media(path: Path) -> Optional[Dict[str, Any]]:
+    """Liest Stream- und Format-Informationen einer Mediendatei (ffprobe).
+
+    Ergebnisse werden pro Datei-Version gecacht, sodass wiederholt genutzte
+    Dateien (Intro, Outro, mehrfach geprüfte Clips) nur einmal geprobt werden.
+
+    Args:
+        path: Pfad zur Mediendatei
+
+    Returns:
+        Probe-Ergebnis oder None bei Probe-Fehler
+
+    Logs:
+        DEBUG: Probe-Fehler
+    """
+    try:
+        stat = path.stat()
+    except OSError as exc:
+        logger.debug(f"Probe fehlgeschlagen für {path.name}: {exc}")
+        return None
+    return _probe_cached(path.as_posix(), stat.st_mtime_ns, stat.st_size)
+
+
+def _hw_encoder_works(codec: str) -> bool:
+    """Prüft per kurzem Test-Encode, ob ein Hardware-Encoder nutzbar ist.
+
+    Args:
+        codec: FFmpeg-Encoder-Name (z. B. "h264_nvenc")
+
+    Returns:
+        True wenn der Test-Encode erfolgreich war
+    """
+    try:
+        result = subprocess.run(
+            [
+                "ffmpeg", "-hide_banner", "-loglevel", "error",
+                "-f", "lavfi", "-i", "color=s=256x256:d=0.1",
+                "-c:v", codec, "-f", "null", "-",
+            ],
+            capture_output=True,
+            timeout=15,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return result.returncode == 0
+
+
+@lru_cache(maxsize=1)
+def _available_hw_encoder() -> Optional[str]:
+    """Ermittelt einmal pro Prozess den ersten nutzbaren Hardware-Encoder.
+
+    Returns:
+        Encoder-Name aus HW_ENCODERS oder None
+
+    Logs:
+        INFO: Gewählter Hardware-Encoder
+        DEBUG: Encoder-Liste nicht abrufbar
+    """
+    try:
+        encoders = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            timeout=15,
+            check=True,
+        ).stdout
+    except (OSError, subprocess.SubprocessError) as exc:
+        logger.debug(f"FFmpeg-Encoder-Liste nicht abrufbar: {exc}")
+        return None
+
+    for codec in HW_ENCODERS:
+        if f" {codec} " in encoders and _hw_encoder_works(codec):
+            logger.info(f"Hardware-Encoder aktiv: {codec}")
+            return codec
+    return None
+
+
+def _selected_encoder(settings: Dict[str, Any]) -> str:
+    """Wählt den Video-Encoder anhand von "render_hwaccel".
+
+    Args:
+        settings: Settings mit optionalem Key "render_hwaccel"
+            ("auto", "none" oder ein Encoder aus SELECTABLE_ENCODERS)
+
+    Returns:
+        FFmpeg-Encoder-Name
+
+    Logs:
+        WARNING: Unbekannter Encoder in render_hwaccel
+    """
+    hwaccel = settings.get("render_hwaccel", "auto")
+    if hwaccel == "auto":
+        return _available_hw_encoder() or SOFTWARE_ENCODER
+    if hwaccel in SELECTABLE_ENCODERS:
+        return hwaccel
+    if hwaccel not in (None, False, "none"):
+        logger.warning(f"Unbekannter Encoder '{hwaccel}' – nutze {SOFTWARE_ENCODER}")
+    return SOFTWARE_ENCODER
+
+
+def _video_codec_args(settings: Dict[str, Any]) -> Dict[str, Any]:
+    """Liefert Encoder-Argumente für FFmpeg-Outputs.
+
+    Args:
+        settings: Settings mit optionalen Keys "render_hwaccel",
+            "render_preset" und "render_nvenc_preset"
+
+    Returns:
+        Dict mit vcodec, preset und encoderspezifischer Ratensteuerung
+    """
+    preset = settings.get("render_preset", DEFAULT_PRESET)
+    codec = _selected_encoder(settings)
+
+    if codec.endswith("_nvenc"):
+        return {
+            "vcodec": codec,
+            "preset": settings.get("render_nvenc_preset")
+            or NVENC_PRESETS.get(preset, "p4"),
+            "tune": "hq",
+            "rc": "vbr",
+            "cq": 23,
+        }
+    if codec == "h264_qsv":
+        return {
+            "vcodec": codec,
+            "preset": QSV_PRESETS.get(preset, "medium"),
+            "pix_fmt": "nv12",
+        }
+    codec_args: Dict[str, Any] = {"vcodec": codec, "preset": preset}
+    x264_params = settings.get("render_x264_params")
+    if x264_params and codec == SOFTWARE_ENCODER:
+        codec_args["x264-params"] = x264_params
+    return codec_args
+
+
+def _intermediate_codec_args(settings: Dict[str, Any], fps: int) -> Dict[str, Any]:
+    """Liefert Encoder-Argumente für Zwischendateien vor dem finalen Encode.
+
+    Zwischendateien werden nur einmal vom concat-Demuxer gelesen: libx264
+    läuft mit ultrafast/CRF 18, NVENC mit Low-Latency-Tuning ohne
+    B-Frames, Lookahead und Adaptive Quantization, QSV mit veryfast
+    (schnellstes gültiges QSV-Preset).
+
+    Args:
+        settings: Rendering-Settings
+        fps: Frames per Second (GOP-Länge = 2 Sekunden)
+
+    Returns:
+        Dict mit vcodec, preset und encoderspezifischen Optionen
+    """
+    codec_args = _video_codec_args({**settings, "render_preset": "ultrafast"})
+    codec = codec_args["vcodec"]
+    if codec == SOFTWARE_ENCODER:
+        codec_args.update(crf=18, tune="fastdecode")
+    elif codec.endswith("_nvenc"):
+        codec_args.update(
+            {
+                "preset": "p1",
+                "tune": "ll",
+                "rc-lookahead": 0,
+                "bf": 0,
+                "spatial_aq": 0,
+                "temporal_aq": 0,
+                "g": fps * 2,
+            }
+        )
+    return codec_args
+
+
+def _gpu_filters(settings: Dict[str, Any]) -> bool:
+    """Prüft ob Skalierung auf der GPU laufen soll (nur mit NVENC).
+
+    Args:
+        settings: Settings mit optionalem Key "render_gpu_filters"
+
+    Returns:
+        True wenn render_gpu_filters aktiv und ein NVENC-Encoder gewählt ist
+    """
+    return bool(settings.get("render_gpu_filters")) and _selected_encoder(
+        settings
+    ).endswith("_nvenc")
+
+
+def _decode_args(settings: Dict[str, Any], keep_on_gpu: bool = False) -> Dict[str, Any]:
+    """Liefert Input-Argumente für hardwarebeschleunigtes Decoding.
+
+    Bei NVENC wird auch über CUDA decodiert. Standardmäßig landen die Frames
+    wieder im Systemspeicher, damit die CPU-Filter (scale, pad, overlay)
+    unverändert funktionieren.
+
+    Args:
+        settings: Rendering-Settings
+        keep_on_gpu: Frames im CUDA-Speicher lassen (für _normalize_video
+            mit render_gpu_filters)
+
+    Returns:
+        Dict mit Input-Argumenten (leer bei Software-Encoding)
+    """
+    if not _selected_encoder(settings).endswith("_nvenc"):
+        return {}
+    if keep_on_gpu and _gpu_filters(settings):
+        return {"hwaccel": "cuda", "hwaccel_output_format": "cuda"}
+    return {"hwaccel": "cuda"}
+
+
+def _output_args(settings: Dict[str, Any], fps: int) -> Dict[str, Any]:
+    """Baut die FFmpeg Output-Parameter aus Template und Settings.
+
+    Args:
+        settings: Settings mit render_video_bitrate, render_audio_bitrate,
+            render_threads und Encoder-Keys (siehe _video_codec_args)
+        fps: Frames per Second
+
+    Returns:
+        Neues Dict mit Output-Parametern
+    """
+    return {
+        **OUTPUT_ARGS_TEMPLATE,
+        "r": fps,
+        "b:v": settings.get("render_video_bitrate", "6000k"),
+        "b:a": settings.get("render_audio_bitrate", "192k"),
+        "threads": settings.get("render_threads", 0),
+        **_video_codec_args(settings),
+    }
+
+
+def _probe_all(paths: list[Path]) -> None:
+    """Probt mehrere Dateien parallel und füllt damit den Probe-Cache.
+
+    Args:
+        paths: Zu probende Dateien
+    """
+    if len(paths) < 2:
+        return
+    with ThreadPoolExecutor(max_workers=min(PROBE_MAX_WORKERS, len(paths))) as executor:
+        list(executor.map(_probe_media, paths))
+
+
+def _has_audio_track(path: Path, skip_probe: bool = False) -> bool:
     """Prüft ob ein Video einen Audiostream enthält.
 
     Args:
         path: Pfad zur Video-Datei
+        skip_probe: Audio ohne ffprobe als vorhanden annehmen
 
     Returns:
         True wenn Audiostream vorhanden, sonst False
@@ -70,22 +455,43 @@ def _has_audio_track(path: Path) -> bool:
         DEBUG: Probe-Ergebnis
         WARNING: Probe-Fehler
     """
-    try:
-        probe = ffmpeg.probe(path.as_posix())
-        has_audio = any(
-            stream.get("codec_type") == "audio" for stream in probe.get("streams", [])
-        )
-        logger.debug(f"Audio-Track Probe: {path.name} → {has_audio}")
-        return has_audio
-    except ffmpeg.Error as exc:
+    if skip_probe:
+        return True
+
+    probe = _probe_media(path)
+    if probe is None:
         logger.warning(
             f"Audio-Probe fehlgeschlagen für {path.name} – "
-            f"generiere künstlichen Audiostream: {exc}"
+            f"generiere künstlichen Audiostream"
         )
         return False
 
+    has_audio = any(
+        stream.get("codec_type") == "audio" for stream in probe.get("streams", [])
+    )
+    logger.debug(f"Audio-Track Probe: {path.name} → {has_audio}")
+    return has_audio
+
+
+def _media_duration(path: Path) -> Optional[float]:
+    """Ermittelt die Dauer einer Mediendatei in Sekunden.
 
-def _ensure_audio(stream: Any, has_audio: bool) -> Any:
+    Args:
+        path: Pfad zur Mediendatei
+
+    Returns:
+        Dauer in Sekunden oder None wenn unbekannt
+    """
+    probe = _probe_media(path)
+    if probe is None:
+        return None
+    try:
+        return float(probe.get("format", {})["duration"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _ensure_audio(stream: Any, has_audio: bool, duration: Optional[float] = None) -> Any:
     """Stellt sicher dass ein Audiostream vorhanden ist.
 
     Falls das Video keinen Audio hat, wird ein künstlicher
@@ -94,6 +500,8 @@ def _ensure_audio(stream: Any, has_audio: bool) -> Any:
     Args:
         stream: FFmpeg Stream-Objekt
         has_audio: Boolean ob Audio vorhanden ist
+        duration: Optionale Länge des Stille-Streams in Sekunden
+            (nötig, wenn der Stream in einen concat-Filter läuft)
 
     Returns:
         Audio-Stream (entweder vom Video oder künstlich generiert)
@@ -102,8 +510,11 @@ def _ensure_audio(stream: Any, has_audio: bool) -> Any:
         return stream.audio
 
     logger.debug("Erzeuge künstlichen Audiostream (anullsrc)")
+    input_args: Dict[str, Any] = {"f": "lavfi"}
+    if duration is not None:
+        input_args["t"] = duration
     return ffmpeg.input(
-        "anullsrc=channel_layout=stereo:sample_rate=44100", f="lavfi"
+        "anullsrc=channel_layout=stereo:sample_rate=44100", **input_args
     ).audio
 
 
@@ -112,22 +523,196 @@ def _loudnorm(
 ) -> Any:
     """Normalisiert Audio-Lautstärke nach EBU R128 Standard.
 
+    Enthält die Konfiguration Messwerte einer vorherigen Analyse
+    (measured_i, measured_tp, measured_lra, measured_thresh), läuft loudnorm
+    im linearen Modus ohne eigene dynamische Analyse.
+
     Args:
         audio_stream: FFmpeg Audio-Stream
         loudness_cfg: Konfiguration mit target_i, target_tp, target_lra
+            und optionalen measured_*-Werten
 
     Returns:
         FFmpeg Filter-Chain mit loudnorm-Filter
     """
     loudnorm_cfg = {**DEFAULT_LOUDNESS, **(loudness_cfg or {})}
-    return audio_stream.filter(
+    filter_args: Dict[str, Any] = {
+        "I": loudnorm_cfg["target_i"],
+        "TP": loudnorm_cfg["target_tp"],
+        "LRA": loudnorm_cfg["target_lra"],
+    }
+    if all(key in loudnorm_cfg for key in MEASURED_LOUDNESS_KEYS):
+        filter_args.update(
+            {key: loudnorm_cfg[key] for key in MEASURED_LOUDNESS_KEYS}, linear="true"
+        )
+        if "offset" in loudnorm_cfg:
+            filter_args["offset"] = loudnorm_cfg["offset"]
+    return audio_stream.filter("loudnorm", **filter_args)
+
+
+def _measure_loudness(
+    audio_stream: Any, loudness_cfg: Optional[Dict[str, float]]
+) -> Optional[Dict[str, float]]:
+    """Misst die Lautheit eines Audio-Streams (loudnorm, erster Durchgang).
+
+    Läuft als reiner Audio-Durchlauf ohne Output-Datei; die Werte erlauben
+    danach einen linearen loudnorm-Durchgang (siehe _loudnorm).
+
+    Args:
+        audio_stream: FFmpeg Audio-Stream (inkl. aller vorgelagerten Filter)
+        loudness_cfg: Konfiguration mit target_i, target_tp, target_lra
+
+    Returns:
+        Dict mit measured_i, measured_tp, measured_lra, measured_thresh und
+        offset oder None wenn die Messung fehlschlägt
+
+    Logs:
+        DEBUG: Messwerte
+        WARNING: Messung fehlgeschlagen
+    """
+    loudnorm_cfg = {**DEFAULT_LOUDNESS, **(loudness_cfg or {})}
+    measure = audio_stream.filter(
         "loudnorm",
         I=loudnorm_cfg["target_i"],
         TP=loudnorm_cfg["target_tp"],
         LRA=loudnorm_cfg["target_lra"],
+        print_format="json",
+    )
+    try:
+        _, stderr = ffmpeg.output(measure, "-", f="null").run(
+            capture_stdout=True, capture_stderr=True
+        )
+        text = stderr.decode("utf-8", errors="replace")
+        stats = json.loads(text[text.rindex("{") : text.rindex("}") + 1])
+        measured = {
+            "measured_i": float(stats["input_i"]),
+            "measured_tp": float(stats["input_tp"]),
+            "measured_lra": float(stats["input_lra"]),
+            "measured_thresh": float(stats["input_thresh"]),
+            "offset": float(stats["target_offset"]),
+        }
+    except (ffmpeg.Error, ValueError, KeyError) as exc:
+        logger.warning(f"Loudness-Messung fehlgeschlagen – nutze dynamisches loudnorm: {exc}")
+        return None
+
+    logger.debug(f"Loudness-Messung: {measured}")
+    return measured
+
+
+def _loudness_stage(settings: Dict[str, Any]) -> str:
+    """Liefert die Stufe der Loudness-Normalisierung.
+
+    Args:
+        settings: Settings mit optionalem Key "render_loudness_stage"
+
+    Returns:
+        "per_segment", "final" oder "both"
+
+    Logs:
+        WARNING: Unbekannte Stufe
+    """
+    stage = settings.get("render_loudness_stage", "final")
+    if stage not in LOUDNESS_STAGES:
+        logger.warning(f"Unbekannte Loudness-Stufe '{stage}' – nutze 'final'")
+        return "final"
+    return stage
+
+
+def _normalize_video(
+    video_stream: Any, width: int, height: int, fps: int, settings: Dict[str, Any]
+) -> Any:
+    """Skaliert, paddet und setzt die Framerate eines Video-Streams.
+
+    Args:
+        video_stream: FFmpeg Video-Stream
+        width: Ziel-Video-Breite
+        height: Ziel-Video-Höhe
+        fps: Frames per Second
+        settings: Settings mit optionalen Keys "render_padding_color" und
+            "render_gpu_filters" (Input muss dann mit _decode_args(...,
+            keep_on_gpu=True) geöffnet sein)
+
+    Returns:
+        Normalisierter Video-Stream
+    """
+    # fps zuerst: fehlerhafte Quellen mit extremer Framerate sollen nicht
+    # jeden überzähligen Frame durch scale/pad schicken
+    # Einpassen statt nur auf Breite skalieren: auch Hochkant-Clips im
+    # Querformat passen in den Frame, pad zentriert mit x/y = -1
+    video = video_stream.filter("fps", fps)
+    if _gpu_filters(settings):
+        # Skalierung auf der GPU, nur der verkleinerte Frame wird kopiert
+        video = (
+            video.filter(
+                "scale_cuda",
+                width,
+                height,
+                force_original_aspect_ratio="decrease",
+                force_divisible_by=2,
+                format="nv12",
+            )
+            .filter("hwdownload")
+            .filter("format", "nv12")
+        )
+    else:
+        video = video.filter(
+            "scale",
+            width,
+            height,
+            force_original_aspect_ratio="decrease",
+            force_divisible_by=2,
+        )
+    return video.filter(
+        "pad",
+        width,
+        height,
+        -1,
+        -1,
+        color=settings.get("render_padding_color", "black"),
+    )
+
+
+def _needs_final_pass(settings: Dict[str, Any]) -> bool:
+    """Prüft ob nach der Konkatenation ein finaler Encode nötig ist.
+
+    Args:
+        settings: Rendering-Settings
+
+    Returns:
+        True wenn Watermark, Musik oder eigene Loudness-Ziele konfiguriert sind
+    """
+    return bool(
+        settings.get("render_watermark")
+        or settings.get("render_background_music")
+        or settings.get("render_loudness")
     )
 
 
+def _segment_output_args(settings: Dict[str, Any], fps: int) -> Dict[str, Any]:
+    """Baut die Output-Parameter für normalisierte Segmente.
+
+    Alle Segmente eines Renders teilen Settings und fps, daher wird das
+    Dict einmal pro render_videos-Aufruf berechnet.
+
+    Args:
+        settings: Rendering-Settings
+        fps: Frames per Second
+
+    Returns:
+        Neues Dict mit Output-Parametern
+    """
+    output_args = _output_args(settings, fps)
+    # Segmente liest nur der concat-Demuxer: fragmentiertes MP4 spart den
+    # nachgelagerten moov-Umzug von +faststart
+    output_args["movflags"] = "+frag_keyframe+empty_moov"
+    if _needs_final_pass(settings):
+        # Zwischendatei wird in Phase 4 erneut encodiert
+        output_args.update(_intermediate_codec_args(settings, fps))
+        if output_args["vcodec"] == SOFTWARE_ENCODER:
+            del output_args["b:v"]
+    return output_args
+
+
 def _prepare_segment(
     input_path: Path,
     output_dir: Path,
@@ -136,6 +721,8 @@ def _prepare_segment(
     fps: int,
     loudness_cfg: Optional[Dict[str, float]],
     settings: Dict[str, Any],
+    threads: Optional[int] = None,
+    output_args: Optional[Dict[str, Any]] = None,
 ) -> Path:
     """Normalisiert Video- und Audio-Einstellungen eines Clips.
 
@@ -144,6 +731,10 @@ def _prepare_segment(
     - Audio-Stream-Erzeugung (falls nicht vorhanden)
     - Loudness-Normalisierung
 
+    Folgt noch ein finaler Encode (Phase 4), wird das Segment als schnelle
+    Zwischendatei (ultrafast, CRF 18) geschrieben; sonst direkt mit den
+    finalen Encoder-Einstellungen.
+
     Args:
         input_path: Pfad zum Input-Video
         output_dir: Zielverzeichnis für normalisiertes Video
@@ -152,6 +743,10 @@ def _prepare_segment(
         fps: Frames per Second
         loudness_cfg: Loudness-Konfiguration
         settings: Rendering-Settings (preset, bitrate, color, etc.)
+        threads: Optionale Thread-Anzahl für FFmpeg (bei parallelen Segmenten,
+            überschreibt "render_threads")
+        output_args: Vorab berechnete Output-Parameter (siehe
+            _segment_output_args); werden kopiert, nicht verändert
 
     Returns:
         Pfad zum normalisierten Video
@@ -169,34 +764,27 @@ def _prepare_segment(
 
         logger.debug(f"Normalisiere Clip: {input_path.name} → {width}x{height} @ {fps}fps")
 
-        has_audio = _has_audio_track(input_path)
-        stream = ffmpeg.input(input_path.as_posix())
+        has_audio = _has_audio_track(input_path, settings.get("render_skip_probe", False))
+        stream = ffmpeg.input(
+            input_path.as_posix(), **_decode_args(settings, keep_on_gpu=True)
+        )
 
         # Video-Stream: Scale + Pad
-        video = stream.video.filter("scale", width, -2).filter(
-            "pad",
-            width,
-            height,
-            "(ow-iw)/2",
-            "(oh-ih)/2",
-            color=settings.get("render_padding_color", "black"),
-        )
-        video = video.filter("fps", fps)
+        video = _normalize_video(stream.video, width, height, fps, settings)
 
-        # Audio-Stream: Ensure + Loudnorm
+        # Audio-Stream: Ensure + Loudnorm (ohne Phase 4 immer pro Segment)
         audio = _ensure_audio(stream, has_audio)
-        audio = _loudnorm(audio, loudness_cfg)
+        if _loudness_stage(settings) != "final" or not _needs_final_pass(settings):
+            audio = _loudnorm(audio, loudness_cfg)
 
         # FFmpeg Output-Parameter
-        output_args: Dict[str, Any] = {
-            "preset": settings.get("render_preset", "medium"),
-            "movflags": "+faststart",
-            "pix_fmt": "yuv420p",
-            "r": fps,
-            "ac": 2,
-            "b:v": settings.get("render_video_bitrate", "6000k"),
-            "b:a": settings.get("render_audio_bitrate", "192k"),
-        }
+        output_args = (
+            dict(output_args)
+            if output_args is not None
+            else _segment_output_args(settings, fps)
+        )
+        if threads:
+            output_args["threads"] = threads
 
         logger.debug(f"FFmpeg Output-Args: {output_args}")
 
@@ -219,12 +807,159 @@ def _prepare_segment(
         raise RenderError(error_msg) from exc
 
 
-def _optional_segment(path_value: Optional[str], label: str) -> Optional[Path]:
+def _segment_workers(settings: Dict[str, Any], segment_count: int) -> int:
+    """Bestimmt die Anzahl parallel normalisierter Segmente.
+
+    Args:
+        settings: Settings mit optionalem Key "render_parallel_segments"
+        segment_count: Anzahl zu normalisierender Segmente
+
+    Returns:
+        Anzahl Worker (mindestens 1, höchstens segment_count)
+    """
+    configured = settings.get("render_parallel_segments")
+    if configured:
+        workers = int(configured)
+    else:
+        workers = (os.cpu_count() or 1) // FFMPEG_THREADS_PER_SEGMENT
+    return max(1, min(workers, segment_count))
+
+
+def _remove_temp_files(paths: Iterable[Path]) -> None:
+    """Löscht temporäre Dateien, Fehler werden nur protokolliert."""
+    for path in paths:
+        try:
+            path.unlink(missing_ok=True)
+        except OSError as exc:
+            logger.debug(f"Konnte temporäre Datei nicht löschen: {path} - {exc}")
+
+
+def _prepare_segments(
+    raw_segments: list[Path],
+    output_dir: Path,
+    width: int,
+    height: int,
+    fps: int,
+    loudness_cfg: Optional[Dict[str, float]],
+    settings: Dict[str, Any],
+) -> list[Path]:
+    """Normalisiert alle Segmente, bei mehreren Workern parallel.
+
+    Jeder Worker wartet nur auf seinen FFmpeg-Prozess, daher genügen Threads.
+    Die CPU-Kerne werden auf die parallel laufenden FFmpeg-Prozesse aufgeteilt.
+
+    Args:
+        raw_segments: Segmente in Ausgabereihenfolge
+        output_dir: Zielverzeichnis für normalisierte Videos
+        width: Ziel-Video-Breite
+        height: Ziel-Video-Höhe
+        fps: Frames per Second
+        loudness_cfg: Loudness-Konfiguration
+        settings: Rendering-Settings
+
+    Returns:
+        Normalisierte Segmente in derselben Reihenfolge wie raw_segments
+
+    Raises:
+        FFmpegError: Bei FFmpeg-Fehler (bereits erzeugte Segmente werden gelöscht)
+        RenderError: Bei sonstigen Fehlern
+    """
+    workers = _segment_workers(settings, len(raw_segments))
+    output_args = _segment_output_args(settings, fps)
+
+    if workers == 1:
+        prepared: list[Path] = []
+        try:
+            for i, segment in enumerate(raw_segments, 1):
+                logger.debug(f"Normalisiere Segment {i}/{len(raw_segments)}: {segment.name}")
+                prepared.append(
+                    _prepare_segment(
+                        segment,
+                        output_dir,
+                        width,
+                        height,
+                        fps,
+                        loudness_cfg,
+                        settings,
+                        output_args=output_args,
+                    )
+                )
+        except Exception:
+            _remove_temp_files(prepared)
+            raise
+        return prepared
+
+    threads = max(1, (os.cpu_count() or 1) // workers)
+    logger.debug(
+        f"Normalisiere {len(raw_segments)} Segmente parallel "
+        f"({workers} Worker, {threads} Threads je FFmpeg)"
+    )
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                _prepare_segment,
+                segment,
+                output_dir,
+                width,
+                height,
+                fps,
+                loudness_cfg,
+                settings,
+                threads=threads,
+                output_args=output_args,
+            )
+            for segment in raw_segments
+        ]
+
+    prepared = []
+    first_error: Optional[BaseException] = None
+    for future in futures:
+        try:
+            prepared.append(future.result())
+        except Exception as exc:
+            if first_error is None:
+                first_error = exc
+
+    if first_error is not None:
+        _remove_temp_files(prepared)
+        raise first_error
+    return prepared
+
+
+def _existing_files(paths: Iterable[Path]) -> set[Path]:
+    """Ermittelt vorhandene Dateien mit einem Verzeichnis-Scan pro Ordner.
+
+    Args:
+        paths: Zu prüfende Pfade
+
+    Returns:
+        Menge der Pfade, deren Datei im jeweiligen Ordner existiert
+    """
+    listings: Dict[Path, set[str]] = {}
+    existing: set[Path] = set()
+    for path in paths:
+        names = listings.get(path.parent)
+        if names is None:
+            try:
+                with os.scandir(path.parent) as entries:
+                    names = {entry.name for entry in entries}
+            except OSError:
+                names = set()
+            listings[path.parent] = names
+        if path.name in names:
+            existing.add(path)
+    return existing
+
+
+def _optional_segment(
+    path: Optional[Path], label: str, existing: set[Path]
+) -> Optional[Path]:
     """Validiert optionale Segment-Dateien (Intro, Outro, etc.).
 
     Args:
-        path_value: Pfad als String oder None
+        path: Pfad oder None
         label: Label für Logging (z.B. "Intro", "Outro")
+        existing: Vorab ermittelte vorhandene Dateien
 
     Returns:
         Path-Objekt falls existiert, sonst None
@@ -233,11 +968,10 @@ def _optional_segment(path_value: Optional[str], label: str) -> Optional[Path]:
         DEBUG: Datei vorhanden
         WARNING: Datei nicht gefunden
     """
-    if not path_value:
+    if path is None:
         return None
 
-    path = Path(path_value)
-    if path.exists():
+    if path in existing:
         logger.debug(f"{label} gefunden: {path.name}")
         return path
 
@@ -255,6 +989,9 @@ def _assemble_segments(
     2. Alle Clips (in angegebener Reihenfolge)
     3. Outro (optional)
 
+    Die Existenzprüfung läuft gesammelt über einen Scan pro Verzeichnis
+    statt einem stat-Aufruf pro Datei.
+
     Args:
         video_paths: Iterable mit Pfaden zu Video-Clips
         settings: Settings mit Keys "render_intro_path", "render_outro_path"
@@ -266,38 +1003,93 @@ def _assemble_segments(
         DEBUG: Anzahl Segmente
         WARNING: Nicht-existierende Dateien
     """
+    intro_value = settings.get("render_intro_path")
+    outro_value = settings.get("render_outro_path")
+    intro_path = Path(intro_value) if intro_value else None
+    outro_path = Path(outro_value) if outro_value else None
+    clip_paths = [Path(clip) for clip in video_paths]
+
+    existing = _existing_files(
+        [p for p in (intro_path, *clip_paths, outro_path) if p is not None]
+    )
+
     segments: list[Path] = []
 
     # Intro hinzufügen
-    intro = _optional_segment(settings.get("render_intro_path"), "Intro")
+    intro = _optional_segment(intro_path, "Intro", existing)
     if intro:
         segments.append(intro)
 
     # Clips hinzufügen
-    for clip in video_paths:
-        clip_path = Path(clip)
-        if clip_path.exists():
+    for clip_path in clip_paths:
+        if clip_path in existing:
             segments.append(clip_path)
         else:
             logger.warning(f"Clip nicht gefunden: {clip_path} – übersprungen")
 
     # Outro hinzufügen
-    outro = _optional_segment(settings.get("render_outro_path"), "Outro")
+    outro = _optional_segment(outro_path, "Outro", existing)
     if outro:
         segments.append(outro)
 
-    logger.debug(f"Assembled {len(segments)} Segmente (Intro + {len(list(video_paths))} Clips + Outro)")
+    logger.debug(f"Assembled {len(segments)} Segmente (Intro + {len(clip_paths)} Clips + Outro)")
     return segments
 
 
+def _clips_homogeneous(
+    paths: list[Path], width: int, height: int, fps: int
+) -> bool:
+    """Prüft ob alle Clips bereits dem Zielformat entsprechen.
+
+    Verglichen werden H.264/yuv420p in Zielauflösung und Ziel-fps sowie
+    identische Audio-Parameter, sodass der concat-Demuxer per Stream-Copy
+    arbeiten kann.
+
+    Args:
+        paths: Zu prüfende Clips
+        width: Ziel-Video-Breite
+        height: Ziel-Video-Höhe
+        fps: Frames per Second
+
+    Returns:
+        True wenn alle Clips ohne Re-Encode verbunden werden können
+    """
+    audio_signatures: set[Tuple[Any, ...]] = set()
+    for path in paths:
+        probe = _probe_media(path)
+        if probe is None:
+            return False
+        streams = probe.get("streams", [])
+        video = next((st for st in streams if st.get("codec_type") == "video"), None)
+        audio = next((st for st in streams if st.get("codec_type") == "audio"), None)
+        if video is None or audio is None:
+            return False
+        if (
+            video.get("codec_name") != "h264"
+            or video.get("pix_fmt") != "yuv420p"
+            or (video.get("width"), video.get("height")) != (width, height)
+        ):
+            return False
+        try:
+            if Fraction(video.get("r_frame_rate", "0/1")) != fps:
+                return False
+        except (ValueError, ZeroDivisionError):
+            return False
+        audio_signatures.add(
+            (audio.get("codec_name"), audio.get("sample_rate"), audio.get("channels"))
+        )
+    return len(audio_signatures) == 1
+
+
 def _concat_segments(segment_paths: list[Path], temp_dir: Path) -> Path:
     """Konkateniert mehrere Video-Segmente zu einem Video.
 
-    Nutzt FFmpeg concat demuxer für verlustfreien Zusammenschnitt.
+    Nutzt FFmpeg concat demuxer für verlustfreien Zusammenschnitt. Die
+    Concat-Liste wird über stdin übergeben statt als Temp-Datei.
 
     Args:
         segment_paths: Liste mit Video-Dateien
-        temp_dir: Temp-Verzeichnis für Concat-Datei
+        temp_dir: Temp-Verzeichnis für das Ergebnis
 
     Returns:
         Pfad zur konkatierten Video-Datei
@@ -307,19 +1099,17 @@ def _concat_segments(segment_paths: list[Path], temp_dir: Path) -> Path:
         RenderError: Bei sonstigen Fehlern
 
     Logs:
-        DEBUG: Concat-Datei-Details
+        DEBUG: Concat-Liste
         ERROR: FFmpeg-Fehler
     """
     try:
-        # Erstelle Concat-Datei
-        with tempfile.NamedTemporaryFile(
-            "w", delete=False, suffix=".txt"
-        ) as concat_file:
-            for clip in segment_paths:
-                concat_file.write(f"file '{clip.as_posix()}'\n")
-            concat_list_path = concat_file.name
-
-        logger.debug(f"Concat-Datei erstellt: {concat_list_path}")
+        # Absolute Pfade: relative Einträge löst FFmpeg gegen die URL "pipe:"
+        # auf statt gegen das Arbeitsverzeichnis
+        manifest = "".join(
+            "file '{}'\n".format(clip.resolve().as_posix().replace("'", "'\\''"))
+            for clip in segment_paths
+        )
+        logger.debug(f"Concat-Liste mit {len(segment_paths)} Einträgen erstellt")
 
         concatenated = temp_dir / f"concat_{uuid4().hex}.mp4"
 
@@ -328,10 +1118,12 @@ def _concat_segments(segment_paths: list[Path], temp_dir: Path) -> Path:
         )
 
         (
-            ffmpeg.input(concat_list_path, format="concat", safe=0)
+            ffmpeg.input(
+                "pipe:", format="concat", safe=0, protocol_whitelist="pipe,file"
+            )
             .output(concatenated.as_posix(), c="copy", movflags="+faststart")
             .overwrite_output()
-            .run(quiet=not DEBUG_FFMPEG)
+            .run(input=manifest.encode("utf-8"), quiet=not DEBUG_FFMPEG)
         )
 
         return concatenated
@@ -344,13 +1136,23 @@ def _concat_segments(segment_paths: list[Path], temp_dir: Path) -> Path:
         error_msg = f"Fehler bei Segment-Konkatenation: {exc}"
         logger.error(error_msg, exc_info=True)
         raise RenderError(error_msg) from exc
-    finally:
-        # Cleanup Concat-Datei
-        try:
-            os.remove(concat_list_path)
-            logger.debug(f"Concat-Datei gelöscht: {concat_list_path}")
-        except OSError as exc:
-            logger.debug(f"Konnte Concat-Datei nicht löschen: {concat_list_path} - {exc}")
+
+
+@lru_cache(maxsize=64)
+def _watermark_xy(position: str, margin: int) -> Tuple[str, str]:
+    """Liefert die Overlay-Koordinaten für Position und Rand.
+
+    Args:
+        position: Schlüssel aus WATERMARK_POSITIONS (Fallback: top-right)
+        margin: Abstand vom Rand (Pixel)
+
+    Returns:
+        Tuple (x, y) mit FFmpeg-Ausdrücken
+    """
+    x_expr, y_expr = WATERMARK_POSITIONS.get(
+        position, WATERMARK_POSITIONS["top-right"]
+    )
+    return x_expr.format(margin=margin), y_expr.format(margin=margin)
 
 
 def _apply_watermark(
@@ -364,6 +1166,7 @@ def _apply_watermark(
     - Positionierung (top-left, top-right, bottom-left, bottom-right, center)
     - Absolute Breite oder relative Breite (% von Video)
     - Opacity/Transparenz
+    - Mehrere Overlays (z. B. Logo + Bauchbinde) über "overlays"
     - Skipping wenn Datei nicht existiert
 
     Args:
@@ -375,6 +1178,7 @@ def _apply_watermark(
             - width: Absolute Breite der Watermark
             - relative_width: Relative Breite (0.0-1.0)
             - opacity: 0.0-1.0 (0=transparent, 1=opaque)
+            - overlays: Liste weiterer Configs mit denselben Keys
         width: Video-Breite (für relative_width Berechnung)
 
     Returns:
@@ -387,7 +1191,28 @@ def _apply_watermark(
     if not watermark_cfg:
         return video_stream
 
-    watermark_path = watermark_cfg.get("path")
+    layer_cfgs = [watermark_cfg, *watermark_cfg.get("overlays", ())]
+    for layer_cfg in layer_cfgs:
+        video_stream = _overlay_layer(video_stream, layer_cfg, width)
+    return video_stream
+
+
+def _overlay_layer(video_stream: Any, layer_cfg: Dict[str, Any], width: int) -> Any:
+    """Legt ein einzelnes Bild-Overlay über den Video-Stream.
+
+    Args:
+        video_stream: FFmpeg Video-Stream
+        layer_cfg: Overlay-Config (siehe _apply_watermark)
+        width: Video-Breite (für relative_width Berechnung)
+
+    Returns:
+        FFmpeg Stream mit Overlay oder unverändert ohne gültigen Pfad
+
+    Logs:
+        DEBUG: Overlay-Parameter
+        WARNING: Datei nicht gefunden
+    """
+    watermark_path = layer_cfg.get("path")
     if not watermark_path:
         return video_stream
 
@@ -399,26 +1224,30 @@ def _apply_watermark(
     logger.debug(f"Appliziere Wasserzeichen: {path.name}")
 
     # Positionierung
-    margin = int(watermark_cfg.get("margin", 40))
-    position = watermark_cfg.get("position", "top-right")
-    x_expr, y_expr = WATERMARK_POSITIONS.get(
-        position, WATERMARK_POSITIONS["top-right"]
-    )
+    margin = int(layer_cfg.get("margin", 40))
+    position = layer_cfg.get("position", "top-right")
+    x, y = _watermark_xy(position, margin)
 
     # Watermark laden und skalieren
     overlay = ffmpeg.input(path.as_posix())
-    target_width = watermark_cfg.get("width")
+    scaled_width: Optional[int] = None
+    target_width = layer_cfg.get("width")
     if isinstance(target_width, (int, float)) and target_width > 0:
         logger.debug(f"Watermark-Breite (absolut): {target_width}")
-        overlay = overlay.filter("scale", int(target_width), -1)
-    elif isinstance(watermark_cfg.get("relative_width"), (int, float)):
-        relative = watermark_cfg["relative_width"]
-        calc_width = int(width * relative)
-        logger.debug(f"Watermark-Breite (relativ): {relative} → {calc_width}px")
-        overlay = overlay.filter("scale", calc_width, -1)
+        scaled_width = int(target_width)
+        overlay = overlay.filter("scale", scaled_width, -1)
+    elif isinstance(layer_cfg.get("relative_width"), (int, float)):
+        relative = layer_cfg["relative_width"]
+        scaled_width = int(width * relative)
+        logger.debug(f"Watermark-Breite (relativ): {relative} → {scaled_width}px")
+        overlay = overlay.filter("scale", scaled_width, -1)
+
+    # Bekannte Breite: rechtsbündiges x als Konstante statt Ausdruck
+    if scaled_width is not None and x == f"W-w-{margin}":
+        x = str(width - scaled_width - margin)
 
     # Transparenz anwenden
-    opacity = watermark_cfg.get("opacity", 1.0)
+    opacity = layer_cfg.get("opacity", 1.0)
     if opacity < 1.0:
         logger.debug(f"Watermark-Opacity: {opacity}")
         overlay = overlay.filter("format", "rgba").filter(
@@ -426,22 +1255,24 @@ def _apply_watermark(
         )
 
     # Overlay anwenden
-    x = x_expr.format(margin=margin)
-    y = y_expr.format(margin=margin)
     logger.debug(f"Watermark-Position: {position} (x={x}, y={y})")
 
-    return ffmpeg.overlay(video_stream, overlay, x=x, y=y)
+    # Position ist konstant: Ausdrücke nur einmal statt pro Frame auswerten
+    return ffmpeg.overlay(video_stream, overlay, x=x, y=y, eval="init")
 
 
 def _mix_background_audio(
-    audio_stream: Any, music_cfg: Optional[Dict[str, Any]]
+    audio_stream: Any,
+    music_cfg: Optional[Dict[str, Any]],
+    video_duration: Optional[float] = None,
 ) -> Any:
     """Mischt Hintergrundmusik mit Original-Audio.
 
     Features:
-    - Audio-Looping (Musik lädt automatisch neu)
+    - Audio-Looping (nur wenn die Musik kürzer als das Video ist)
     - Volume-Kontrolle für Musik
-    - Auto-Ducking (Original-Audio wird leiser wenn Musik läuft)
+    - Ducking: statisch (Original leiser) oder dynamisch per
+      sidechaincompress (Musik weicht der Sprache)
 
     Args:
         audio_stream: FFmpeg Audio-Stream des Videos
@@ -450,6 +1281,9 @@ def _mix_background_audio(
             - volume: Lautstärke der Musik (0.0-1.0)
             - ducking: Reduktion Original-Audio (0.0-1.0)
                      z.B. 0.8 = Original wird auf 80% reduziert
+            - auto_ducking: Musik dynamisch unter Sprache absenken
+        video_duration: Optionale Videolänge in Sekunden (spart das Looping,
+            wenn die Musik lang genug ist)
 
     Returns:
         FFmpeg Audio-Stream mit Musik gemischt, oder unverändert wenn keine Config
@@ -472,11 +1306,18 @@ def _mix_background_audio(
 
     logger.debug(f"Mische Musik: {path.name}")
 
-    # Musik laden mit Looping
+    # Musik laden, Looping nur wenn sie nicht für das ganze Video reicht
+    input_args: Dict[str, Any] = {"stream_loop": -1}
+    if video_duration is not None:
+        music_duration = _media_duration(path)
+        if music_duration is not None and music_duration >= video_duration:
+            logger.debug(f"Musik ({music_duration:.1f}s) reicht ohne Looping")
+            input_args = {}
+
     volume = float(music_cfg.get("volume", 0.1))
-    music_stream = ffmpeg.input(
-        path.as_posix(), stream_loop=-1
-    ).audio.filter("volume", volume)
+    music_stream = ffmpeg.input(path.as_posix(), **input_args).audio.filter(
+        "volume", volume
+    )
 
     logger.debug(f"Musik-Lautstärke: {volume}")
 
@@ -486,6 +1327,19 @@ def _mix_background_audio(
         logger.debug(f"Audio-Ducking: Original wird auf {ducking * 100}% reduziert")
         audio_stream = audio_stream.filter("volume", ducking)
 
+    if music_cfg.get("auto_ducking"):
+        logger.debug("Dynamisches Ducking (sidechaincompress)")
+        voice = audio_stream.filter_multi_output("asplit")
+        audio_stream = voice[0]
+        music_stream = ffmpeg.filter(
+            [music_stream, voice[1]],
+            "sidechaincompress",
+            threshold=0.05,
+            ratio=8,
+            attack=5,
+            release=200,
+        )
+
     # Musik und Original-Audio mischen
     return ffmpeg.filter(
         [audio_stream, music_stream],
@@ -496,6 +1350,116 @@ def _mix_background_audio(
     )
 
 
+def _build_single_pass(
+    raw_segments: list[Path],
+    output_path: Path,
+    width: int,
+    height: int,
+    fps: int,
+    loudness_cfg: Optional[Dict[str, float]],
+    settings: Dict[str, Any],
+) -> Any:
+    """Baut den FFmpeg-Filtergraphen für das Single-Pass-Rendering.
+
+    Args:
+        raw_segments: Segmente in Ausgabereihenfolge
+        output_path: Pfad zur Output-Videodatei
+        width: Ziel-Video-Breite
+        height: Ziel-Video-Höhe
+        fps: Frames per Second
+        loudness_cfg: Loudness-Konfiguration
+        settings: Rendering-Settings
+
+    Returns:
+        Ausführbarer FFmpeg Output-Stream
+
+    Raises:
+        RenderError: Wenn für einen Clip ohne Audio die Dauer unbekannt ist
+    """
+    skip_probe = settings.get("render_skip_probe", False)
+    loudness_stage = _loudness_stage(settings)
+    decode_args = _decode_args(settings, keep_on_gpu=True)
+    concat_inputs: list[Any] = []
+    for segment in raw_segments:
+        has_audio = _has_audio_track(segment, skip_probe)
+        duration = None if has_audio else _media_duration(segment)
+        if not has_audio and duration is None:
+            raise RenderError(
+                f"Dauer von {segment.name} unbekannt – Stille-Spur nicht erzeugbar"
+            )
+
+        stream = ffmpeg.input(segment.as_posix(), **decode_args)
+        video = _normalize_video(stream.video, width, height, fps, settings).filter(
+            "setsar", 1
+        )
+        audio = _ensure_audio(stream, has_audio, duration)
+        if loudness_stage != "final":
+            audio = _loudnorm(audio, loudness_cfg)
+        # concat verlangt identische Audio-Parameter; loudnorm liefert 192 kHz
+        audio = audio.filter("aresample", 44100).filter(
+            "aformat", channel_layouts="stereo"
+        )
+        concat_inputs.extend((video, audio))
+
+    joined = ffmpeg.concat(*concat_inputs, v=1, a=1, n=len(raw_segments)).node
+    video_stream = _apply_watermark(joined[0], settings.get("render_watermark"), width)
+    music_cfg = settings.get("render_background_music")
+    total_duration: Optional[float] = None
+    if music_cfg:
+        durations = [_media_duration(segment) for segment in raw_segments]
+        if None not in durations:
+            total_duration = sum(durations)
+    audio_stream = _mix_background_audio(joined[1], music_cfg, total_duration)
+    if loudness_stage != "per_segment":
+        audio_stream = _loudnorm(audio_stream, loudness_cfg)
+
+    output_args = _output_args(settings, fps)
+    logger.debug(f"Single-Pass Output-Args: {output_args}")
+
+    return ffmpeg.output(
+        video_stream, audio_stream, output_path.as_posix(), **output_args
+    ).overwrite_output()
+
+
+def _render_single_pass(
+    raw_segments: list[Path],
+    output_path: Path,
+    width: int,
+    height: int,
+    fps: int,
+    loudness_cfg: Optional[Dict[str, float]],
+    settings: Dict[str, Any],
+) -> None:
+    """Rendert alle Segmente in einem einzigen FFmpeg-Filtergraphen.
+
+    Normalisierung, concat-Filter, Wasserzeichen, Musik und Loudness laufen
+    in einem Prozess; jedes Bild wird genau einmal encodiert und es entstehen
+    keine Zwischendateien.
+
+    Args:
+        raw_segments: Segmente in Ausgabereihenfolge
+        output_path: Pfad zur Output-Videodatei
+        width: Ziel-Video-Breite
+        height: Ziel-Video-Höhe
+        fps: Frames per Second
+        loudness_cfg: Loudness-Konfiguration
+        settings: Rendering-Settings
+
+    Raises:
+        FFmpegError: Bei FFmpeg-Fehler
+        RenderError: Wenn für einen Clip ohne Audio die Dauer unbekannt ist
+    """
+    stream = _build_single_pass(
+        raw_segments, output_path, width, height, fps, loudness_cfg, settings
+    )
+    try:
+        stream.run(quiet=not DEBUG_FFMPEG)
+    except ffmpeg.Error as exc:
+        error_msg = f"FFmpeg-Fehler beim Single-Pass-Rendering: {exc}"
+        logger.error(error_msg, exc_info=True)
+        raise FFmpegError(error_msg) from exc
+
+
 def render_videos(
     video_paths: Iterable[str],
     output_path: str,
@@ -513,6 +1477,10 @@ def render_videos(
     4. Template-Effekte (Watermark, Musik)
     5. Finale Encoding
 
+    Standardmäßig laufen die Schritte 2-5 in einem einzigen FFmpeg-Aufruf
+    (``render_single_pass``); sonst wird jedes Segment zunächst als
+    Zwischendatei normalisiert und danach per concat-Demuxer verbunden.
+
     Args:
         video_paths: Iterable mit Pfaden zu Input-Videos
         output_path: Pfad zur Output-Videodatei
@@ -520,7 +1488,8 @@ def render_videos(
         fps: Frames per Second (Standard: 30)
         settings: Rendering-Settings Dictionary mit Keys:
             - render_vertical: Override für vertical parameter
-            - render_preset: FFmpeg Encoding Preset (fast/medium/slow)
+            - render_preset: FFmpeg Encoding Preset (Standard: veryfast)
+            - render_x264_params: Zusätzliche libx264-Parameter (z.B. "rc-lookahead=20")
             - render_video_bitrate: Video Bitrate (z.B. "6000k")
             - render_audio_bitrate: Audio Bitrate (z.B. "192k")
             - render_padding_color: Padding-Farbe (z.B. "black")
@@ -529,6 +1498,19 @@ def render_videos(
             - render_watermark: Watermark-Konfiguration
             - render_background_music: Musik-Konfiguration
             - render_loudness: Loudness-Normalisierung
+            - render_loudness_stage: "per_segment", "final" (Standard) oder "both"
+            - render_loudness_measure: Phase 4 misst vorab und normalisiert linear
+              (Standard: True)
+            - render_single_pass: Ein Filtergraph statt Zwischendateien (Standard: True)
+            - render_skip_probe: Audiospur ohne ffprobe voraussetzen (Standard: False)
+            - render_hwaccel: "auto", "none", "h264_nvenc", "hevc_nvenc" oder "h264_qsv"
+            - render_nvenc_preset: NVENC-Preset (p1-p7), sonst aus render_preset
+            - render_gpu_filters: Clips mit NVENC auf der GPU skalieren (scale_cuda)
+            - render_threads: FFmpeg-Threads je Encode (Standard: 0 = automatisch)
+            - render_copy_homogeneous: Passende Clips per Stream-Copy verbinden
+              (Standard: True)
+            - render_parallel_segments: Anzahl parallel normalisierter Segmente
+              (Standard: CPU-Kerne / FFMPEG_THREADS_PER_SEGMENT)
             - temp_folder: Temp-Verzeichnis
 
     Returns:
@@ -570,40 +1552,82 @@ def render_videos(
 
         logger.info(f"Phase 1 abgeschlossen: {len(raw_segments)} Segmente assembliert")
 
-        # Phase 2: Segment-Normalisierung
-        logger.debug("Phase 2: Segment-Normalisierung")
-        temp_dir = Path(settings.get("temp_folder", "./temp"))
-        prepared_segments: list[Path] = []
-        concatenated: Optional[Path] = None
-
-        for i, segment in enumerate(raw_segments, 1):
-            logger.debug(f"Normalisiere Segment {i}/{len(raw_segments)}: {segment.name}")
-            prepared = _prepare_segment(
-                segment,
-                temp_dir,
+        # Alle Segmente vorab parallel proben statt einzeln im Render-Pfad
+        skip_probe = settings.get("render_skip_probe", False)
+        if not skip_probe:
+            _probe_all(raw_segments)
+
+        # Bereits passende Clips (Auflösung, fps, Codecs) werden nur kopiert;
+        # ohne ffprobe lässt sich das nicht feststellen, dann wird neu kodiert
+        homogeneous = (
+            settings.get("render_copy_homogeneous", True)
+            and not skip_probe
+            and _loudness_stage(settings) == "final"
+            and _clips_homogeneous(raw_segments, target_width, target_height, fps)
+        )
+        if homogeneous:
+            logger.info("Clips bereits normalisiert – Stream-Copy statt Re-Encode")
+
+        if settings.get("render_single_pass", True) and not homogeneous:
+            # Phasen 2-4 in einem Filtergraphen
+            logger.debug("Phase 2-4: Single-Pass-Rendering")
+            _render_single_pass(
+                raw_segments,
+                resolved_output,
                 target_width,
                 target_height,
                 fps,
                 loudness_cfg,
                 settings,
             )
-            prepared_segments.append(prepared)
+            logger.info(f"Rendering erfolgreich abgeschlossen: {resolved_output}")
+            return resolved_output.as_posix()
 
-        logger.info(f"Phase 2 abgeschlossen: {len(prepared_segments)} Segmente normalisiert")
+        # Phase 2-4 im eigenen Temp-Verzeichnis; Zwischendateien werden beim
+        # Verlassen gesammelt entfernt (auch bei Fehlern)
+        temp_root = Path(settings.get("temp_folder", "./temp"))
+        temp_root.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory(prefix="render_", dir=temp_root) as work_dir:
+            temp_dir = Path(work_dir)
+
+            # Phase 2: Segment-Normalisierung
+            if homogeneous:
+                prepared_segments = raw_segments
+                logger.debug("Phase 2 übersprungen: Clips bereits normalisiert")
+            else:
+                logger.debug("Phase 2: Segment-Normalisierung")
+                prepared_segments = _prepare_segments(
+                    raw_segments,
+                    temp_dir,
+                    target_width,
+                    target_height,
+                    fps,
+                    loudness_cfg,
+                    settings,
+                )
+                logger.info(
+                    f"Phase 2 abgeschlossen: {len(prepared_segments)} Segmente normalisiert"
+                )
 
-        try:
             # Phase 3: Konkatenation
             logger.debug("Phase 3: Segment-Konkatenation")
             concatenated = _concat_segments(prepared_segments, temp_dir)
             logger.info(f"Phase 3 abgeschlossen: Segmente konkateniert")
 
+            if not homogeneous and not _needs_final_pass(settings):
+                # Segmente sind bereits final encodiert – kein zweiter Encode nötig
+                shutil.move(concatenated.as_posix(), resolved_output.as_posix())
+                logger.info("Phase 4 übersprungen: keine Template-Effekte konfiguriert")
+                logger.info(f"Rendering erfolgreich abgeschlossen: {resolved_output}")
+                return resolved_output.as_posix()
+
             # Phase 4: Template-Effekte und Finale Encoding
             logger.debug("Phase 4: Template-Effekte und Encoding")
             logger.info(f"Appliziere Template-Effekte und schreibe {resolved_output}")
 
-            final_stream = ffmpeg.input(concatenated.as_posix())
+            final_stream = ffmpeg.input(concatenated.as_posix(), **_decode_args(settings))
             video_stream = final_stream.video
-            audio_stream = _ensure_audio(final_stream, True)
+            audio_stream = final_stream.audio  # Segmente tragen immer Audio (Phase 2)
 
             # Watermark anwenden
             video_stream = _apply_watermark(
@@ -611,23 +1635,32 @@ def render_videos(
             )
 
             # Musik mischen
+            music_cfg = settings.get("render_background_music")
             audio_stream = _mix_background_audio(
-                audio_stream, settings.get("render_background_music")
+                audio_stream,
+                music_cfg,
+                _media_duration(concatenated) if music_cfg else None,
             )
 
-            # Final Loudness Normalisierung
-            audio_stream = _loudnorm(audio_stream, loudness_cfg)
-
-            # Output-Parameter
-            output_args: Dict[str, Any] = {
-                "preset": settings.get("render_preset", "medium"),
-                "movflags": "+faststart",
-                "pix_fmt": "yuv420p",
-                "r": fps,
-                "ac": 2,
-                "b:v": settings.get("render_video_bitrate", "6000k"),
-                "b:a": settings.get("render_audio_bitrate", "192k"),
-            }
+            # Final Loudness Normalisierung (gemessen → linearer Durchgang)
+            if _loudness_stage(settings) != "per_segment":
+                final_loudness = loudness_cfg
+                if settings.get("render_loudness_measure", True):
+                    measured = _measure_loudness(audio_stream, loudness_cfg)
+                    if measured:
+                        final_loudness = {**(loudness_cfg or {}), **measured}
+                audio_stream = _loudnorm(audio_stream, final_loudness)
+
+            # Output-Parameter; ohne Watermark bleibt das kopierte Video unangetastet
+            if homogeneous and not settings.get("render_watermark"):
+                output_args: Dict[str, Any] = {
+                    "movflags": "+faststart",
+                    "vcodec": "copy",
+                    "ac": 2,
+                    "b:a": settings.get("render_audio_bitrate", "192k"),
+                }
+            else:
+                output_args = _output_args(settings, fps)
 
             logger.debug(f"Final Output-Args: {output_args}")
 
@@ -644,23 +1677,6 @@ def render_videos(
 
             return resolved_output.as_posix()
 
-        finally:
-            # Cleanup temporäre Dateien
-            logger.debug("Cleanup temporärer Dateien")
-            for path in prepared_segments:
-                try:
-                    path.unlink(missing_ok=True)
-                except OSError as exc:
-                    logger.debug(f"Konnte temporäre Datei nicht löschen: {path} - {exc}")
-
-            if concatenated is not None:
-                try:
-                    concatenated.unlink(missing_ok=True)
-                except OSError as exc:
-                    logger.debug(
-                        f"Konnte Concatenated-Datei nicht löschen: {concatenated} - {exc}"
-                    )
-
     except (RenderError, FFmpegError):
         raise
     except ValueError:
@@ -668,4 +1684,100 @@ def render_videos(
     except Exception as exc:
         error_msg = f"Unerwarteter Fehler beim Video-Rendering: {exc}"
         logger.error(error_msg, exc_info=True)
-        raise RenderError(error_msg) from exc
\ No newline at end of file
+        raise RenderError(error_msg) from exc
+
+
+async def render_videos_async(
+    video_paths: Iterable[str],
+    output_path: str,
+    *,
+    vertical: bool = True,
+    fps: int = 30,
+    settings: Optional[Dict[str, Any]] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> str:
+    """Asynchrone Variante von render_videos.
+
+    Der Single-Pass-Encode läuft über asyncio.create_subprocess_exec, sodass
+    eine Event-Loop mehrere Compilations parallel rendern kann. Mit
+    ``render_single_pass: false`` wird render_videos in einem Thread
+    ausgeführt.
+
+    Args:
+        video_paths: Iterable mit Pfaden zu Input-Videos
+        output_path: Pfad zur Output-Videodatei
+        vertical: True für 9:16 (Mobile), False für 16:9 (Desktop)
+        fps: Frames per Second (Standard: 30)
+        settings: Rendering-Settings (siehe render_videos)
+        semaphore: Optionale Semaphore zur Begrenzung paralleler Renderings
+
+    Returns:
+        Pfad zur Output-Videodatei
+
+    Raises:
+        FFmpegError: Bei FFmpeg-Fehler
+        RenderError: Bei kritischen Rendering-Fehlern
+        ValueError: Wenn keine gültigen Videos zum Rendern
+
+    Logs:
+        INFO: Rendering-Status
+        ERROR: FFmpeg-Fehler
+    """
+    settings = settings or {}
+    limit = semaphore or contextlib.nullcontext()
+
+    if not settings.get("render_single_pass", True):
+        async with limit:
+            return await asyncio.to_thread(
+                render_videos,
+                list(video_paths),
+                output_path,
+                vertical=vertical,
+                fps=fps,
+                settings=settings,
+            )
+
+    resolved_output = Path(output_path)
+    resolved_output.parent.mkdir(parents=True, exist_ok=True)
+    target_width, target_height = VERTICAL_FORMAT if vertical else HORIZONTAL_FORMAT
+
+    raw_segments = _assemble_segments(video_paths, settings)
+    if not raw_segments:
+        raise ValueError(
+            "Keine gültigen Videos zum Rendern übergeben "
+            "(Clips nicht gefunden oder leer)"
+        )
+
+    # Graph-Aufbau probt die Clips (ffprobe) – nicht in der Event-Loop blockieren
+    stream = await asyncio.to_thread(
+        _build_single_pass,
+        raw_segments,
+        resolved_output,
+        target_width,
+        target_height,
+        fps,
+        settings.get("render_loudness", {}),
+        settings,
+    )
+    argv = ffmpeg.compile(stream)
+
+    async with limit:
+        logger.info(f"Starte asynchrones Rendering: {resolved_output}")
+        process = await asyncio.create_subprocess_exec(
+            *argv,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=None if DEBUG_FFMPEG else asyncio.subprocess.PIPE,
+        )
+        _, stderr = await process.communicate()
+
+    if process.returncode != 0:
+        details = (stderr or b"").decode("utf-8", errors="replace")[-2000:]
+        error_msg = (
+            f"FFmpeg-Fehler beim asynchronen Rendering "
+            f"(Exit-Code {process.returncode}): {details}"
+        )
+        logger.error(error_msg)
+        raise FFmpegError(error_msg)
+
+    logger.info(f"Rendering erfolgreich abgeschlossen: {resolved_output}")
+    return resolved_output.as_posix()
@@ -1,5 +1,6 @@
 """Basis-Scraper-Abstraktion für alle Scraper-Implementierungen."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any
 
@@ -40,3 +41,25 @@ class ScraperBase(ABC):
         """
         pass
 
+    async def authenticate_async(self) -> None:
+        """Asynchrone Variante von authenticate().
+        
+        Default: führt authenticate() in einem Worker-Thread aus, damit der
+        Event-Loop nicht blockiert. Scraper mit nativem async-I/O
+        überschreiben diese Methode direkt.
+        """
+        await asyncio.to_thread(self.authenticate)
+
+    async def scrape_async(self, target_dir: str) -> list[str]:
+        """Asynchrone Variante von scrape().
+        
+        Default: führt scrape() in einem Worker-Thread aus. Neue Scraper
+        sollten hier direkt mit async-I/O implementieren.
+        
+        Args:
+            target_dir: Zielverzeichnis für heruntergeladene Dateien
+            
+        Returns:
+            Liste mit lokalen Dateipfaden der gescrapten Medien
+        """
+        return await asyncio.to_thread(self.scrape, target_dir)
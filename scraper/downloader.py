@@ -3,19 +3,27 @@
 from __future__ import annotations
 
 import logging
+import os
+import shutil
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Iterable, Mapping, Optional
 from uuid import uuid4
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
-CHUNK_SIZE: int = 2 ** 20  # 1 MB
+CHUNK_SIZE: int = 8 * 2 ** 20  # 8 MB
 MAX_RETRIES: int = 3
-RETRY_DELAY: int = 5  # Sekunden
+RETRY_DELAY: int = 5  # Sekunden (Backoff-Faktor)
+RETRY_STATUS_CODES: tuple[int, ...] = (408, 429, 500, 502, 503, 504)
 TIMEOUT: int = 60  # Sekunden für Download-Timeout
+DOWNLOAD_MAX_WORKERS: int = 8  # Parallele Downloads in bulk_download
 
 
 class DownloadError(Exception):
@@ -24,16 +32,108 @@ class DownloadError(Exception):
     pass
 
 
-def download_media(url: str, target_dir: str, max_retries: int = MAX_RETRIES) -> str:
+def _create_session(
+    pool_size: int, max_retries: int = MAX_RETRIES
+) -> requests.Session:
+    """Erstellt eine Session mit Connection-Pool für parallele Downloads.
+
+    Transiente Fehler (Verbindungsabbrüche, Timeouts, 408/429/5xx) werden
+    im Adapter mit exponentiellem Backoff wiederholt; Retry-After wird
+    dabei berücksichtigt.
+
+    Args:
+        pool_size: Maximale Anzahl offener Verbindungen pro Host
+        max_retries: Maximale Anzahl Versuche pro Request
+
+    Returns:
+        Konfigurierte requests.Session
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=max(0, max_retries - 1),
+        backoff_factor=RETRY_DELAY,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _preallocate(fd: int, headers: Mapping[str, str]) -> None:
+    """Reserviert Speicherplatz für den Download, falls die Größe bekannt ist.
+
+    Nur bei unkomprimierter Übertragung entspricht Content-Length der
+    Dateigröße; sonst wird nichts reserviert.
+
+    Args:
+        fd: Dateideskriptor der Zieldatei
+        headers: Response-Header
+    """
+    if not hasattr(os, "posix_fallocate") or headers.get("Content-Encoding"):
+        return
+    try:
+        length = int(headers.get("Content-Length") or 0)
+        if length > 0:
+            os.posix_fallocate(fd, 0, length)
+    except (ValueError, OSError) as exc:
+        logger.debug(f"Preallocation übersprungen: {exc}")
+
+
+def _copy_body(response: requests.Response, file) -> None:
+    """Kopiert den Rohstream der Antwort in file.
+
+    Anders als iter_content übersetzt response.raw urllib3-Fehler nicht;
+    das geschieht hier, damit Abbrüche beim Lesen als Timeout bzw.
+    Netzwerkfehler behandelt werden.
+
+    Args:
+        response: Gestreamte Antwort
+        file: Geöffnete Zieldatei (binär)
+
+    Raises:
+        requests.exceptions.ReadTimeout: Bei Lese-Timeout
+        requests.exceptions.ConnectionError: Bei abgebrochener Verbindung
+    """
+    try:
+        shutil.copyfileobj(response.raw, file, length=CHUNK_SIZE)
+    except ReadTimeoutError as exc:
+        raise requests.exceptions.ReadTimeout(exc) from exc
+    except ProtocolError as exc:
+        raise requests.exceptions.ConnectionError(exc) from exc
+
+
+def _attempts_suffix(reading: bool, attempt: int) -> str:
+    """Zusatz für Fehlermeldungen mit der Zahl selbst gezählter Versuche.
+
+    Nur Abbrüche beim Lesen werden hier gezählt; Wiederholungen des Adapters
+    (bei übergebener Session ggf. anders konfiguriert) bleiben unerwähnt.
+    """
+    return f" beim Lesen nach {attempt} Versuchen" if reading else ""
+
+
+def download_media(
+    url: str,
+    target_dir: str,
+    max_retries: int = MAX_RETRIES,
+    session: Optional[requests.Session] = None,
+) -> str:
     """Lädt eine Mediendatei herunter mit Retry-Mechanismus.
 
-    Implementiert exponentielles Backoff und differenziert zwischen
-    transienten und permanenten Fehlern.
+    Verbindungsfehler und transiente HTTP-Status wiederholt der Retry-Adapter
+    der Session (siehe _create_session). Bricht der Download erst beim Lesen
+    des Bodys ab, wird er hier mit exponentiellem Backoff neu gestartet.
+    Permanente Fehler brechen sofort ab.
 
     Args:
         url: Download-URL
         target_dir: Zielverzeichnis für die Datei
-        max_retries: Maximale Anzahl Wiederholungen bei transienten Fehlern
+        max_retries: Maximale Anzahl Versuche (Adapter nur ohne eigene Session)
+        session: Optionale Session zur Wiederverwendung von Verbindungen
 
     Returns:
         Pfad zur heruntergeladenen Datei
@@ -42,121 +142,110 @@ def download_media(url: str, target_dir: str, max_retries: int = MAX_RETRIES) ->
         DownloadError: Bei permanenten oder wiederholten transienten Fehlern
 
     Logs:
-        DEBUG: Download-Anfang und Chunk-Verarbeitung
+        DEBUG: Download-Anfang
         INFO: Erfolgreiche Downloads
-        WARNING: Transiente Fehler mit Retry-Versuch
-        ERROR: Permanente Fehler
+        WARNING: Abbrüche beim Lesen mit Retry-Versuch
+        ERROR: Fehlgeschlagene Downloads
     """
     Path(target_dir).mkdir(parents=True, exist_ok=True)
     file_name = f"{uuid4().hex}.mp4"
     target_path = Path(target_dir) / file_name
+    # Schreiben in .part, erst nach vollständigem Download umbenennen
+    part_path = target_path.with_suffix(".mp4.part")
 
     logger.debug(f"Starte Download: {url} → {target_path}")
 
-    for attempt in range(1, max_retries + 1):
-        try:
-            with requests.get(
-                url, stream=True, timeout=TIMEOUT
-            ) as response:
-                response.raise_for_status()
-
-                file_size = 0
-                with target_path.open("wb") as file:
-                    for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
-                        if chunk:
-                            file.write(chunk)
-                            file_size += len(chunk)
-
-                logger.info(
-                    f"Download erfolgreich: {url} ({file_size / (1024*1024):.1f} MB) "
-                    f"→ {target_path.name}"
+    own_session = session is None
+    http = _create_session(1, max_retries) if own_session else session
+    attempts = max(1, max_retries)
+    try:
+        for attempt in range(1, attempts + 1):
+            reading = False
+            try:
+                with http.get(url, stream=True, timeout=TIMEOUT) as response:
+                    response.raise_for_status()
+                    reading = True
+
+                    # Rohstream direkt kopieren (gzip etc. wird dabei dekodiert)
+                    response.raw.decode_content = True
+                    # Puffer in Chunk-Größe statt 8 KiB Default
+                    with part_path.open("wb", buffering=CHUNK_SIZE) as file:
+                        _preallocate(file.fileno(), response.headers)
+                        _copy_body(response, file)
+                        # Reservierung über tatsächliche Länge hinaus verwerfen
+                        file.truncate()
+                    file_size = part_path.stat().st_size
+                    os.replace(part_path, target_path)
+
+                    logger.info(
+                        f"Download erfolgreich: {url} "
+                        f"({file_size / (1024*1024):.1f} MB) → {target_path.name}"
+                    )
+                    return target_path.as_posix()
+
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as exc:
+                # Fehler vor dem Body hat der Adapter bereits wiederholt
+                if not reading or attempt == attempts:
+                    raise
+                wait_time = RETRY_DELAY * (2 ** (attempt - 1))
+                logger.warning(
+                    f"Download von {url} beim Lesen abgebrochen ({exc}). "
+                    f"Retry nach {wait_time}s (Versuch {attempt}/{attempts})"
                 )
-                return target_path.as_posix()
-
-        except requests.exceptions.Timeout as exc:
-            is_last = attempt == max_retries
-            if is_last:
-                error_msg = f"Download-Timeout nach {max_retries} Versuchen: {url}"
-                logger.error(error_msg)
-                raise DownloadError(error_msg) from exc
-
-            wait_time = RETRY_DELAY * (2 ** (attempt - 1))
-            logger.warning(
-                f"Download-Timeout für {url}. Retry nach {wait_time}s "
-                f"(Versuch {attempt}/{max_retries})"
-            )
-            time.sleep(wait_time)
-
-        except requests.exceptions.ConnectionError as exc:
-            is_last = attempt == max_retries
-            if is_last:
-                error_msg = f"Netzwerkfehler nach {max_retries} Versuchen: {url}"
-                logger.error(error_msg)
-                raise DownloadError(error_msg) from exc
-
-            wait_time = RETRY_DELAY * (2 ** (attempt - 1))
-            logger.warning(
-                f"Netzwerkfehler für {url}. Retry nach {wait_time}s "
-                f"(Versuch {attempt}/{max_retries})"
-            )
-            time.sleep(wait_time)
-
-        except requests.exceptions.HTTPError as exc:
-            status_code = exc.response.status_code
-
-            # Permanente Fehler (4xx außer 408)
-            if status_code < 500 and status_code != 408:
-                error_msg = f"Permanenter HTTP-Fehler {status_code}: {url}"
-                logger.error(error_msg)
-                # Datei löschen wenn teilweise heruntergeladen
-                if target_path.exists():
-                    target_path.unlink()
-                raise DownloadError(error_msg) from exc
-
-            # Transiente Fehler (5xx, 408)
-            is_last = attempt == max_retries
-            if is_last:
-                error_msg = (
-                    f"HTTP-Fehler {status_code} nach {max_retries} Versuchen: {url}"
-                )
-                logger.error(error_msg)
-                if target_path.exists():
-                    target_path.unlink()
-                raise DownloadError(error_msg) from exc
-
-            wait_time = RETRY_DELAY * (2 ** (attempt - 1))
-            logger.warning(
-                f"HTTP-Fehler {status_code} für {url}. Retry nach {wait_time}s "
-                f"(Versuch {attempt}/{max_retries})"
-            )
-            if target_path.exists():
-                target_path.unlink()
-            time.sleep(wait_time)
-
-        except Exception as exc:
-            error_msg = f"Unerwarteter Download-Fehler: {url} - {exc}"
-            logger.error(error_msg, exc_info=True)
-            if target_path.exists():
-                target_path.unlink()
-            raise DownloadError(error_msg) from exc
-
-    # Sollte nicht erreicht werden, aber für Sicherheit
-    raise DownloadError(f"Download fehlgeschlagen nach {max_retries} Versuchen: {url}")
+                time.sleep(wait_time)
+
+    except requests.exceptions.Timeout as exc:
+        error_msg = f"Download-Timeout{_attempts_suffix(reading, attempt)}: {url}"
+        logger.error(error_msg)
+        raise DownloadError(error_msg) from exc
+
+    except requests.exceptions.ConnectionError as exc:
+        error_msg = f"Netzwerkfehler{_attempts_suffix(reading, attempt)}: {url}"
+        logger.error(error_msg)
+        raise DownloadError(error_msg) from exc
+
+    except requests.exceptions.HTTPError as exc:
+        status_code = exc.response.status_code
+        if status_code in RETRY_STATUS_CODES:
+            error_msg = f"HTTP-Fehler {status_code}: {url}"
+        else:
+            error_msg = f"Permanenter HTTP-Fehler {status_code}: {url}"
+        logger.error(error_msg)
+        raise DownloadError(error_msg) from exc
+
+    except Exception as exc:
+        error_msg = f"Unerwarteter Download-Fehler: {url} - {exc}"
+        logger.error(error_msg, exc_info=True)
+        raise DownloadError(error_msg) from exc
+
+    finally:
+        # Teil-Download nie als fertige Datei zurücklassen
+        part_path.unlink(missing_ok=True)
+        if own_session:
+            http.close()
 
 
 def bulk_download(
-    urls: Iterable[str], target_dir: str, skip_on_error: bool = True
+    urls: Iterable[str],
+    target_dir: str,
+    skip_on_error: bool = True,
+    max_workers: int = DOWNLOAD_MAX_WORKERS,
 ) -> list[str]:
-    """Lädt mehrere URLs herunter mit Fehlerbehandlung.
+    """Lädt mehrere URLs parallel herunter mit Fehlerbehandlung.
+
+    Alle Downloads teilen sich eine Session, sodass TCP/TLS-Verbindungen
+    pro Host wiederverwendet werden.
 
     Args:
         urls: Iterable mit Download-URLs
         target_dir: Zielverzeichnis für alle Dateien
         skip_on_error: Bei True: Fehler überspringen und weitermachen
                       Bei False: Beim ersten Fehler abbrechen
+        max_workers: Maximale Anzahl gleichzeitiger Downloads
 
     Returns:
         Liste mit lokalen Pfaden erfolgreich heruntergeladener Dateien
+        (in der Reihenfolge der URLs)
 
     Raises:
         DownloadError: Bei skip_on_error=False und Download-Fehler
@@ -165,18 +254,28 @@ def bulk_download(
         INFO: Anzahl gelöster/fehlgeschlagener Downloads
         WARNING: Download-Fehler (wenn skip_on_error=True)
     """
+    url_list = list(urls)
     paths: list[str] = []
     failed_urls: list[tuple[str, str]] = []
-
-    for url in urls:
-        try:
-            path = download_media(url, target_dir)
-            paths.append(path)
-        except DownloadError as exc:
-            if not skip_on_error:
-                raise
-            logger.warning(f"Download übersprungen: {url} ({exc})")
-            failed_urls.append((url, str(exc)))
+    workers = max(1, min(max_workers, len(url_list)))
+
+    with _create_session(workers) as session, ThreadPoolExecutor(
+        max_workers=workers
+    ) as executor:
+        futures = [
+            executor.submit(download_media, url, target_dir, session=session)
+            for url in url_list
+        ]
+        for url, future in zip(url_list, futures):
+            try:
+                paths.append(future.result())
+            except DownloadError as exc:
+                if not skip_on_error:
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+                logger.warning(f"Download übersprungen: {url} ({exc})")
+                failed_urls.append((url, str(exc)))
 
     logger.info(
         f"Bulk-Download abgeschlossen: {len(paths)} erfolgreich, "
@@ -187,4 +286,3 @@ def bulk_download(
         logger.debug(f"Fehlgeschlagene Downloads: {failed_urls}")
 
     return paths
-
@@ -6,19 +6,165 @@ automatischem Fallback auf alternative Video-Quellen.
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
+import json
 import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Any, Iterable, Optional, Sequence
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import InvalidHeader
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ist optional
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstandard ist optional
+    zstandard = None
 
 from .base import ScraperBase
-from .downloader import bulk_download
+from .downloader import DOWNLOAD_MAX_WORKERS, bulk_download
 
 logger = logging.getLogger(__name__)
 
 # Reddit API Headers
 USER_AGENT = "Mozilla/5.0 SocialVideoAutoPublisher/1.0"
 REDDIT_API_BASE = "https://www.reddit.com"
+TOP_URL_TEMPLATE = REDDIT_API_BASE + "/r/{sub}/top.json?limit={limit}&t=day&raw_json=1"
+FETCH_MAX_WORKERS = 8  # Parallele Subreddit-Requests
+REQUEST_TIMEOUT: float = 30.0  # Sekunden pro API-Request
+FETCH_TIMEOUT: float = 60.0  # Gesamtbudget für Phase 1 (URL-Sammlung)
+API_MAX_RETRIES = 3  # Wiederholungen nach dem ersten Request
+RETRY_STATUS_CODES: tuple[int, ...] = (429, 500, 502, 503, 504)
+RETRY_BACKOFF_MAX: float = 30.0  # Sekunden (ohne Retry-After)
+CACHE_DIR = Path.home() / ".cache" / "projektxx" / "reddit"
+MEMORY_CACHE_SIZE = 64  # Max. geparste Listings im Prozess-Cache
+# Direkt übernommene Link-Endungen (Downloads werden als .mp4 gespeichert,
+# daher vorerst nur MP4; weitere Container hier ergänzen)
+VIDEO_EXTENSIONS: tuple[str, ...] = (".mp4",)
+# Post-Felder mit reddit_video-Daten in Prioritätsreihenfolge
+FALLBACK_MEDIA_KEYS: tuple[str, ...] = ("secure_media", "media", "preview")
+
+
+def _create_api_session() -> requests.Session:
+    """Erstellt eine Session für die Reddit-API.
+
+    Verbindungen (DNS, TCP, TLS) werden über alle Subreddit-Requests hinweg
+    wiederverwendet. Der Adapter wiederholt nichts selbst; transiente Fehler
+    wiederholt RedditScraper._get, damit Wartezeiten die Deadline einhalten.
+
+    Returns:
+        Konfigurierte requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=FETCH_MAX_WORKERS,
+        pool_maxsize=FETCH_MAX_WORKERS,
+    )
+    session.mount("https://", adapter)
+    session.headers.update({"User-Agent": USER_AGENT})
+    return session
+
+
+def _retry_wait(attempt: int, response: Optional[requests.Response]) -> float:
+    """Liefert die Wartezeit vor einer Wiederholung.
+
+    Retry-After der Antwort hat Vorrang; sonst exponentielles Backoff
+    mit Jitter (max. RETRY_BACKOFF_MAX).
+
+    Args:
+        attempt: Nummer der Wiederholung (ab 1)
+        response: Fehlerantwort oder None bei Verbindungsfehlern
+
+    Returns:
+        Wartezeit in Sekunden
+    """
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after:
+        with contextlib.suppress(InvalidHeader):
+            return Retry().parse_retry_after(retry_after)
+    return min(RETRY_BACKOFF_MAX, 2 ** (attempt - 1) + random.random() * 0.5)
+
+
+def _read_cache(path: Path) -> Optional[bytes]:
+    """Liest einen Cache-Eintrag (zstd-komprimiert, falls verfügbar).
+
+    Args:
+        path: Pfad zur Cache-Datei
+
+    Returns:
+        Gecachter Inhalt oder None wenn nicht lesbar
+    """
+    try:
+        content = path.read_bytes()
+        if zstandard is not None:
+            content = zstandard.ZstdDecompressor().decompress(content)
+        return content
+    except (OSError, ValueError) as exc:
+        logger.debug(f"Cache-Eintrag nicht lesbar: {path.name} ({exc})")
+        return None
+
+
+def _write_cache(path: Path, content: bytes, etag: Optional[str]) -> None:
+    """Schreibt einen Cache-Eintrag atomar, optional mit ETag.
+
+    Args:
+        path: Pfad zur Cache-Datei
+        content: Antwort-Body
+        etag: ETag-Header der Antwort (für bedingte Requests)
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if zstandard is not None:
+            content = zstandard.ZstdCompressor().compress(content)
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, path)
+        etag_path = path.with_name(f"{path.name}.etag")
+        if etag:
+            etag_path.write_text(etag, encoding="utf-8")
+        else:
+            etag_path.unlink(missing_ok=True)
+    except OSError as exc:
+        logger.debug(f"Cache-Eintrag nicht geschrieben: {path.name} ({exc})")
+
+
+def _request_timeout(deadline: Optional[float]) -> float:
+    """Liefert das Request-Timeout unter Berücksichtigung einer Deadline.
+
+    Args:
+        deadline: Absolute Deadline (time.monotonic) oder None
+
+    Returns:
+        Timeout in Sekunden (höchstens REQUEST_TIMEOUT)
+
+    Raises:
+        requests.exceptions.Timeout: Wenn die Deadline bereits abgelaufen ist
+    """
+    if deadline is None:
+        return REQUEST_TIMEOUT
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise requests.exceptions.Timeout("Zeitbudget für Reddit-Requests erschöpft")
+    return min(REQUEST_TIMEOUT, remaining)
+
+
+def _loads(content: bytes) -> Any:
+    """Dekodiert JSON-Bytes, bevorzugt mit orjson (Fallback: json)."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
 
 
 class ScraperError(Exception):
@@ -41,16 +187,27 @@ class RedditScraper(ScraperBase):
         limit: Maximale Anzahl Videos zum Sammeln
     """
 
+    # Geparste Listings pro URL: (Ablaufzeit monotonic, Daten), prozessweit
+    _memory_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+    _memory_lock = threading.Lock()
+
     def __init__(
         self,
         subreddit: str | Sequence[str] = "memes",
         limit: int = 10,
+        cache_ttl: float = 0,
+        cache_dir: Optional[str] = None,
+        download_workers: int = DOWNLOAD_MAX_WORKERS,
     ) -> None:
         """Initialisiert Reddit-Scraper.
 
         Args:
             subreddit: Single Subreddit (str) oder Liste von Subreddits
             limit: Maximale Anzahl Videos zum Sammeln
+            cache_ttl: Gültigkeit gecachter API-Antworten in Sekunden
+                (0 = kein Cache)
+            cache_dir: Cache-Verzeichnis (Default: ~/.cache/projektxx/reddit)
+            download_workers: Maximale Anzahl gleichzeitiger Video-Downloads
 
         Raises:
             ValueError: Wenn keine Subreddits angegeben oder limit <= 0
@@ -70,11 +227,19 @@ class RedditScraper(ScraperBase):
             raise ValueError("RedditScraper: Limit muss > 0 sein.")
 
         self.limit = limit
+        self.cache_ttl = cache_ttl
+        self.cache_dir = Path(cache_dir) if cache_dir else CACHE_DIR
+        self.download_workers = max(1, download_workers)
+        self._session = _create_api_session()
         logger.debug(
             f"RedditScraper initialized: {len(self.subreddits)} subreddit(s), "
             f"limit={limit}"
         )
 
+    def close(self) -> None:
+        """Schließt die API-Session und gibt offene Verbindungen frei."""
+        self._session.close()
+
     def authenticate(self) -> None:
         """Authentifizierung durchführen.
 
@@ -83,7 +248,7 @@ class RedditScraper(ScraperBase):
         """
         logger.debug("RedditScraper: Authentifizierung nicht erforderlich (öffentliche API)")
 
-    def _fetch_urls(self) -> list[str]:
+    def _fetch_urls(self, deadline: Optional[float] = None) -> list[str]:
         """Fetcht Video-URLs aus konfigurierten Subreddits.
 
         Implementiert:
@@ -92,6 +257,10 @@ class RedditScraper(ScraperBase):
         - Fallback auf alternative Video-Quellen
         - Fehlerbehandlung mit Logging
 
+        Args:
+            deadline: Absolute Deadline (time.monotonic) für alle Requests;
+                None = nur das Timeout pro Request
+
         Returns:
             Liste mit Video-URLs (bis zu self.limit Einträge)
 
@@ -99,7 +268,6 @@ class RedditScraper(ScraperBase):
             ScraperError: Bei Netzwerk- oder Parsing-Fehlern
         """
         videos: list[str] = []
-        headers = {"User-Agent": USER_AGENT}
 
         # Berechne Limit pro Subreddit
         per_subreddit_limit = (
@@ -108,56 +276,240 @@ class RedditScraper(ScraperBase):
             else self.limit
         )
 
-        for subreddit in self.subreddits:
-            if len(videos) >= self.limit:
-                break
+        # Subreddits sind unabhängig: Requests parallel absetzen,
+        # Ergebnisse aber in Konfigurationsreihenfolge übernehmen
+        workers = min(FETCH_MAX_WORKERS, len(self.subreddits))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    self._fetch_one, subreddit, per_subreddit_limit, deadline
+                )
+                for subreddit in self.subreddits
+            ]
+            for future in futures:
+                videos.extend(future.result())
+                if len(videos) >= self.limit:
+                    for pending in futures:
+                        pending.cancel()
+                    break
+
+        logger.info(f"Reddit-Scraping abgeschlossen: {len(videos)} URLs gefunden")
+        return videos[: self.limit]
+
+    def _get(
+        self,
+        url: str,
+        deadline: Optional[float] = None,
+        headers: Optional[dict[str, str]] = None,
+    ) -> requests.Response:
+        """GET-Request mit Wiederholung bei 429/5xx und Verbindungsfehlern.
+
+        Wiederholt wird höchstens API_MAX_RETRIES-mal und nur, wenn die
+        Wartezeit (Backoff bzw. Retry-After) vor der Deadline endet;
+        sonst wird der letzte Fehler sofort zurückgegeben.
+
+        Args:
+            url: API-URL
+            deadline: Absolute Deadline (time.monotonic) oder None
+            headers: Zusätzliche Request-Header
+
+        Returns:
+            Letzte Antwort (ggf. mit Fehlerstatus)
+
+        Raises:
+            requests.exceptions.RequestException: Bei Netzwerkfehlern oder
+                abgelaufener Deadline
 
-            url = (
-                f"{REDDIT_API_BASE}/r/{subreddit}/top.json"
-                f"?limit={per_subreddit_limit}&t=day&raw_json=1"
+        Logs:
+            DEBUG: Wiederholungen mit Wartezeit
+        """
+        attempt = 0
+        while True:
+            timeout = _request_timeout(deadline)
+            error: Optional[requests.exceptions.RequestException] = None
+            response: Optional[requests.Response] = None
+            try:
+                response = self._session.get(url, headers=headers, timeout=timeout)
+            except (
+                requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout,
+            ) as exc:
+                error = exc
+            else:
+                if response.status_code not in RETRY_STATUS_CODES:
+                    return response
+
+            attempt += 1
+            wait = _retry_wait(attempt, response)
+            if attempt > API_MAX_RETRIES or (
+                deadline is not None and time.monotonic() + wait >= deadline
+            ):
+                if error is not None:
+                    raise error
+                return response
+            logger.debug(
+                f"Retry {attempt}/{API_MAX_RETRIES} für {url} in {wait:.1f}s"
             )
+            time.sleep(wait)
+
+    def _get_listing(self, url: str, deadline: Optional[float] = None) -> bytes:
+        """Lädt eine API-Antwort, bei aktivem Cache mit TTL und ETag.
+
+        Frische Cache-Einträge werden ohne Request gelesen. Abgelaufene
+        Einträge mit ETag werden per If-None-Match revalidiert; bei 304
+        wird der Cache-Eintrag weiterverwendet.
+
+        Args:
+            url: API-URL
+            deadline: Absolute Deadline (time.monotonic) oder None
+
+        Returns:
+            Antwort-Body als Bytes
+
+        Raises:
+            requests.exceptions.RequestException: Bei Netzwerk-/HTTP-Fehlern
+
+        Logs:
+            DEBUG: Cache-Treffer und Revalidierung
+        """
+        if self.cache_ttl <= 0:
+            response = self._get(url, deadline)
+            response.raise_for_status()
+            return response.content
 
-            logger.info(f"Scrape Reddit: r/{subreddit}")
+        suffix = ".json.zst" if zstandard is not None else ".json"
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        path = self.cache_dir / f"{key}{suffix}"
+        etag_path = path.with_name(f"{path.name}.etag")
 
+        headers: dict[str, str] = {}
+        try:
+            age = time.time() - path.stat().st_mtime
+        except OSError:
+            age = None
+        if age is not None:
+            if age < self.cache_ttl:
+                cached = _read_cache(path)
+                if cached is not None:
+                    logger.debug(f"Cache-Treffer: {url}")
+                    return cached
             try:
-                response = requests.get(url, headers=headers, timeout=30)
-                response.raise_for_status()
-                data: dict[str, Any] = response.json()
-
-                for child in data.get("data", {}).get("children", []):
-                    if len(videos) >= self.limit:
-                        break
-
-                    post_data: dict[str, Any] = child.get("data", {})
-                    title = post_data.get("title", "")
-
-                    # Versuche direkten MP4-Link
-                    url_value = post_data.get("url")
-                    if isinstance(url_value, str) and url_value.endswith(".mp4"):
-                        logger.debug(f"Found direct MP4: {title}")
-                        videos.append(url_value)
-                        continue
-
-                    # Fallback auf reddit_video
-                    fallback_url = self._extract_fallback_url(post_data)
-                    if fallback_url:
-                        logger.debug(f"Found fallback URL: {title}")
-                        videos.append(fallback_url)
-                        continue
-
-            except requests.exceptions.RequestException as exc:
-                logger.warning(
-                    f"Fehler beim Scrapen von r/{subreddit}: {exc}"
-                )
-                continue
-            except (KeyError, ValueError) as exc:
-                logger.warning(
-                    f"Parsing-Fehler bei r/{subreddit}: {exc}", exc_info=True
-                )
-                continue
+                headers["If-None-Match"] = etag_path.read_text(encoding="utf-8")
+            except OSError:
+                pass
+
+        response = self._get(url, deadline, headers)
+        if response.status_code == 304:
+            cached = _read_cache(path)
+            if cached is not None:
+                logger.debug(f"Cache revalidiert (304): {url}")
+                with contextlib.suppress(OSError):
+                    os.utime(path)
+                return cached
+            response = self._get(url, deadline)
+
+        response.raise_for_status()
+        _write_cache(path, response.content, response.headers.get("ETag"))
+        return response.content
+
+    def _load_listing(
+        self, url: str, deadline: Optional[float] = None
+    ) -> dict[str, Any]:
+        """Lädt und parst ein Listing, bei aktivem Cache aus dem Prozess-Cache.
+
+        Der Prozess-Cache hält bereits geparste Dicts, sodass wiederholte
+        Scrapes innerhalb der TTL weder Request noch JSON-Parsing kosten.
 
-        logger.info(f"Reddit-Scraping abgeschlossen: {len(videos)} URLs gefunden")
-        return videos[: self.limit]
+        Args:
+            url: API-URL
+            deadline: Absolute Deadline (time.monotonic) oder None
+
+        Returns:
+            Geparste API-Antwort
+
+        Raises:
+            requests.exceptions.RequestException: Bei Netzwerk-/HTTP-Fehlern
+            ValueError: Bei ungültigem JSON
+        """
+        if self.cache_ttl <= 0:
+            return _loads(self._get_listing(url, deadline))
+
+        cls = type(self)
+        now = time.monotonic()
+        with cls._memory_lock:
+            entry = cls._memory_cache.get(url)
+        if entry is not None and entry[0] > now:
+            logger.debug(f"Prozess-Cache-Treffer: {url}")
+            return entry[1]
+
+        data: dict[str, Any] = _loads(self._get_listing(url, deadline))
+        with cls._memory_lock:
+            if len(cls._memory_cache) >= MEMORY_CACHE_SIZE:
+                for key, (expires, _) in list(cls._memory_cache.items()):
+                    if expires <= now:
+                        del cls._memory_cache[key]
+                if len(cls._memory_cache) >= MEMORY_CACHE_SIZE:
+                    cls._memory_cache.pop(next(iter(cls._memory_cache)))
+            cls._memory_cache[url] = (now + self.cache_ttl, data)
+        return data
+
+    def _fetch_one(
+        self, subreddit: str, per_limit: int, deadline: Optional[float] = None
+    ) -> list[str]:
+        """Fetcht Video-URLs aus einem einzelnen Subreddit.
+
+        Args:
+            subreddit: Name des Subreddits
+            per_limit: Maximale Anzahl URLs für dieses Subreddit
+            deadline: Absolute Deadline (time.monotonic) oder None
+
+        Returns:
+            Liste mit Video-URLs (leer bei Netzwerk- oder Parsing-Fehlern)
+
+        Logs:
+            INFO: Gescraptes Subreddit
+            WARNING: Netzwerk- und Parsing-Fehler
+            DEBUG: Gefundene URLs
+        """
+        videos: list[str] = []
+        url = TOP_URL_TEMPLATE.format(sub=subreddit, limit=per_limit)
+
+        logger.info(f"Scrape Reddit: r/{subreddit}")
+
+        try:
+            data = self._load_listing(url, deadline)
+
+            for child in data.get("data", {}).get("children", []):
+                if len(videos) >= per_limit:
+                    break
+
+                post_data: dict[str, Any] = child.get("data", {})
+                title = post_data.get("title", "")
+
+                # Versuche direkten MP4-Link
+                url_value = post_data.get("url")
+                if isinstance(url_value, str) and url_value.endswith(VIDEO_EXTENSIONS):
+                    logger.debug(f"Found direct MP4: {title}")
+                    videos.append(url_value)
+                    continue
+
+                # Fallback auf reddit_video
+                fallback_url = self._extract_fallback_url(post_data)
+                if fallback_url:
+                    logger.debug(f"Found fallback URL: {title}")
+                    videos.append(fallback_url)
+                    continue
+
+        except requests.exceptions.RequestException as exc:
+            logger.warning(
+                f"Fehler beim Scrapen von r/{subreddit}: {exc}"
+            )
+        except (KeyError, ValueError) as exc:
+            logger.warning(
+                f"Parsing-Fehler bei r/{subreddit}: {exc}", exc_info=True
+            )
+
+        return videos
 
     @staticmethod
     def _extract_fallback_url(post_data: dict[str, Any]) -> Optional[str]:
@@ -174,13 +526,8 @@ class RedditScraper(ScraperBase):
         Returns:
             URL zu fallback MP4 oder None wenn nicht vorhanden
         """
-        candidates = [
-            post_data.get("secure_media"),
-            post_data.get("media"),
-            post_data.get("preview"),
-        ]
-
-        for candidate in candidates:
+        for key in FALLBACK_MEDIA_KEYS:
+            candidate = post_data.get(key)
             if not isinstance(candidate, dict):
                 continue
 
@@ -196,7 +543,7 @@ class RedditScraper(ScraperBase):
 
         return None
 
-    def scrape(self, target_dir: str) -> list[str]:
+    def scrape(self, target_dir: str, fetch_timeout: float = FETCH_TIMEOUT) -> list[str]:
         """Scrapingprozess durchführen.
 
         Orchesriert:
@@ -206,6 +553,8 @@ class RedditScraper(ScraperBase):
 
         Args:
             target_dir: Zielverzeichnis für heruntergeladene Videos
+            fetch_timeout: Gesamtbudget in Sekunden für das URL-Fetching
+                über alle Subreddits
 
         Returns:
             Liste mit lokalen Pfaden erfolgreich heruntergeladener Videos
@@ -222,7 +571,7 @@ class RedditScraper(ScraperBase):
             logger.info(f"Starte Reddit-Scraping (limit={self.limit})")
 
             # Phase 1: URLs sammeln
-            urls = self._fetch_urls()
+            urls = self._fetch_urls(deadline=time.monotonic() + fetch_timeout)
             if not urls:
                 logger.warning("Keine Video-URLs von Reddit gefunden")
                 return []
@@ -231,7 +580,9 @@ class RedditScraper(ScraperBase):
 
             # Phase 2: Downloads durchführen
             logger.info("Phase 2: Starte Bulk-Download")
-            downloads = bulk_download(urls, target_dir)
+            downloads = bulk_download(
+                urls, target_dir, max_workers=self.download_workers
+            )
 
             logger.info(
                 f"Reddit-Scraping erfolgreich: "
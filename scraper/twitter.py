@@ -22,3 +22,12 @@ class TwitterScraper(ScraperBase):
         LOGGER.info("TwitterScraper: Scraping noch nicht implementiert.")
         raise NotImplementedError("Twitter-Scraping folgt in späterer Iteration.")
 
+    async def authenticate_async(self) -> None:
+        LOGGER.info("TwitterScraper: Authentifizierung noch nicht implementiert.")
+        raise NotImplementedError("Twitter-Auth folgt in späterer Iteration.")
+
+    async def scrape_async(self, target_dir: str) -> list[str]:
+        # Integrationspunkt für die spätere Implementierung (async-I/O statt
+        # requests im Threadpool)
+        LOGGER.info("TwitterScraper: Scraping noch nicht implementiert.")
+        raise NotImplementedError("Twitter-Scraping folgt in späterer Iteration.")
@@ -3,48 +3,72 @@
 import pytest
 import tempfile
 from pathlib import Path
-from typing import Generator, Dict, Any
+from types import MappingProxyType
+from typing import Generator, Dict, Any, Mapping
+from uuid import uuid4
 
 
-@pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
-    """Erstellt ein temporäres Verzeichnis für Tests.
+@pytest.fixture(scope="session")
+def session_temp_dir() -> Generator[Path, None, None]:
+    """Erstellt ein temporäres Basisverzeichnis für den gesamten Testlauf.
     
     Yields:
-        Path zum temporären Verzeichnis
+        Path zum temporären Basisverzeichnis
     """
     with tempfile.TemporaryDirectory() as tmpdir:
         yield Path(tmpdir)
 
 
+@pytest.fixture
+def temp_dir(session_temp_dir: Path) -> Path:
+    """Erstellt ein eigenes, leeres Verzeichnis pro Test.
+    
+    Args:
+        session_temp_dir: Basisverzeichnis des Testlaufs
+        
+    Returns:
+        Path zum temporären Verzeichnis
+    """
+    test_dir = session_temp_dir / uuid4().hex
+    test_dir.mkdir()
+    return test_dir
+
+
+# Einmal beim Import aufgebaut; sample_settings liefert je Test eine Kopie
+_SAMPLE_SETTINGS_PROTO: Mapping[str, Any] = MappingProxyType({
+    "video_folder": "./output",
+    "temp_folder": "./temp",
+    "reddit_subreddits": ["memes"],
+    "reddit_limit": 5,
+    "render_vertical": True,
+    "render_video_bitrate": "6000k",
+    "render_audio_bitrate": "192k",
+    "render_preset": "medium",
+    "render_padding_color": "black",
+    "render_intro_path": "",
+    "render_outro_path": "",
+    "output_filename_template": "final_{timestamp}.mp4",
+    "hashtags": ["memes", "compilation"],
+    "default_title": "Test Compilation",
+    "description_template": "Test Description",
+    "youtube_privacy_status": "private",
+    "youtube_category_id": "24",
+    "youtube_credentials_path": "./config/client_secret.json",
+    "youtube_token_path": "./config/token.json",
+})
+
+
 @pytest.fixture
 def sample_settings() -> Dict[str, Any]:
     """Erstellt eine Test-Settings-Konfiguration.
     
+    Flache Kopie des Prototyps: Top-Level-Keys dürfen überschrieben, die
+    enthaltenen Listen aber nicht in-place verändert werden.
+    
     Returns:
         Test-Settings Dictionary
     """
-    return {
-        "video_folder": "./output",
-        "temp_folder": "./temp",
-        "reddit_subreddits": ["memes"],
-        "reddit_limit": 5,
-        "render_vertical": True,
-        "render_video_bitrate": "6000k",
-        "render_audio_bitrate": "192k",
-        "render_preset": "medium",
-        "render_padding_color": "black",
-        "render_intro_path": "",
-        "render_outro_path": "",
-        "output_filename_template": "final_{timestamp}.mp4",
-        "hashtags": ["memes", "compilation"],
-        "default_title": "Test Compilation",
-        "description_template": "Test Description",
-        "youtube_privacy_status": "private",
-        "youtube_category_id": "24",
-        "youtube_credentials_path": "./config/client_secret.json",
-        "youtube_token_path": "./config/token.json",
-    }
+    return dict(_SAMPLE_SETTINGS_PROTO)
 
 
 @pytest.fixture
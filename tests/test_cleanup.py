@@ -0,0 +1,64 @@
+"""Unit-Tests für automation/cleanup.py"""
+
+from pathlib import Path
+
+from automation.cleanup import cleanup, cleanup_many
+
+
+class TestCleanup:
+    """Tests für cleanup Funktion."""
+
+    def test_cleanup_deletes_matching_files(self, temp_dir: Path) -> None:
+        """Test dass passende Endungen und temp-Präfixe gelöscht werden."""
+        (temp_dir / "clip.tmp").write_text("x")
+        (temp_dir / "temp_render.bin").write_text("x")
+        (temp_dir / "keep.mp4").write_text("x")
+
+        cleanup(str(temp_dir))
+
+        assert sorted(p.name for p in temp_dir.iterdir()) == ["keep.mp4"]
+
+    def test_cleanup_preserves_files(self, temp_dir: Path) -> None:
+        """Test dass preserve_files nicht gelöscht werden."""
+        (temp_dir / "final.mp4").write_text("x")
+        (temp_dir / "old.mp4").write_text("x")
+
+        cleanup(str(temp_dir), delete_extensions={".mp4"}, preserve_files={"final.mp4"})
+
+        assert sorted(p.name for p in temp_dir.iterdir()) == ["final.mp4"]
+
+    def test_cleanup_skips_directories(self, temp_dir: Path) -> None:
+        """Test dass Unterverzeichnisse nicht angefasst werden."""
+        (temp_dir / "temp_dir").mkdir()
+
+        cleanup(str(temp_dir))
+
+        assert (temp_dir / "temp_dir").is_dir()
+
+    def test_cleanup_missing_folder(self, temp_dir: Path) -> None:
+        """Test dass ein fehlendes Verzeichnis ignoriert wird."""
+        cleanup(str(temp_dir / "missing"))
+
+
+class TestCleanupMany:
+    """Tests für cleanup_many Funktion."""
+
+    def test_cleanup_many_handles_all_folders(self, temp_dir: Path) -> None:
+        """Test dass alle Verzeichnisse mit eigenen Optionen bereinigt werden."""
+        temp_folder = temp_dir / "temp"
+        video_folder = temp_dir / "output"
+        temp_folder.mkdir()
+        video_folder.mkdir()
+        (temp_folder / "clip.mp4").write_text("x")
+        (video_folder / "final.mp4").write_text("x")
+        (video_folder / "render.tmp").write_text("x")
+
+        cleanup_many(
+            [
+                (str(temp_folder), {"delete_extensions": {".mp4"}}),
+                (str(video_folder), {"preserve_files": {"final.mp4"}}),
+            ]
+        )
+
+        assert list(temp_folder.iterdir()) == []
+        assert [p.name for p in video_folder.iterdir()] == ["final.mp4"]
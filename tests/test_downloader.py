@@ -0,0 +1,167 @@
+"""Unit-Tests für scraper/downloader.py"""
+
+import io
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+
+from scraper.downloader import (
+    DownloadError,
+    _create_session,
+    bulk_download,
+    download_media,
+)
+
+
+class TestBulkDownload:
+    """Tests für bulk_download Funktion."""
+
+    def test_bulk_download_keeps_url_order(self, temp_dir: Path) -> None:
+        """Test dass parallele Downloads in URL-Reihenfolge zurückkommen."""
+        urls = [f"https://v.redd.it/{i}" for i in range(5)]
+
+        def fake_download(url: str, target_dir: str, **kwargs: Any) -> str:
+            assert kwargs["session"] is not None
+            return f"{target_dir}/{url.rsplit('/', 1)[1]}.mp4"
+
+        with patch("scraper.downloader.download_media", side_effect=fake_download):
+            paths = bulk_download(urls, str(temp_dir), max_workers=3)
+
+        assert paths == [f"{temp_dir}/{i}.mp4" for i in range(5)]
+
+    def test_bulk_download_skips_failures(self, temp_dir: Path) -> None:
+        """Test dass fehlgeschlagene Downloads übersprungen werden."""
+
+        def fake_download(url: str, target_dir: str, **kwargs: Any) -> str:
+            if url.endswith("bad"):
+                raise DownloadError("kaputt")
+            return f"{target_dir}/ok.mp4"
+
+        with patch("scraper.downloader.download_media", side_effect=fake_download):
+            paths = bulk_download(["https://a/bad", "https://a/good"], str(temp_dir))
+
+        assert paths == [f"{temp_dir}/ok.mp4"]
+
+    def test_bulk_download_raises_without_skip(self, temp_dir: Path) -> None:
+        """Test dass skip_on_error=False den ersten Fehler weiterreicht."""
+        with patch("scraper.downloader.download_media", side_effect=DownloadError("kaputt")):
+            with pytest.raises(DownloadError):
+                bulk_download(["https://a/bad"], str(temp_dir), skip_on_error=False)
+
+
+class TestCreateSession:
+    """Tests für _create_session Funktion."""
+
+    def test_create_session_retries_transient_errors(self) -> None:
+        """Test dass Wiederholungen im Adapter statt per Schleife laufen."""
+        with _create_session(4, max_retries=3) as session:
+            retry = session.get_adapter("https://v.redd.it/x").max_retries
+
+        assert retry.total == 2
+        assert 503 in retry.status_forcelist
+        assert 404 not in retry.status_forcelist
+
+
+class TestDownloadMedia:
+    """Tests für download_media Funktion."""
+
+    def test_download_media_writes_raw_stream(self, temp_dir: Path) -> None:
+        """Test dass der Antwort-Stream vollständig in die Datei geschrieben wird."""
+        response = MagicMock()
+        response.raw = io.BytesIO(b"video-bytes")
+        response.__enter__.return_value = response
+        session = MagicMock()
+        session.get.return_value = response
+
+        path = download_media("https://v.redd.it/x", str(temp_dir), session=session)
+
+        assert Path(path).read_bytes() == b"video-bytes"
+        session.get.assert_called_once()
+
+    def test_download_media_preallocates_content_length(self, temp_dir: Path) -> None:
+        """Test dass eine zu große Content-Length keine Füllbytes hinterlässt."""
+        response = MagicMock()
+        response.raw = io.BytesIO(b"video-bytes")
+        response.headers = {"Content-Length": "64"}
+        response.__enter__.return_value = response
+        session = MagicMock()
+        session.get.return_value = response
+
+        path = download_media("https://v.redd.it/x", str(temp_dir), session=session)
+
+        assert Path(path).read_bytes() == b"video-bytes"
+
+    def test_download_media_removes_partial_file(self, temp_dir: Path) -> None:
+        """Test dass abgebrochene Downloads keine Dateien hinterlassen."""
+        response = MagicMock()
+        response.raw.read.side_effect = OSError("Verbindung abgebrochen")
+        response.__enter__.return_value = response
+        session = MagicMock()
+        session.get.return_value = response
+
+        with pytest.raises(DownloadError):
+            download_media("https://v.redd.it/x", str(temp_dir), session=session)
+
+        assert not list(temp_dir.iterdir())
+
+    @pytest.mark.parametrize(
+        ("error", "message"),
+        [
+            (ReadTimeoutError(None, "https://v.redd.it/x", "read timed out"), "Timeout"),
+            (ProtocolError("Connection broken"), "Netzwerkfehler"),
+        ],
+    )
+    def test_download_media_maps_body_read_errors(
+        self, error: Exception, message: str, temp_dir: Path
+    ) -> None:
+        """Test dass urllib3-Fehler beim Lesen als Timeout/Netzwerkfehler gemeldet werden."""
+        response = MagicMock()
+        response.raw.read.side_effect = error
+        response.__enter__.return_value = response
+        session = MagicMock()
+        session.get.return_value = response
+
+        with patch("scraper.downloader.time.sleep"), pytest.raises(
+            DownloadError, match=f"{message} beim Lesen nach 3 Versuchen"
+        ):
+            download_media("https://v.redd.it/x", str(temp_dir), session=session)
+        assert session.get.call_count == 3
+
+    @patch("scraper.downloader.time.sleep")
+    def test_download_media_retries_interrupted_body(
+        self, mock_sleep: MagicMock, temp_dir: Path
+    ) -> None:
+        """Test dass ein Abbruch beim Lesen den Download neu startet."""
+        broken = MagicMock()
+        broken.raw.read.side_effect = ProtocolError("Connection broken")
+        broken.__enter__.return_value = broken
+        complete = MagicMock()
+        complete.raw = io.BytesIO(b"video-bytes")
+        complete.__enter__.return_value = complete
+        session = MagicMock()
+        session.get.side_effect = [broken, complete]
+
+        path = download_media("https://v.redd.it/x", str(temp_dir), session=session)
+
+        assert Path(path).read_bytes() == b"video-bytes"
+        assert [p.name for p in temp_dir.iterdir()] == [Path(path).name]
+        mock_sleep.assert_called_once()
+
+    @patch("scraper.downloader.time.sleep")
+    def test_download_media_leaves_connect_errors_to_adapter(
+        self, mock_sleep: MagicMock, temp_dir: Path
+    ) -> None:
+        """Test dass Verbindungsfehler vor dem Body nicht erneut wiederholt werden."""
+        session = MagicMock()
+        session.get.side_effect = requests.exceptions.ConnectionError("refused")
+
+        with pytest.raises(DownloadError) as exc_info:
+            download_media("https://v.redd.it/x", str(temp_dir), session=session)
+
+        assert "Versuchen" not in str(exc_info.value)
+        session.get.assert_called_once()
+        mock_sleep.assert_not_called()
@@ -0,0 +1,102 @@
+"""Unit-Tests für ui/flask_app.py"""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Generator
+from unittest.mock import patch
+
+import pytest
+
+from ui import flask_app, json_provider, settings_manager
+
+
+@pytest.fixture
+def settings_file(temp_dir: Path, monkeypatch: pytest.MonkeyPatch) -> Generator[Path, None, None]:
+    """Leitet SETTINGS_PATH auf eine temporäre Datei um."""
+    path = temp_dir / "settings.json"
+    path.write_text(json.dumps({"reddit_limit": 3}), encoding="utf-8")
+    monkeypatch.setattr(settings_manager, "SETTINGS_PATH", path)
+    settings_manager.invalidate_settings_cache()
+    yield path
+    settings_manager.invalidate_settings_cache()
+
+
+# Minimaler orjson-Ersatz auf Basis von json (gleiche Schnittstelle)
+FAKE_ORJSON = SimpleNamespace(
+    OPT_NON_STR_KEYS=0,
+    dumps=lambda obj, default=None, option=0: json.dumps(obj, default=default).encode(),
+    loads=json.loads,
+)
+
+
+class TestJsonProvider:
+    """Tests für den orjson-JSON-Provider."""
+
+    def test_create_app_uses_orjson_when_available(self, settings_file: Path) -> None:
+        """Test dass mit orjson der OrjsonProvider für Encode und Decode genutzt wird."""
+        with patch.object(json_provider, "orjson", FAKE_ORJSON):
+            app = flask_app.create_app()
+            client = app.test_client()
+
+            assert isinstance(app.json, json_provider.OrjsonProvider)
+            assert client.get("/settings").get_json() == {"reddit_limit": 3}
+            response = client.post("/settings", data=b'{"reddit_limit": 4}')
+
+        assert response.get_json() == {"status": "ok"}
+        assert json.loads(settings_file.read_text(encoding="utf-8")) == {"reddit_limit": 4}
+
+    def test_create_app_falls_back_to_default_provider(self) -> None:
+        """Test dass ohne orjson der Standard-Provider von Flask bleibt."""
+        with patch.object(json_provider, "orjson", None):
+            app = flask_app.create_app()
+
+        assert not isinstance(app.json, json_provider.OrjsonProvider)
+
+
+class TestSettingsRoutes:
+    """Tests für die /settings-Routen."""
+
+    def test_get_settings_parses_file_once(self, settings_file: Path) -> None:
+        """Test dass unveränderte Settings nicht pro Request neu geparst werden."""
+        client = flask_app.create_app().test_client()
+
+        with patch.object(
+            settings_manager, "load_settings", wraps=settings_manager.load_settings
+        ) as mock_load:
+            client.get("/settings")
+            client.get("/settings")
+
+        mock_load.assert_called_once()
+
+    def test_post_settings_visible_on_next_get(self, settings_file: Path) -> None:
+        """Test dass gespeicherte Settings sofort ausgeliefert werden."""
+        client = flask_app.create_app().test_client()
+        client.get("/settings")
+
+        client.post("/settings", json={"reddit_limit": 8})
+
+        assert client.get("/settings").get_json() == {"reddit_limit": 8}
+
+    def test_post_settings_rate_limited(self, settings_file: Path) -> None:
+        """Test dass zu viele Schreibzugriffe mit 429 und Retry-After abgewiesen werden."""
+        client = flask_app.create_app().test_client()
+
+        for _ in range(flask_app.SETTINGS_POST_LIMIT):
+            assert client.post("/settings", json={"reddit_limit": 1}).status_code == 200
+        response = client.post("/settings", json={"reddit_limit": 2})
+
+        assert response.status_code == 429
+        assert response.get_json()["code"] == "agent.rate_limited"
+        assert 0 < int(response.headers["Retry-After"]) <= 60
+        assert json.loads(settings_file.read_text(encoding="utf-8")) == {"reddit_limit": 1}
+
+    def test_post_settings_rejects_invalid_types(self, settings_file: Path) -> None:
+        """Test dass ungültige Settings vor dem Schreiben abgewiesen werden."""
+        client = flask_app.create_app().test_client()
+
+        response = client.post("/settings", json={"reddit_limit": "viele"})
+
+        assert response.status_code == 400
+        assert response.get_json()["details"][0].startswith("reddit_limit")
+        assert json.loads(settings_file.read_text(encoding="utf-8")) == {"reddit_limit": 3}
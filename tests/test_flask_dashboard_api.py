@@ -0,0 +1,235 @@
+"""Unit-Tests für ui/flask_dashboard_api.py"""
+
+import io
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict
+
+import pytest
+from flask.testing import FlaskClient
+
+try:
+    import flask_cors  # noqa: F401
+except ImportError:
+    # CORS-Header sind für die Routen-Tests ohne Bedeutung
+    sys.modules["flask_cors"] = SimpleNamespace(CORS=lambda *args, **kwargs: None)
+
+from ui import flask_dashboard_api
+
+
+@pytest.fixture
+def upload_dir(temp_dir: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Leitet UPLOAD_DIR auf ein temporäres Verzeichnis um."""
+    path = temp_dir / "uploads"
+    monkeypatch.setattr(flask_dashboard_api, "UPLOAD_DIR", path)
+    return path
+
+
+@pytest.fixture
+def client(upload_dir: Path, temp_dir: Path) -> FlaskClient:
+    """Test-Client mit registrierten Dashboard-Routen."""
+    app = flask_dashboard_api.create_app(str(temp_dir / "missing.json"))
+    flask_dashboard_api.create_dashboard_routes(app, None, {})
+    return app.test_client()
+
+
+def _upload(client: FlaskClient, name: str, content: bytes, **fields: str) -> Any:
+    """Sendet eine Multipart-Upload-Anfrage."""
+    data: Dict[str, Any] = {"file": (io.BytesIO(content), name), **fields}
+    return client.post("/api/upload", data=data, content_type="multipart/form-data")
+
+
+class TestMultipartUpload:
+    """Tests für POST /api/upload."""
+
+    def test_upload_streams_file_and_fields(self, client: FlaskClient, upload_dir: Path) -> None:
+        """Test dass Datei und Formularfelder übernommen werden."""
+        response = _upload(
+            client, "clip one.mp4", b"video-bytes",
+            title="Titel", platforms='["youtube", "tiktok"]',
+        )
+
+        assert response.status_code == 201
+        job = response.get_json()
+        assert job["filename"] == "clip_one.mp4"
+        assert job["size"] == len(b"video-bytes")
+        assert job["title"] == "Titel"
+        assert job["platforms"] == ["youtube", "tiktok"]
+        assert [p.name for p in upload_dir.iterdir()] == ["clip_one.mp4"]
+        assert (upload_dir / "clip_one.mp4").read_bytes() == b"video-bytes"
+
+    def test_upload_empty_file(self, client: FlaskClient, upload_dir: Path) -> None:
+        """Test dass eine leere Datei als Job mit Größe 0 angelegt wird."""
+        response = _upload(client, "empty.mp4", b"")
+
+        assert response.status_code == 201
+        assert response.get_json()["size"] == 0
+        assert [p.name for p in upload_dir.iterdir()] == ["empty.mp4"]
+
+    def test_upload_without_file_part(self, client: FlaskClient, upload_dir: Path) -> None:
+        """Test dass ein Body ohne 'file'-Teil abgelehnt wird."""
+        response = client.post(
+            "/api/upload", data={"title": "x"}, content_type="multipart/form-data"
+        )
+
+        assert response.status_code == 400
+        assert response.get_json()["error"] == "No file provided"
+        assert not list(upload_dir.iterdir())
+
+    def test_upload_truncated_body(self, client: FlaskClient, upload_dir: Path) -> None:
+        """Test dass ein abgeschnittener Body 400 liefert und Dateien queued Jobs erhält."""
+        assert _upload(client, "a.mp4", b"original").status_code == 201
+
+        body = (
+            b"--frontier\r\n"
+            b'Content-Disposition: form-data; name="file"; filename="a.mp4"\r\n'
+            b"Content-Type: video/mp4\r\n\r\n"
+            b"abgeschnit"
+        )
+        response = client.post(
+            "/api/upload", data=body,
+            content_type="multipart/form-data; boundary=frontier",
+        )
+
+        assert response.status_code == 400
+        assert [p.name for p in upload_dir.iterdir()] == ["a.mp4"]
+        assert (upload_dir / "a.mp4").read_bytes() == b"original"
+
+
+class TestUploadDeduplication:
+    """Tests für Duplikat- und Namenskonflikte beim Einreihen."""
+
+    def test_duplicate_upload_reuses_job(self, client: FlaskClient, upload_dir: Path) -> None:
+        """Test dass identischer Inhalt den bestehenden Job liefert."""
+        first = _upload(client, "a.mp4", b"inhalt-x")
+        second = _upload(client, "kopie.mp4", b"inhalt-x")
+
+        assert first.status_code == 201
+        assert second.status_code == 200
+        assert second.get_json()["id"] == first.get_json()["id"]
+        assert [p.name for p in upload_dir.iterdir()] == ["a.mp4"]
+
+    def test_duplicate_keeps_file_of_other_job(
+        self, client: FlaskClient, upload_dir: Path
+    ) -> None:
+        """Test dass ein Duplikat unter fremdem Dateinamen keine Job-Datei löscht."""
+        job_a = _upload(client, "a.mp4", b"inhalt-x").get_json()
+        job_b = _upload(client, "b.mp4", b"inhalt-y").get_json()
+
+        response = _upload(client, "b.mp4", b"inhalt-x")
+
+        assert response.status_code == 200
+        assert response.get_json()["id"] == job_a["id"]
+        assert (upload_dir / "a.mp4").read_bytes() == b"inhalt-x"
+        assert (upload_dir / "b.mp4").read_bytes() == b"inhalt-y"
+        assert client.get(f"/api/upload/{job_b['id']}").get_json()["status"] == "queued"
+
+    def test_name_used_by_live_job_is_refused(
+        self, client: FlaskClient, upload_dir: Path
+    ) -> None:
+        """Test dass ein belegter Dateiname mit 409 abgelehnt wird."""
+        job = _upload(client, "a.mp4", b"inhalt-x").get_json()
+
+        response = _upload(client, "a.mp4", b"inhalt-y")
+
+        assert response.status_code == 409
+        assert response.get_json()["jobId"] == job["id"]
+        assert [p.name for p in upload_dir.iterdir()] == ["a.mp4"]
+        assert (upload_dir / "a.mp4").read_bytes() == b"inhalt-x"
+
+    def test_cancelled_job_releases_name(self, client: FlaskClient, upload_dir: Path) -> None:
+        """Test dass nach dem Abbrechen derselbe Name wieder angenommen wird."""
+        job = _upload(client, "a.mp4", b"inhalt-x").get_json()
+        client.delete(f"/api/upload/{job['id']}")
+
+        response = _upload(client, "a.mp4", b"inhalt-y")
+
+        assert response.status_code == 201
+        assert (upload_dir / "a.mp4").read_bytes() == b"inhalt-y"
+
+
+class TestRawUpload:
+    """Tests für POST /api/upload/raw."""
+
+    def test_raw_upload_streams_body(self, client: FlaskClient, upload_dir: Path) -> None:
+        """Test dass der Body als Datei gespeichert und eingereiht wird."""
+        response = client.post(
+            "/api/upload/raw?filename=roh.mp4&title=Roh&platforms=%5B%22tiktok%22%5D",
+            data=b"roh-bytes",
+        )
+
+        assert response.status_code == 201
+        job = response.get_json()
+        assert (job["filename"], job["size"], job["title"]) == ("roh.mp4", 9, "Roh")
+        assert job["platforms"] == ["tiktok"]
+        assert [p.name for p in upload_dir.iterdir()] == ["roh.mp4"]
+
+    def test_raw_upload_requires_filename(self, client: FlaskClient, upload_dir: Path) -> None:
+        """Test dass ohne Dateinamen nichts gespeichert wird."""
+        response = client.post("/api/upload/raw", data=b"roh-bytes")
+
+        assert response.status_code == 400
+        assert not upload_dir.exists() or not list(upload_dir.iterdir())
+
+    def test_raw_duplicate_removes_only_temp_file(
+        self, client: FlaskClient, upload_dir: Path
+    ) -> None:
+        """Test dass ein Raw-Duplikat nur die eigene Temp-Datei entfernt."""
+        first = client.post("/api/upload/raw?filename=a.mp4", data=b"inhalt-x")
+        second = client.post("/api/upload/raw?filename=b.mp4", data=b"inhalt-x")
+
+        assert second.status_code == 200
+        assert second.get_json()["id"] == first.get_json()["id"]
+        assert [p.name for p in upload_dir.iterdir()] == ["a.mp4"]
+
+
+class TestQueuePaging:
+    """Tests für GET /api/queue mit offset/limit."""
+
+    def test_queue_returns_requested_slice(self, client: FlaskClient, upload_dir: Path) -> None:
+        """Test dass nur der angefragte Ausschnitt geliefert wird, total aber alle zählt."""
+        ids = [
+            client.post(f"/api/upload/raw?filename={i}.mp4", data=f"inhalt-{i}".encode())
+            .get_json()["id"]
+            for i in range(3)
+        ]
+
+        page = client.get("/api/queue?offset=1&limit=1").get_json()
+
+        assert (page["count"], page["total"]) == (1, 3)
+        assert [job["id"] for job in page["jobs"]] == ids[1:2]
+
+    def test_queue_defaults_to_whole_queue(self, client: FlaskClient, upload_dir: Path) -> None:
+        """Test dass ohne Parameter die ganze Queue geliefert wird."""
+        for i in range(2):
+            client.post(f"/api/upload/raw?filename={i}.mp4", data=f"inhalt-{i}".encode())
+
+        page = client.get("/api/queue").get_json()
+
+        assert (page["count"], page["total"]) == (2, 2)
+
+
+class TestPlatformsEtag:
+    """Tests für ETag/304 auf GET /api/platforms."""
+
+    def test_matching_etag_returns_304(self, client: FlaskClient) -> None:
+        """Test dass ein passendes If-None-Match mit 304 ohne Body beantwortet wird."""
+        first = client.get("/api/platforms")
+        etag = first.headers["ETag"]
+
+        second = client.get("/api/platforms", headers={"If-None-Match": etag})
+
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert second.data == b""
+
+    def test_disconnect_invalidates_etag(self, client: FlaskClient) -> None:
+        """Test dass eine Statusänderung ein neues ETag und 200 liefert."""
+        etag = client.get("/api/platforms").headers["ETag"]
+
+        client.post("/api/platforms/youtube/disconnect")
+        response = client.get("/api/platforms", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
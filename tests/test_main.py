@@ -40,6 +40,7 @@ class TestCollectClips:
         assert "clip1.mp4" in clips
         mock_scraper.authenticate.assert_called_once()
         mock_scraper.scrape.assert_called_once()
+        mock_scraper.close.assert_called_once()
 
     @patch("main.RedditScraper")
     def test_collect_clips_scraper_error(
@@ -82,7 +83,7 @@ class TestRunOnce:
 
     @patch("main._collect_clips")
     @patch("main.render_videos")
-    @patch("main.cleanup")
+    @patch("main.cleanup_many")
     def test_run_once_success(
         self,
         mock_cleanup: Mock,
@@ -165,57 +166,88 @@ class TestRunOnce:
         output_video = str(temp_dir / "output" / "final.mp4")
         mock_render.return_value = output_video
 
-        with patch("main.cleanup"):
+        with patch("main.cleanup_many"):
             # Ausführung
             run_once(sample_settings, platforms=["youtube"])
 
             # Upload-Funktion sollte nur für youtube aufgerufen werden
             # (wird durch platforms Parameter gefiltert)
 
+    @patch("main._collect_clips")
+    @patch("main.render_videos")
+    @patch("main.cleanup_many")
+    def test_run_once_uploads_all_platforms(
+        self,
+        mock_cleanup: Mock,
+        mock_render: Mock,
+        mock_collect: Mock,
+        sample_settings: Dict[str, Any],
+        temp_dir: Path,
+    ) -> None:
+        """Test dass ein fehlschlagender Upload die übrigen nicht blockiert."""
+        mock_collect.return_value = (
+            ["clip1.mp4"],
+            temp_dir / "temp",
+            temp_dir / "output",
+        )
+        output_video = str(temp_dir / "output" / "final.mp4")
+        mock_render.return_value = output_video
+        youtube = Mock()
+        tiktok = Mock(side_effect=NotImplementedError("stub"))
 
-class TestParseArgs:
-    """Tests für _parse_args Funktion."""
+        with patch.dict("main.UPLOAD_FUNCTIONS", {"youtube": youtube, "tiktok": tiktok}, clear=True):
+            result = run_once(sample_settings)
 
-    def test_parse_args_default(self) -> None:
-        """Test Default-Argumente."""
-        with patch("sys.argv", ["main.py"]):
-            args = _parse_args()
-            assert args.mode == "once"
-            assert args.platforms is None
+        assert result == output_video
+        youtube.assert_called_once_with(output_video, sample_settings)
+        tiktok.assert_called_once_with(output_video, sample_settings)
 
-    def test_parse_args_schedule_mode(self) -> None:
-        """Test Schedule-Modus."""
-        with patch("sys.argv", ["main.py", "--mode", "schedule"]):
-            args = _parse_args()
-            assert args.mode == "schedule"
-
-    def test_parse_args_multiple_platforms(self) -> None:
-        """Test mehrere Plattformen."""
-        with patch(
-            "sys.argv",
-            ["main.py", "--platform", "youtube", "--platform", "tiktok"],
-        ):
-            args = _parse_args()
-            assert args.platforms == ["youtube", "tiktok"]
 
-    def test_parse_args_log_level(self) -> None:
-        """Test Logging-Level."""
-        with patch("sys.argv", ["main.py", "--log-level", "DEBUG"]):
+class TestParseArgs:
+    """Tests für _parse_args Funktion."""
+
+    @pytest.mark.parametrize(
+        "argv,attr,expected",
+        [
+            pytest.param(["main.py"], "mode", "once", id="default-mode"),
+            pytest.param(["main.py"], "platforms", None, id="default-platforms"),
+            pytest.param(
+                ["main.py", "--mode", "schedule"], "mode", "schedule", id="schedule-mode"
+            ),
+            pytest.param(
+                ["main.py", "--platform", "youtube", "--platform", "tiktok"],
+                "platforms",
+                ["youtube", "tiktok"],
+                id="multiple-platforms",
+            ),
+            pytest.param(
+                ["main.py", "--platform", "youtube", "tiktok"],
+                "platforms",
+                ["youtube", "tiktok"],
+                id="platform-list",
+            ),
+            pytest.param(
+                ["main.py", "--log-level", "debug"],
+                "log_level",
+                "DEBUG",
+                id="log-level-case-insensitive",
+            ),
+            pytest.param(
+                ["main.py", "--log-level", "DEBUG"], "log_level", "DEBUG", id="log-level"
+            ),
+        ],
+    )
+    def test_parse_args(self, argv: list[str], attr: str, expected: Any) -> None:
+        """Test CLI-Argumente (Modus, Plattformen, Logging-Level)."""
+        with patch("sys.argv", argv):
             args = _parse_args()
-            assert args.log_level == "DEBUG"
+        assert getattr(args, attr) == expected
 
 
 class TestExceptionHierarchy:
     """Tests für Exception-Hierarchie."""
 
-    def test_scraper_error_is_pipeline_error(self) -> None:
-        """Test dass ScraperError ein PipelineError ist."""
-        assert issubclass(ScraperError, PipelineError)
-
-    def test_render_error_is_pipeline_error(self) -> None:
-        """Test dass RenderError ein PipelineError ist."""
-        assert issubclass(RenderError, PipelineError)
-
-    def test_upload_error_is_pipeline_error(self) -> None:
-        """Test dass UploadError ein PipelineError ist."""
-        assert issubclass(UploadError, PipelineError)
+    @pytest.mark.parametrize("child", [ScraperError, RenderError, UploadError])
+    def test_is_pipeline_error(self, child: type) -> None:
+        """Test dass alle Pipeline-Fehler von PipelineError erben."""
+        assert issubclass(child, PipelineError)
@@ -0,0 +1,254 @@
+"""Unit-Tests für scraper/reddit.py"""
+
+import asyncio
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from scraper.reddit import REDDIT_API_BASE, RedditScraper
+
+
+def _listing(urls: List[str]) -> Dict[str, Any]:
+    """Baut eine minimale top.json-Antwort mit direkten MP4-Links."""
+    return {"data": {"children": [{"data": {"url": url}} for url in urls]}}
+
+
+class TestFetchUrls:
+    """Tests für RedditScraper._fetch_urls."""
+
+    def test_fetch_urls_keeps_subreddit_order(self) -> None:
+        """Test dass Ergebnisse in Reihenfolge der Subreddits zusammengeführt werden."""
+        scraper = RedditScraper(["a", "b"], limit=4)
+        results = {
+            "a": ["https://x/a1.mp4", "https://x/a2.mp4"],
+            "b": ["https://x/b1.mp4", "https://x/b2.mp4"],
+        }
+
+        with patch.object(
+            RedditScraper, "_fetch_one", side_effect=lambda sub, *_: results[sub]
+        ):
+            urls = scraper._fetch_urls()
+
+        assert urls == results["a"] + results["b"]
+
+    def test_fetch_urls_truncates_to_limit(self) -> None:
+        """Test dass das Gesamtlimit eingehalten wird."""
+        scraper = RedditScraper(["a", "b", "c"], limit=2)
+
+        with patch.object(
+            RedditScraper,
+            "_fetch_one",
+            side_effect=lambda sub, *_: [f"https://x/{sub}{i}.mp4" for i in range(2)],
+        ):
+            urls = scraper._fetch_urls()
+
+        assert urls == ["https://x/a0.mp4", "https://x/a1.mp4"]
+
+    def test_fetch_one_parses_listing(self) -> None:
+        """Test dass direkte MP4-Links aus der API-Antwort übernommen werden."""
+        scraper = RedditScraper("memes", limit=5)
+
+        with patch.object(scraper._session, "get") as mock_get:
+            mock_get.return_value.content = json.dumps(
+                _listing(["https://x/1.mp4", "https://x/page.html", "https://x/2.mp4"])
+            ).encode()
+            urls = scraper._fetch_one("memes", 5)
+
+        assert urls == ["https://x/1.mp4", "https://x/2.mp4"]
+
+    def test_fetch_one_respects_deadline(self) -> None:
+        """Test dass das Request-Timeout auf die verbleibende Zeit begrenzt wird."""
+        scraper = RedditScraper("memes", limit=5)
+
+        with patch.object(scraper._session, "get") as mock_get:
+            mock_get.return_value.content = b"{}"
+            scraper._fetch_one("memes", 5, time.monotonic() + 5)
+            assert mock_get.call_args.kwargs["timeout"] <= 5
+
+            mock_get.reset_mock()
+            assert scraper._fetch_one("memes", 5, time.monotonic() - 1) == []
+            mock_get.assert_not_called()
+
+
+class TestScrape:
+    """Tests für RedditScraper.scrape."""
+
+    def test_scrape_passes_download_workers(self, temp_dir: Path) -> None:
+        """Test dass die Download-Parallelität an bulk_download geht."""
+        scraper = RedditScraper("memes", download_workers=3)
+
+        with patch.object(
+            RedditScraper, "_fetch_urls", return_value=["https://x/1.mp4"]
+        ), patch("scraper.reddit.bulk_download", return_value=["a.mp4"]) as mock_bulk:
+            assert scraper.scrape(str(temp_dir)) == ["a.mp4"]
+
+        mock_bulk.assert_called_once_with(
+            ["https://x/1.mp4"], str(temp_dir), max_workers=3
+        )
+
+    def test_scrape_async_delegates_to_scrape(self, temp_dir: Path) -> None:
+        """Test dass scrape_async ohne eigene Implementierung scrape nutzt."""
+        scraper = RedditScraper("memes")
+
+        with patch.object(RedditScraper, "scrape", return_value=["a.mp4"]) as mock_scrape:
+            assert asyncio.run(scraper.scrape_async(str(temp_dir))) == ["a.mp4"]
+
+        mock_scrape.assert_called_once_with(str(temp_dir))
+
+
+class TestExtractFallbackUrl:
+    """Tests für RedditScraper._extract_fallback_url."""
+
+    def test_prefers_secure_media(self) -> None:
+        """Test dass secure_media vor media und preview gewählt wird."""
+        post = {
+            "secure_media": {"reddit_video": {"fallback_url": "https://v/secure"}},
+            "media": {"reddit_video": {"fallback_url": "https://v/media"}},
+        }
+        assert RedditScraper._extract_fallback_url(post) == "https://v/secure"
+
+    def test_uses_preview_when_media_missing(self) -> None:
+        """Test dass reddit_video_preview als letzte Quelle genutzt wird."""
+        post = {
+            "media": None,
+            "preview": {"reddit_video_preview": {"fallback_url": "https://v/preview"}},
+        }
+        assert RedditScraper._extract_fallback_url(post) == "https://v/preview"
+
+    def test_returns_none_without_video(self) -> None:
+        """Test dass Posts ohne Video None liefern."""
+        assert RedditScraper._extract_fallback_url({"url": "https://i/x.jpg"}) is None
+
+
+class TestApiSession:
+    """Tests für Wiederholungen der Reddit-API-Requests."""
+
+    def _response(self, status: int, retry_after: str = "") -> MagicMock:
+        response = MagicMock(status_code=status, content=b"{}")
+        response.headers = {"Retry-After": retry_after} if retry_after else {}
+        if status >= 400:
+            response.raise_for_status.side_effect = requests.exceptions.HTTPError(status)
+        return response
+
+    def test_adapter_does_not_retry(self) -> None:
+        """Test dass der Adapter selbst keine (unbegrenzten) Wiederholungen macht."""
+        scraper = RedditScraper("memes")
+        retry = scraper._session.get_adapter(REDDIT_API_BASE).max_retries
+
+        assert retry.total == 0
+        scraper.close()
+
+    @patch("scraper.reddit.time.sleep")
+    def test_get_retries_transient_status(self, mock_sleep: MagicMock) -> None:
+        """Test dass 503 mit Backoff wiederholt wird."""
+        scraper = RedditScraper("memes")
+
+        with patch.object(
+            scraper._session,
+            "get",
+            side_effect=[self._response(503), self._response(200)],
+        ) as mock_get:
+            assert scraper._get(REDDIT_API_BASE).status_code == 200
+
+        assert mock_get.call_count == 2
+        assert 1 <= mock_sleep.call_args.args[0] <= 1.5
+
+    @patch("scraper.reddit.time.sleep")
+    def test_get_honours_retry_after(self, mock_sleep: MagicMock) -> None:
+        """Test dass Retry-After ohne Deadline als Wartezeit gilt."""
+        scraper = RedditScraper("memes")
+
+        with patch.object(
+            scraper._session,
+            "get",
+            side_effect=[self._response(429, "7"), self._response(200)],
+        ):
+            scraper._get(REDDIT_API_BASE)
+
+        mock_sleep.assert_called_once_with(7)
+
+    def test_retry_after_beyond_deadline_returns_in_time(self) -> None:
+        """Test dass ein 429 mit großem Retry-After die Deadline nicht überzieht."""
+        scraper = RedditScraper("memes", limit=5)
+        deadline = time.monotonic() + 2
+
+        with patch.object(
+            scraper._session, "get", return_value=self._response(429, "120")
+        ) as mock_get:
+            assert scraper._fetch_one("memes", 5, deadline) == []
+
+        assert time.monotonic() < deadline
+        mock_get.assert_called_once()
+
+
+class TestListingCache:
+    """Tests für den Disk-Cache der API-Antworten."""
+
+    URL = "https://www.reddit.com/r/memes/top.json"
+
+    def _response(self, status: int, body: bytes = b"", etag: str = "") -> MagicMock:
+        response = MagicMock(status_code=status, content=body)
+        response.headers = {"ETag": etag} if etag else {}
+        return response
+
+    def test_cache_disabled_by_default(self, temp_dir: Path) -> None:
+        """Test dass ohne cache_ttl nichts auf die Platte geschrieben wird."""
+        scraper = RedditScraper("memes", cache_dir=str(temp_dir))
+
+        with patch.object(
+            scraper._session, "get", return_value=self._response(200, b"{}")
+        ):
+            scraper._get_listing(self.URL)
+
+        assert not list(temp_dir.iterdir())
+
+    def test_fresh_entry_skips_request(self, temp_dir: Path) -> None:
+        """Test dass ein frischer Cache-Eintrag keinen Request auslöst."""
+        scraper = RedditScraper("memes", cache_ttl=300, cache_dir=str(temp_dir))
+
+        with patch.object(
+            scraper._session, "get", return_value=self._response(200, b"{}")
+        ) as mock_get:
+            assert scraper._get_listing(self.URL) == b"{}"
+            assert scraper._get_listing(self.URL) == b"{}"
+
+        mock_get.assert_called_once()
+
+    def test_expired_entry_revalidates_with_etag(self, temp_dir: Path) -> None:
+        """Test dass abgelaufene Einträge per If-None-Match revalidiert werden."""
+        scraper = RedditScraper("memes", cache_ttl=300, cache_dir=str(temp_dir))
+
+        with patch.object(
+            scraper._session, "get", return_value=self._response(200, b"{}", etag='"v1"')
+        ):
+            scraper._get_listing(self.URL)
+        for entry in temp_dir.iterdir():
+            os.utime(entry, (0, 0))
+
+        with patch.object(
+            scraper._session, "get", return_value=self._response(304)
+        ) as mock_get:
+            assert scraper._get_listing(self.URL) == b"{}"
+
+        assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+    def test_parsed_listing_shared_across_scrapers(self, temp_dir: Path) -> None:
+        """Test dass geparste Listings prozessweit wiederverwendet werden."""
+        RedditScraper._memory_cache.clear()
+        first = RedditScraper("memes", cache_ttl=300, cache_dir=str(temp_dir))
+        second = RedditScraper("memes", cache_ttl=300, cache_dir=str(temp_dir))
+        body = json.dumps(_listing(["https://x/1.mp4"])).encode()
+
+        with patch.object(first, "_get_listing", return_value=body), patch.object(
+            second, "_get_listing"
+        ) as second_get:
+            assert first._fetch_one("memes", 5) == ["https://x/1.mp4"]
+            assert second._fetch_one("memes", 5) == ["https://x/1.mp4"]
+
+        second_get.assert_not_called()
+        RedditScraper._memory_cache.clear()
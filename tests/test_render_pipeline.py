@@ -0,0 +1,654 @@
+"""Unit-Tests für render/pipeline.py"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from pathlib import Path
+from typing import Any, Dict
+
+import ffmpeg
+
+from render.pipeline import (
+    _probe_all,
+    _clips_homogeneous,
+    _measure_loudness,
+    _mix_background_audio,
+    _assemble_segments,
+    _loudnorm,
+    _prepare_segment,
+    _video_codec_args,
+    _intermediate_codec_args,
+    _apply_watermark,
+    _concat_segments,
+    _has_audio_track,
+    _probe_cached,
+    _prepare_segments,
+    _render_single_pass,
+    _segment_workers,
+    FFmpegError,
+    RenderError,
+    render_videos,
+    render_videos_async,
+)
+
+
+class TestSegmentWorkers:
+    """Tests für _segment_workers Funktion."""
+
+    def test_segment_workers_from_settings(self) -> None:
+        """Test dass render_parallel_segments übernommen wird."""
+        assert _segment_workers({"render_parallel_segments": 3}, 10) == 3
+
+    def test_segment_workers_capped_by_segment_count(self) -> None:
+        """Test dass nie mehr Worker als Segmente entstehen."""
+        assert _segment_workers({"render_parallel_segments": 8}, 2) == 2
+
+    @patch("render.pipeline.os.cpu_count", return_value=None)
+    def test_segment_workers_minimum_one(self, _mock_cpu: Any) -> None:
+        """Test dass mindestens ein Worker genutzt wird."""
+        assert _segment_workers({}, 5) == 1
+
+
+class TestPrepareSegments:
+    """Tests für _prepare_segments Funktion."""
+
+    def test_prepare_segments_keeps_order(self, temp_dir: Path) -> None:
+        """Test dass parallele Normalisierung die Reihenfolge erhält."""
+        raw = [temp_dir / f"clip{i}.mp4" for i in range(4)]
+
+        def fake_prepare(segment: Path, output_dir: Path, *args: Any, **kwargs: Any) -> Path:
+            return output_dir / f"prepared_{segment.name}"
+
+        with patch("render.pipeline._prepare_segment", side_effect=fake_prepare):
+            prepared = _prepare_segments(
+                raw, temp_dir, 1080, 1920, 30, None, {"render_parallel_segments": 2}
+            )
+
+        assert [p.name for p in prepared] == [f"prepared_clip{i}.mp4" for i in range(4)]
+
+    def test_prepare_segments_removes_outputs_on_error(self, temp_dir: Path) -> None:
+        """Test dass bei einem Fehler bereits erzeugte Segmente gelöscht werden."""
+        raw = [temp_dir / f"clip{i}.mp4" for i in range(3)]
+
+        def fake_prepare(segment: Path, output_dir: Path, *args: Any, **kwargs: Any) -> Path:
+            if segment.name == "clip1.mp4":
+                raise FFmpegError("kaputt")
+            prepared = output_dir / f"prepared_{segment.name}"
+            prepared.write_text("x")
+            return prepared
+
+        settings: Dict[str, Any] = {"render_parallel_segments": 3}
+        with patch("render.pipeline._prepare_segment", side_effect=fake_prepare):
+            with pytest.raises(FFmpegError):
+                _prepare_segments(raw, temp_dir, 1080, 1920, 30, None, settings)
+
+        assert not list(temp_dir.glob("prepared_*"))
+
+    @pytest.mark.parametrize("parallel", [1, 3])
+    def test_prepare_segments_builds_output_args_once(
+        self, parallel: int, temp_dir: Path
+    ) -> None:
+        """Test dass die Output-Parameter einmal pro Render berechnet werden."""
+        raw = [temp_dir / f"clip{i}.mp4" for i in range(3)]
+        seen: list[Any] = []
+
+        def fake_prepare(segment: Path, output_dir: Path, *args: Any, **kwargs: Any) -> Path:
+            seen.append(kwargs.get("output_args"))
+            return output_dir / segment.name
+
+        with patch("render.pipeline._prepare_segment", side_effect=fake_prepare), patch(
+            "render.pipeline._segment_output_args", return_value={"vcodec": "libx264"}
+        ) as mock_args:
+            _prepare_segments(
+                raw, temp_dir, 1080, 1920, 30, None,
+                {"render_hwaccel": "none", "render_parallel_segments": parallel},
+            )
+
+        mock_args.assert_called_once()
+        assert seen == [{"vcodec": "libx264"}] * 3
+
+
+class TestRenderSinglePass:
+    """Tests für _render_single_pass Funktion."""
+
+    def test_render_single_pass_builds_one_graph(self, temp_dir: Path) -> None:
+        """Test dass alle Segmente in einem FFmpeg-Aufruf verbunden werden."""
+        raw = [temp_dir / "clip0.mp4", temp_dir / "clip1.mp4"]
+        output = temp_dir / "final.mp4"
+        captured: Dict[str, Any] = {}
+
+        def fake_run(stream: Any, **kwargs: Any) -> None:
+            captured["args"] = ffmpeg.get_args(stream)
+
+        with patch("render.pipeline._has_audio_track", side_effect=[True, False]), \
+                patch("render.pipeline._media_duration", return_value=4.5), \
+                patch.object(ffmpeg.nodes.OutputStream, "run", fake_run):
+            _render_single_pass(raw, output, 1080, 1920, 30, None, {})
+
+        args = captured["args"]
+        graph = args[args.index("-filter_complex") + 1]
+        assert "concat=a=1:n=2:v=1" in graph
+        assert graph.count("loudnorm") == 1
+        assert graph.index("fps=30") < graph.index("scale=1080:1920")
+        assert "force_original_aspect_ratio=decrease" in graph
+        assert args[args.index("-threads") + 1] == "0"
+        assert args.count("-i") == 3
+        assert output.as_posix() in args
+
+    def test_render_single_pass_requires_duration(self, temp_dir: Path) -> None:
+        """Test dass Clips ohne Audio und ohne Dauer abgelehnt werden."""
+        with patch("render.pipeline._has_audio_track", return_value=False), \
+                patch("render.pipeline._media_duration", return_value=None):
+            with pytest.raises(RenderError):
+                _render_single_pass(
+                    [temp_dir / "clip.mp4"], temp_dir / "out.mp4", 1080, 1920, 30, None, {}
+                )
+
+
+class TestProbeCache:
+    """Tests für den ffprobe-Cache."""
+
+    def test_probe_runs_once_per_file_version(self, temp_dir: Path) -> None:
+        """Test dass unveränderte Dateien nur einmal geprobt werden."""
+        clip = temp_dir / "clip.mp4"
+        clip.write_bytes(b"x")
+        _probe_cached.cache_clear()
+        probe = {"streams": [{"codec_type": "audio"}]}
+
+        with patch("render.pipeline.ffmpeg.probe", return_value=probe) as mock_probe:
+            assert _has_audio_track(clip)
+            assert _has_audio_track(clip)
+
+        mock_probe.assert_called_once()
+
+    def test_probe_all_warms_cache(self, temp_dir: Path) -> None:
+        """Test dass _probe_all jede Datei einmal probt und den Cache füllt."""
+        clips = [temp_dir / f"clip{i}.mp4" for i in range(3)]
+        for clip in clips:
+            clip.write_bytes(b"x")
+        _probe_cached.cache_clear()
+
+        with patch("render.pipeline.ffmpeg.probe", return_value={"streams": []}) as mock_probe:
+            _probe_all(clips)
+            for clip in clips:
+                _has_audio_track(clip)
+
+        assert mock_probe.call_count == 3
+
+    def test_probe_prefers_pyav(self, temp_dir: Path) -> None:
+        """Test dass mit PyAV kein ffprobe-Prozess gestartet wird."""
+        clip = temp_dir / "clip.mp4"
+        clip.write_bytes(b"x")
+        _probe_cached.cache_clear()
+        probe = {"streams": [{"codec_type": "audio"}], "format": {}}
+
+        with patch("render.pipeline.av", MagicMock()), patch(
+            "render.pipeline._probe_pyav", return_value=probe
+        ), patch("render.pipeline.ffmpeg.probe") as mock_probe:
+            assert _has_audio_track(clip)
+
+        mock_probe.assert_not_called()
+
+    def test_probe_falls_back_to_ffprobe(self, temp_dir: Path) -> None:
+        """Test dass ffprobe genutzt wird wenn PyAV die Datei nicht öffnen kann."""
+        clip = temp_dir / "clip.mp4"
+        clip.write_bytes(b"x")
+        _probe_cached.cache_clear()
+        probe = {"streams": [{"codec_type": "audio"}]}
+
+        with patch("render.pipeline.av", MagicMock()), patch(
+            "render.pipeline._probe_pyav", return_value=None
+        ), patch("render.pipeline.ffmpeg.probe", return_value=probe) as mock_probe:
+            assert _has_audio_track(clip)
+
+        mock_probe.assert_called_once()
+
+    def test_skip_probe_assumes_audio(self, temp_dir: Path) -> None:
+        """Test dass render_skip_probe keinen ffprobe-Aufruf auslöst."""
+        with patch("render.pipeline.ffmpeg.probe") as mock_probe:
+            assert _has_audio_track(temp_dir / "clip.mp4", skip_probe=True)
+
+        mock_probe.assert_not_called()
+
+
+class TestConcatSegments:
+    """Tests für _concat_segments Funktion."""
+
+    def test_concat_segments_feeds_list_via_stdin(self, temp_dir: Path) -> None:
+        """Test dass die Concat-Liste über stdin statt als Datei übergeben wird."""
+        segments = [temp_dir / "a.mp4", temp_dir / "it's.mp4"]
+        captured: Dict[str, Any] = {}
+
+        def fake_run(stream: Any, **kwargs: Any) -> None:
+            captured["args"] = ffmpeg.get_args(stream)
+            captured["input"] = kwargs.get("input")
+
+        with patch.object(ffmpeg.nodes.OutputStream, "run", fake_run):
+            result = _concat_segments(segments, temp_dir)
+
+        assert result.parent == temp_dir
+        assert "pipe:" in captured["args"]
+        manifest = captured["input"].decode("utf-8")
+        assert f"file '{segments[0].as_posix()}'" in manifest
+        assert "it'\\''s.mp4" in manifest
+
+    def test_concat_segments_resolves_relative_paths(
+        self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test dass relative Segmentpfade (temp_folder "./temp") absolut eingetragen werden."""
+        monkeypatch.chdir(temp_dir)
+        work_dir = Path("temp") / "render_x"
+        work_dir.mkdir(parents=True)
+        captured: Dict[str, Any] = {}
+
+        def fake_run(stream: Any, **kwargs: Any) -> None:
+            captured["input"] = kwargs.get("input")
+
+        with patch.object(ffmpeg.nodes.OutputStream, "run", fake_run):
+            _concat_segments([work_dir / "a.mp4"], work_dir)
+
+        manifest = captured["input"].decode("utf-8")
+        expected = (temp_dir / "temp" / "render_x" / "a.mp4").resolve().as_posix()
+        assert manifest == f"file '{expected}'\n"
+
+
+class TestRenderVideos:
+    """Tests für render_videos Funktion."""
+
+    def test_render_videos_skips_final_pass_without_effects(self, temp_dir: Path) -> None:
+        """Test dass ohne Template-Effekte das Concat-Ergebnis direkt übernommen wird."""
+        clip = temp_dir / "clip.mp4"
+        clip.write_bytes(b"x")
+        concatenated = temp_dir / "concat.mp4"
+        concatenated.write_bytes(b"video")
+        output = temp_dir / "out" / "final.mp4"
+        settings: Dict[str, Any] = {"render_single_pass": False, "temp_folder": str(temp_dir)}
+
+        with patch("render.pipeline._prepare_segments", return_value=[]), \
+                patch("render.pipeline._concat_segments", return_value=concatenated), \
+                patch("render.pipeline.ffmpeg.output") as mock_output:
+            result = render_videos([str(clip)], str(output), settings=settings)
+
+        assert result == output.as_posix()
+        assert output.read_bytes() == b"video"
+        mock_output.assert_not_called()
+        assert not list(temp_dir.glob("render_*"))
+
+    def test_render_videos_skip_probe_skips_probe_all(self, temp_dir: Path) -> None:
+        """Test dass render_skip_probe das Vorab-Proben aller Segmente abschaltet."""
+        clip = temp_dir / "clip.mp4"
+        clip.write_bytes(b"x")
+        settings: Dict[str, Any] = {
+            "render_skip_probe": True,
+            "render_copy_homogeneous": False,
+        }
+
+        with patch("render.pipeline._probe_all") as mock_probe_all, \
+                patch("render.pipeline._render_single_pass") as mock_single_pass:
+            render_videos([str(clip)], str(temp_dir / "final.mp4"), settings=settings)
+
+        mock_probe_all.assert_not_called()
+        mock_single_pass.assert_called_once()
+
+    def test_render_videos_skip_probe_reencodes(self, temp_dir: Path) -> None:
+        """Test dass ohne ffprobe nicht auf Stream-Copy geprüft wird."""
+        clip = temp_dir / "clip.mp4"
+        clip.write_bytes(b"x")
+        settings: Dict[str, Any] = {"render_skip_probe": True}
+
+        with patch("render.pipeline._clips_homogeneous") as mock_homogeneous, \
+                patch("render.pipeline._render_single_pass") as mock_single_pass:
+            render_videos([str(clip)], str(temp_dir / "final.mp4"), settings=settings)
+
+        mock_homogeneous.assert_not_called()
+        mock_single_pass.assert_called_once()
+
+
+class TestApplyWatermark:
+    """Tests für _apply_watermark Funktion."""
+
+    def test_apply_watermark_multiple_overlays(self, temp_dir: Path) -> None:
+        """Test dass zusätzliche Overlays nacheinander eingeblendet werden."""
+        logo = temp_dir / "logo.png"
+        banner = temp_dir / "banner.png"
+        logo.write_bytes(b"x")
+        banner.write_bytes(b"x")
+        cfg = {
+            "path": str(logo),
+            "overlays": [
+                {"path": str(banner), "position": "bottom-left"},
+                {"path": str(temp_dir / "missing.png")},
+            ],
+        }
+
+        stream = _apply_watermark(ffmpeg.input("in.mp4").video, cfg, 1080)
+        args = ffmpeg.output(stream, "out.mp4").get_args()
+
+        graph = args[args.index("-filter_complex") + 1]
+        assert graph.count("overlay") == 2
+        assert args.count("-i") == 3
+        assert "eval=init" in graph
+
+    def test_apply_watermark_resolves_right_edge(self, temp_dir: Path) -> None:
+        """Test dass x bei bekannter Breite als Konstante berechnet wird."""
+        logo = temp_dir / "logo.png"
+        logo.write_bytes(b"x")
+        cfg = {"path": str(logo), "position": "top-right", "width": 200, "margin": 40}
+
+        stream = _apply_watermark(ffmpeg.input("in.mp4").video, cfg, 1080)
+        args = ffmpeg.output(stream, "out.mp4").get_args()
+
+        assert "x=840" in args[args.index("-filter_complex") + 1]
+
+
+class TestVideoCodecArgs:
+    """Tests für _video_codec_args Funktion."""
+
+    @patch("render.pipeline._available_hw_encoder", return_value="h264_nvenc")
+    def test_video_codec_args_auto_nvenc(self, _mock_hw: Any) -> None:
+        """Test dass NVENC-Presets aus x264-Presets abgeleitet werden."""
+        args = _video_codec_args({"render_preset": "slow"})
+        assert args["vcodec"] == "h264_nvenc"
+        assert args["preset"] == "p5"
+
+    @patch("render.pipeline._available_hw_encoder", return_value=None)
+    def test_video_codec_args_auto_fallback(self, _mock_hw: Any) -> None:
+        """Test dass ohne Hardware-Encoder libx264 genutzt wird."""
+        assert _video_codec_args({}) == {"vcodec": "libx264", "preset": "veryfast"}
+
+    def test_video_codec_args_x264_params(self) -> None:
+        """Test dass render_x264_params nur an libx264 gehen."""
+        settings = {"render_hwaccel": "none", "render_x264_params": "rc-lookahead=20"}
+        assert _video_codec_args(settings)["x264-params"] == "rc-lookahead=20"
+        settings["render_hwaccel"] = "h264_nvenc"
+        assert "x264-params" not in _video_codec_args(settings)
+
+    def test_video_codec_args_explicit_hevc(self) -> None:
+        """Test explizites HEVC-NVENC mit eigenem Preset."""
+        args = _video_codec_args(
+            {"render_hwaccel": "hevc_nvenc", "render_nvenc_preset": "p6"}
+        )
+        assert args["vcodec"] == "hevc_nvenc"
+        assert args["preset"] == "p6"
+        assert args["tune"] == "hq"
+
+    @patch("render.pipeline._available_hw_encoder")
+    def test_video_codec_args_none_skips_detection(self, mock_hw: Any) -> None:
+        """Test dass render_hwaccel=none keine Erkennung auslöst."""
+        assert _video_codec_args({"render_hwaccel": "none"})["vcodec"] == "libx264"
+        mock_hw.assert_not_called()
+
+    def test_video_codec_args_qsv_maps_preset(self) -> None:
+        """Test dass x264-Presets ohne QSV-Entsprechung auf veryfast abgebildet werden."""
+        args = _video_codec_args({"render_hwaccel": "h264_qsv", "render_preset": "superfast"})
+        assert args == {"vcodec": "h264_qsv", "preset": "veryfast", "pix_fmt": "nv12"}
+
+
+class TestIntermediateCodecArgs:
+    """Tests für _intermediate_codec_args Funktion."""
+
+    def test_intermediate_codec_args_libx264(self) -> None:
+        """Test dass libx264 ultrafast/CRF 18/fastdecode bekommt."""
+        args = _intermediate_codec_args({"render_hwaccel": "none"}, 30)
+        assert (args["preset"], args["crf"], args["tune"]) == ("ultrafast", 18, "fastdecode")
+
+    @patch("render.pipeline._available_hw_encoder", return_value="h264_qsv")
+    def test_intermediate_codec_args_qsv(self, _mock_hw: Any) -> None:
+        """Test dass QSV ein gültiges Preset und keine x264-Optionen bekommt."""
+        args = _intermediate_codec_args({}, 30)
+        assert args == {"vcodec": "h264_qsv", "preset": "veryfast", "pix_fmt": "nv12"}
+
+
+class TestPrepareSegment:
+    """Tests für _prepare_segment Funktion."""
+
+    def _output_args(self, temp_dir: Path, settings: Dict[str, Any]) -> list[str]:
+        captured: Dict[str, Any] = {}
+
+        def fake_run(stream: Any, **kwargs: Any) -> None:
+            captured["args"] = ffmpeg.get_args(stream)
+
+        settings = {"render_hwaccel": "none", **settings}
+        with patch.object(ffmpeg.nodes.OutputStream, "run", fake_run):
+            _prepare_segment(
+                temp_dir / "clip.mp4", temp_dir, 1080, 1920, 30, None, settings
+            )
+        return captured["args"]
+
+    def test_prepare_segment_fast_intermediate(self, temp_dir: Path) -> None:
+        """Test dass Zwischendateien vor einem finalen Encode schnell encodiert werden."""
+        args = self._output_args(temp_dir, {"render_watermark": {"path": "logo.png"}})
+        assert args[args.index("-preset") + 1] == "ultrafast"
+        assert "-crf" in args
+        assert "-b:v" not in args
+
+    def test_prepare_segment_nvenc_low_latency(self, temp_dir: Path) -> None:
+        """Test dass NVENC-Zwischendateien ohne B-Frames und Lookahead encodiert werden."""
+        args = self._output_args(
+            temp_dir,
+            {"render_hwaccel": "h264_nvenc", "render_watermark": {"path": "logo.png"}},
+        )
+        assert args[args.index("-preset") + 1] == "p1"
+        assert args[args.index("-tune") + 1] == "ll"
+        assert args[args.index("-bf") + 1] == "0"
+        assert args[args.index("-rc-lookahead") + 1] == "0"
+        assert args[args.index("-g") + 1] == "60"
+
+    def test_prepare_segment_final_quality_without_effects(self, temp_dir: Path) -> None:
+        """Test dass Segmente ohne Phase 4 mit finalen Einstellungen encodiert werden."""
+        args = self._output_args(temp_dir, {"render_preset": "slow"})
+        assert args[args.index("-preset") + 1] == "slow"
+        assert "-b:v" in args
+        assert args[args.index("-movflags") + 1] == "+frag_keyframe+empty_moov"
+
+
+class TestLoudnorm:
+    """Tests für _loudnorm Funktion."""
+
+    def test_loudnorm_linear_with_measurements(self) -> None:
+        """Test dass Messwerte den linearen loudnorm-Modus aktivieren."""
+        cfg = {
+            "measured_i": -20.1,
+            "measured_tp": -3.0,
+            "measured_lra": 7.2,
+            "measured_thresh": -30.5,
+        }
+        stream = _loudnorm(ffmpeg.input("in.mp4").audio, cfg)
+        graph = " ".join(ffmpeg.output(stream, "out.mp4").get_args())
+
+        assert "linear=true" in graph
+        assert "measured_i=-20.1" in graph
+
+    def test_loudnorm_dynamic_without_measurements(self) -> None:
+        """Test dass ohne Messwerte der dynamische Modus bleibt."""
+        stream = _loudnorm(ffmpeg.input("in.mp4").audio, None)
+        graph = " ".join(ffmpeg.output(stream, "out.mp4").get_args())
+
+        assert "linear" not in graph
+
+
+class TestRenderVideosAsync:
+    """Tests für render_videos_async Funktion."""
+
+    def _run(self, temp_dir: Path, returncode: int) -> Any:
+        clip = temp_dir / "clip.mp4"
+        clip.write_bytes(b"x")
+        process = MagicMock(returncode=returncode)
+        process.communicate = AsyncMock(return_value=(None, b"kaputt"))
+        exec_mock = AsyncMock(return_value=process)
+        settings = {"render_hwaccel": "none", "render_skip_probe": True}
+
+        with patch("render.pipeline.asyncio.create_subprocess_exec", exec_mock):
+            result = asyncio.run(
+                render_videos_async(
+                    [str(clip)],
+                    str(temp_dir / "out.mp4"),
+                    settings=settings,
+                    semaphore=asyncio.Semaphore(1),
+                )
+            )
+        return result, exec_mock
+
+    def test_render_videos_async_spawns_ffmpeg(self, temp_dir: Path) -> None:
+        """Test dass der Encode als asynchroner Subprozess läuft."""
+        result, exec_mock = self._run(temp_dir, 0)
+
+        assert result == (temp_dir / "out.mp4").as_posix()
+        argv = exec_mock.call_args.args
+        assert argv[0] == "ffmpeg"
+        assert "-filter_complex" in argv
+
+    def test_render_videos_async_raises_on_exit_code(self, temp_dir: Path) -> None:
+        """Test dass ein Exit-Code ungleich 0 als FFmpegError gemeldet wird."""
+        with pytest.raises(FFmpegError, match="kaputt"):
+            self._run(temp_dir, 1)
+
+
+class TestAssembleSegments:
+    """Tests für _assemble_segments Funktion."""
+
+    def test_assemble_segments_order_and_missing(self, temp_dir: Path) -> None:
+        """Test Reihenfolge Intro/Clips/Outro und Überspringen fehlender Clips."""
+        intro = temp_dir / "intro.mp4"
+        clip = temp_dir / "clips" / "clip.mp4"
+        clip.parent.mkdir()
+        for path in (intro, clip):
+            path.write_bytes(b"x")
+        settings = {
+            "render_intro_path": str(intro),
+            "render_outro_path": str(temp_dir / "missing_outro.mp4"),
+        }
+
+        segments = _assemble_segments(
+            (p for p in [str(clip), str(temp_dir / "missing.mp4")]), settings
+        )
+
+        assert segments == [intro, clip]
+
+
+class TestMixBackgroundAudio:
+    """Tests für _mix_background_audio Funktion."""
+
+    def _args(self, temp_dir: Path, cfg: Dict[str, Any], music_duration: float) -> list[str]:
+        music = temp_dir / "music.mp3"
+        music.write_bytes(b"x")
+        with patch("render.pipeline._media_duration", return_value=music_duration):
+            stream = _mix_background_audio(
+                ffmpeg.input("in.mp4").audio, {"path": str(music), **cfg}, 60.0
+            )
+        return ffmpeg.output(stream, "out.mp4").get_args()
+
+    def test_mix_background_audio_skips_loop_for_long_music(self, temp_dir: Path) -> None:
+        """Test dass ausreichend lange Musik nicht geloopt wird."""
+        assert "-stream_loop" not in self._args(temp_dir, {}, 120.0)
+
+    def test_mix_background_audio_loops_short_music(self, temp_dir: Path) -> None:
+        """Test dass zu kurze Musik geloopt wird."""
+        assert "-stream_loop" in self._args(temp_dir, {}, 30.0)
+
+    def test_mix_background_audio_auto_ducking(self, temp_dir: Path) -> None:
+        """Test dass auto_ducking einen Sidechain-Kompressor einfügt."""
+        args = self._args(temp_dir, {"auto_ducking": True}, 120.0)
+        graph = args[args.index("-filter_complex") + 1]
+        assert "sidechaincompress" in graph
+        assert "asplit" in graph
+
+
+class TestMeasureLoudness:
+    """Tests für _measure_loudness Funktion."""
+
+    def test_measure_loudness_parses_json(self) -> None:
+        """Test dass die loudnorm-JSON-Ausgabe in Messwerte übersetzt wird."""
+        stderr = (
+            b"[Parsed_loudnorm_0 @ 0x1]\n{\n"
+            b'"input_i" : "-23.10",\n"input_tp" : "-4.20",\n'
+            b'"input_lra" : "6.50",\n"input_thresh" : "-33.40",\n'
+            b'"target_offset" : "0.30"\n}\n'
+        )
+        with patch.object(
+            ffmpeg.nodes.OutputStream, "run", return_value=(b"", stderr)
+        ):
+            measured = _measure_loudness(ffmpeg.input("in.mp4").audio, None)
+
+        assert measured == {
+            "measured_i": -23.1,
+            "measured_tp": -4.2,
+            "measured_lra": 6.5,
+            "measured_thresh": -33.4,
+            "offset": 0.3,
+        }
+
+    def test_measure_loudness_returns_none_on_error(self) -> None:
+        """Test dass eine fehlgeschlagene Messung None liefert."""
+        error = ffmpeg.Error("ffmpeg", b"", b"kaputt")
+        with patch.object(ffmpeg.nodes.OutputStream, "run", side_effect=error):
+            assert _measure_loudness(ffmpeg.input("in.mp4").audio, None) is None
+
+
+class TestGpuFilters:
+    """Tests für die GPU-Skalierung (render_gpu_filters)."""
+
+    def test_single_pass_scales_on_gpu(self, temp_dir: Path) -> None:
+        """Test dass mit NVENC und render_gpu_filters scale_cuda genutzt wird."""
+        captured: Dict[str, Any] = {}
+
+        def fake_run(stream: Any, **kwargs: Any) -> None:
+            captured["args"] = ffmpeg.get_args(stream)
+
+        settings = {
+            "render_hwaccel": "h264_nvenc",
+            "render_gpu_filters": True,
+            "render_skip_probe": True,
+        }
+        with patch.object(ffmpeg.nodes.OutputStream, "run", fake_run):
+            _render_single_pass(
+                [temp_dir / "clip.mp4"], temp_dir / "out.mp4", 1080, 1920, 30, None, settings
+            )
+
+        args = captured["args"]
+        graph = args[args.index("-filter_complex") + 1]
+        assert "scale_cuda" in graph
+        assert "hwdownload" in graph
+        assert args[args.index("-hwaccel_output_format") + 1] == "cuda"
+
+
+class TestClipsHomogeneous:
+    """Tests für _clips_homogeneous Funktion."""
+
+    @staticmethod
+    def _probe(width: int = 1080, rate: str = "30/1") -> Dict[str, Any]:
+        return {
+            "streams": [
+                {
+                    "codec_type": "video",
+                    "codec_name": "h264",
+                    "pix_fmt": "yuv420p",
+                    "width": width,
+                    "height": 1920,
+                    "r_frame_rate": rate,
+                },
+                {
+                    "codec_type": "audio",
+                    "codec_name": "aac",
+                    "sample_rate": "44100",
+                    "channels": 2,
+                },
+            ]
+        }
+
+    def test_clips_homogeneous_matching(self) -> None:
+        """Test dass identische Clips im Zielformat erkannt werden."""
+        with patch("render.pipeline._probe_media", return_value=self._probe()):
+            assert _clips_homogeneous([Path("a.mp4"), Path("b.mp4")], 1080, 1920, 30)
+
+    def test_clips_homogeneous_other_resolution(self) -> None:
+        """Test dass abweichende Auflösungen einen Re-Encode erzwingen."""
+        probes = [self._probe(), self._probe(width=720)]
+        with patch("render.pipeline._probe_media", side_effect=probes):
+            assert not _clips_homogeneous([Path("a.mp4"), Path("b.mp4")], 1080, 1920, 30)
+
+    def test_clips_homogeneous_other_frame_rate(self) -> None:
+        """Test dass NTSC-Framerates nicht als 30 fps gelten."""
+        with patch("render.pipeline._probe_media", return_value=self._probe(rate="30000/1001")):
+            assert not _clips_homogeneous([Path("a.mp4")], 1080, 1920, 30)
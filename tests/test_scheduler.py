@@ -0,0 +1,47 @@
+"""Unit-Tests für automation/scheduler.py"""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Any
+from unittest.mock import patch
+
+from automation import scheduler as scheduler_module
+from automation.scheduler import start_scheduler
+
+
+class TestStartScheduler:
+    """Tests für start_scheduler Funktion."""
+
+    def test_async_scheduler_runs_job_and_shuts_down(self) -> None:
+        """Test dass ein Job über den asyncio-Pfad läuft und der Scheduler stoppt."""
+        settings = {
+            "scheduler_async": True,
+            "timezone": "UTC",
+            "upload_times": {"youtube": "03:00"},
+        }
+        calls: list[str] = []
+        built: list[Any] = []
+        build_scheduler = scheduler_module._build_scheduler
+
+        def capture(settings: Any, event_loop: asyncio.AbstractEventLoop) -> Any:
+            sched = build_scheduler(settings, event_loop)
+            built.append(sched)
+            # Sobald der Loop läuft: Job sofort fällig machen
+            event_loop.call_soon(
+                lambda: sched.modify_job(
+                    "upload_youtube", next_run_time=datetime.now(timezone.utc)
+                )
+            )
+            return sched
+
+        def task(platform: str) -> None:
+            calls.append(platform)
+            loop = built[0]._eventloop
+            loop.call_soon_threadsafe(loop.stop)
+
+        with patch.object(scheduler_module, "_build_scheduler", side_effect=capture):
+            start_scheduler(task, ["youtube"], settings)
+
+        assert calls == ["youtube"]
+        assert not built[0].running
+        assert built[0]._eventloop.is_closed()
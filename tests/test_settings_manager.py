@@ -0,0 +1,85 @@
+"""Unit-Tests für ui/settings_manager.py"""
+
+import json
+import os
+from pathlib import Path
+from typing import Generator
+
+import pytest
+
+from ui import settings_manager
+
+
+@pytest.fixture
+def settings_file(temp_dir: Path, monkeypatch: pytest.MonkeyPatch) -> Generator[Path, None, None]:
+    """Leitet SETTINGS_PATH auf eine temporäre Datei um."""
+    path = temp_dir / "settings.json"
+    path.write_text(json.dumps({"reddit_limit": 3}), encoding="utf-8")
+    monkeypatch.setattr(settings_manager, "SETTINGS_PATH", path)
+    settings_manager.invalidate_settings_cache()
+    yield path
+    settings_manager.invalidate_settings_cache()
+
+
+class TestGetSettings:
+    """Tests für get_settings Funktion."""
+
+    def test_get_settings_uses_cache_within_ttl(self, settings_file: Path) -> None:
+        """Test dass innerhalb der TTL nicht neu geladen wird."""
+        assert settings_manager.get_settings()["reddit_limit"] == 3
+
+        settings_file.write_text(json.dumps({"reddit_limit": 7}), encoding="utf-8")
+
+        assert settings_manager.get_settings()["reddit_limit"] == 3
+
+    def test_get_settings_reloads_on_mtime_change(self, settings_file: Path) -> None:
+        """Test dass nach Ablauf der TTL eine geänderte Datei neu geladen wird."""
+        settings_manager.get_settings(ttl=0)
+
+        settings_file.write_text(json.dumps({"reddit_limit": 7}), encoding="utf-8")
+        stat = settings_file.stat()
+        os.utime(settings_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert settings_manager.get_settings(ttl=0)["reddit_limit"] == 7
+
+    def test_save_settings_invalidates_cache(self, settings_file: Path) -> None:
+        """Test dass save_settings den Cache verwirft."""
+        settings_manager.get_settings()
+
+        settings_manager.save_settings({"reddit_limit": 9})
+
+        assert settings_manager.get_settings()["reddit_limit"] == 9
+
+    def test_save_settings_keeps_file_mode(self, settings_file: Path) -> None:
+        """Test dass save_settings die Dateirechte der Settings beibehält."""
+        settings_file.chmod(0o644)
+
+        settings_manager.save_settings({"reddit_limit": 9})
+
+        assert settings_file.stat().st_mode & 0o777 == 0o644
+
+    def test_save_settings_keeps_file_on_error(self, settings_file: Path) -> None:
+        """Test dass ein fehlgeschlagenes Speichern die alte Datei unangetastet lässt."""
+        with pytest.raises(TypeError):
+            settings_manager.save_settings({"reddit_limit": object()})
+
+        assert json.loads(settings_file.read_text(encoding="utf-8")) == {"reddit_limit": 3}
+        assert [p.name for p in settings_file.parent.iterdir()] == ["settings.json"]
+
+
+class TestValidateSettings:
+    """Tests für validate_settings Funktion."""
+
+    def test_validate_settings_accepts_shipped_config(self) -> None:
+        """Test dass die ausgelieferte settings.json gültig ist."""
+        shipped = Path(__file__).resolve().parent.parent / "config" / "settings.json"
+        data = json.loads(shipped.read_text(encoding="utf-8"))
+        assert settings_manager.validate_settings(data) == []
+
+    def test_validate_settings_rejects_wrong_types(self) -> None:
+        """Test dass falsche Typen (inkl. bool statt int) gemeldet werden."""
+        errors = settings_manager.validate_settings(
+            {"reddit_limit": True, "hashtags": "memes", "custom_key": 1}
+        )
+        assert len(errors) == 2
+        assert errors[0].startswith("reddit_limit")
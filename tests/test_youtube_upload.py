@@ -1,20 +1,49 @@
 """Unit-Tests für YouTube-Upload-Modul."""
 
+import asyncio
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from googleapiclient.errors import HttpError
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Generator
 
+import upload.youtube as youtube_module
 from upload.youtube import (
     upload_to_youtube,
+    upload_many_to_youtube,
+    upload_to_youtube_async,
+    upload_many_to_youtube_async,
     _load_credentials,
+    _store_token,
     _validate_video_file,
     _upload_with_retry,
+    _upload_with_retry_async,
+    _backoff_delay,
+    _retry_after,
+    _retry_wait,
+    _check_circuit,
+    _record_upload_result,
+    BREAKER_COOLDOWN,
+    BREAKER_THRESHOLD,
+    MAX_RETRY_DELAY,
+    _chunk_size,
+    CHUNK_ALIGNMENT,
+    DEFAULT_CHUNK_SIZE,
+    TIMEOUT,
     YouTubeUploadError,
     YouTubeAuthError,
 )
 
 
+@pytest.fixture(autouse=True)
+def reset_breaker() -> Generator[None, None, None]:
+    """Setzt den modulweiten Circuit Breaker vor und nach jedem Test zurück."""
+    youtube_module._breaker_state.update(fails=0, opened_at=0.0)
+    yield
+    youtube_module._breaker_state.update(fails=0, opened_at=0.0)
+
+
 class TestValidateVideoFile:
     """Tests für _validate_video_file Funktion."""
 
@@ -41,6 +70,45 @@ class TestValidateVideoFile:
         with pytest.raises(YouTubeUploadError, match="keine Datei"):
             _validate_video_file(str(temp_dir))
 
+    def test_validate_video_file_too_large(self, mock_video_path: Path) -> None:
+        """Test Fehler wenn die Datei youtube_max_bytes überschreitet."""
+        settings = {"youtube_max_bytes": mock_video_path.stat().st_size - 1}
+        with pytest.raises(YouTubeUploadError, match="zu groß"):
+            _validate_video_file(str(mock_video_path), settings)
+
+    @patch("upload.youtube._load_credentials")
+    def test_upload_rejects_large_file_before_auth(
+        self, mock_load_creds: Mock, mock_video_path: Path
+    ) -> None:
+        """Test dass eine zu große Datei ohne Authentifizierung abgelehnt wird."""
+        settings = {"youtube_max_bytes": 1}
+        with pytest.raises(YouTubeUploadError, match="zu groß"):
+            upload_to_youtube(str(mock_video_path), settings)
+        mock_load_creds.assert_not_called()
+
+
+class TestChunkSize:
+    """Tests für _chunk_size Funktion."""
+
+    def test_chunk_size_default(self, sample_settings: Dict[str, Any]) -> None:
+        """Test dass ohne Eintrag 100 MiB genutzt werden."""
+        assert _chunk_size(sample_settings) == DEFAULT_CHUNK_SIZE
+        assert DEFAULT_CHUNK_SIZE % CHUNK_ALIGNMENT == 0
+
+    def test_chunk_size_from_settings(self, sample_settings: Dict[str, Any]) -> None:
+        """Test dass ein ausgerichteter Wert übernommen wird."""
+        settings = {**sample_settings, "youtube_chunk_size": 16 * CHUNK_ALIGNMENT}
+        assert _chunk_size(settings) == 16 * CHUNK_ALIGNMENT
+
+    @pytest.mark.parametrize("value", [-1, 0, 1000, True, "4194304"])
+    def test_chunk_size_rejects_invalid(
+        self, value: Any, sample_settings: Dict[str, Any]
+    ) -> None:
+        """Test Fehler bei nicht ausgerichteten oder falsch typisierten Werten."""
+        settings = {**sample_settings, "youtube_chunk_size": value}
+        with pytest.raises(YouTubeUploadError, match="youtube_chunk_size"):
+            _chunk_size(settings)
+
 
 class TestLoadCredentials:
     """Tests für _load_credentials Funktion."""
@@ -70,6 +138,80 @@ class TestLoadCredentials:
         assert result == mock_creds
         mock_from_file.assert_called_once()
 
+    @patch("upload.youtube.Credentials.from_authorized_user_file")
+    def test_load_credentials_reuses_memory_cache(
+        self, mock_from_file: Mock, sample_settings: Dict[str, Any], temp_dir: Path
+    ) -> None:
+        """Test dass gültige Credentials nur einmal von der Platte geladen werden."""
+        mock_creds = MagicMock()
+        mock_creds.valid = True
+        mock_from_file.return_value = mock_creds
+
+        token_path = temp_dir / "token.json"
+        token_path.write_text('{"token": "test"}')
+        settings = {
+            **sample_settings,
+            "youtube_credentials_path": str(temp_dir / "client_secret.json"),
+            "youtube_token_path": str(token_path),
+        }
+
+        assert _load_credentials(settings) is mock_creds
+        assert _load_credentials(settings) is mock_creds
+        mock_from_file.assert_called_once()
+
+        # Ungültig gewordene Credentials werden nicht aus dem Cache geliefert
+        mock_creds.valid = False
+        mock_creds.expired = False
+        with pytest.raises(YouTubeAuthError):
+            _load_credentials(settings)
+        assert mock_from_file.call_count == 2
+
+    @patch("upload.youtube.Credentials.from_authorized_user_file")
+    def test_load_credentials_cache_keyed_by_secret_content(
+        self, mock_from_file: Mock, sample_settings: Dict[str, Any], temp_dir: Path
+    ) -> None:
+        """Test dass eine ausgetauschte client_secret.json den Cache umgeht."""
+        mock_from_file.return_value = MagicMock(valid=True)
+        creds_path = temp_dir / "client_secret.json"
+        creds_path.write_text('{"client_id": "projekt-a"}')
+        token_path = temp_dir / "token.json"
+        token_path.write_text('{"token": "test"}')
+        settings = {
+            **sample_settings,
+            "youtube_credentials_path": str(creds_path),
+            "youtube_token_path": str(token_path),
+        }
+
+        _load_credentials(settings)
+        _load_credentials(settings)
+        assert mock_from_file.call_count == 1
+
+        creds_path.write_text('{"client_id": "projekt-b"}')
+        _load_credentials(settings)
+        assert mock_from_file.call_count == 2
+
+    @patch("upload.youtube.Credentials.from_authorized_user_file")
+    def test_load_credentials_cache_hit_skips_secret_read(
+        self, mock_from_file: Mock, sample_settings: Dict[str, Any], temp_dir: Path
+    ) -> None:
+        """Test dass ein Cache-Treffer die client_secret.json nicht erneut liest."""
+        mock_from_file.return_value = MagicMock(valid=True)
+        creds_path = temp_dir / "client_secret.json"
+        creds_path.write_text('{"client_id": "projekt-a"}')
+        token_path = temp_dir / "token.json"
+        token_path.write_text('{"token": "test"}')
+        settings = {
+            **sample_settings,
+            "youtube_credentials_path": str(creds_path),
+            "youtube_token_path": str(token_path),
+        }
+
+        _load_credentials(settings)
+        with patch.object(Path, "read_bytes", side_effect=AssertionError("gelesen")):
+            _load_credentials(settings)
+
+        assert mock_from_file.call_count == 1
+
     @patch("upload.youtube.InstalledAppFlow")
     def test_load_credentials_needs_auth(
         self, mock_flow_class: Mock, sample_settings: Dict[str, Any], temp_dir: Path
@@ -78,7 +220,7 @@ class TestLoadCredentials:
         # Setup
         mock_flow = MagicMock()
         mock_creds = MagicMock()
-        mock_flow.run_console.return_value = mock_creds
+        mock_flow.run_local_server.return_value = mock_creds
         mock_creds.to_json.return_value = '{"token": "test"}'
         mock_flow_class.from_client_secrets_file.return_value = mock_flow
 
@@ -94,11 +236,14 @@ class TestLoadCredentials:
         }
 
         # Ausführung
-        with patch("upload.youtube.Path.exists", return_value=False):
-            result = _load_credentials(settings)
+        result = _load_credentials(settings)
 
         # Assertions
         assert result == mock_creds
+        _, kwargs = mock_flow.run_local_server.call_args
+        assert kwargs["port"] == 0
+        assert kwargs["open_browser"] is False
+        assert token_path.read_text(encoding="utf-8") == '{"token": "test"}'
 
     def test_load_credentials_missing_credentials_file(
         self, sample_settings: Dict[str, Any]
@@ -112,6 +257,17 @@ class TestLoadCredentials:
         with pytest.raises(YouTubeAuthError, match="nicht gefunden"):
             _load_credentials(settings)
 
+    def test_store_token_skips_unchanged(self, temp_dir: Path) -> None:
+        """Test dass token.json nur bei geändertem Inhalt neu geschrieben wird."""
+        token_path = temp_dir / "config" / "token.json"
+
+        assert _store_token(token_path, '{"token": "a"}') is True
+        assert _store_token(token_path, '{"token": "a"}') is False
+        assert _store_token(token_path, '{"token": "b"}') is True
+
+        assert token_path.read_text(encoding="utf-8") == '{"token": "b"}'
+        assert list(token_path.parent.iterdir()) == [token_path]
+
 
 class TestUploadToYoutube:
     """Tests für upload_to_youtube Funktion."""
@@ -145,6 +301,13 @@ class TestUploadToYoutube:
         mock_load_creds.assert_called_once()
         mock_upload_retry.assert_called_once()
 
+        # Zweiter Upload mit denselben Credentials baut keinen neuen Service
+        upload_to_youtube(str(mock_video_path), sample_settings)
+        mock_build.assert_called_once()
+        http = mock_build.call_args.kwargs["http"]
+        assert http.credentials is mock_creds
+        assert http.http.timeout == TIMEOUT
+
     @patch("upload.youtube._validate_video_file")
     def test_upload_to_youtube_invalid_file(
         self, mock_validate: Mock, sample_settings: Dict[str, Any]
@@ -170,3 +333,353 @@ class TestUploadToYoutube:
 
         with pytest.raises(YouTubeAuthError):
             upload_to_youtube(str(mock_video_path), sample_settings)
+
+    @patch("upload.youtube._load_credentials")
+    @patch("upload.youtube._upload_with_retry_async", new_callable=AsyncMock)
+    @patch("upload.youtube.build")
+    def test_upload_to_youtube_async_uses_timeout_transport(
+        self,
+        mock_build: Mock,
+        mock_upload_retry: AsyncMock,
+        mock_load_creds: Mock,
+        sample_settings: Dict[str, Any],
+        mock_video_path: Path,
+    ) -> None:
+        """Test dass die Async-Variante dieselbe Transport-Konfiguration nutzt."""
+        mock_creds = MagicMock()
+        mock_load_creds.return_value = mock_creds
+
+        asyncio.run(upload_to_youtube_async(str(mock_video_path), sample_settings))
+
+        http = mock_build.call_args.kwargs["http"]
+        assert http.credentials is mock_creds
+        assert http.http.timeout == TIMEOUT
+        mock_upload_retry.assert_awaited_once()
+
+    @patch("upload.youtube._load_credentials")
+    @patch("upload.youtube._upload_with_retry_async", new_callable=AsyncMock)
+    @patch("upload.youtube.build")
+    def test_upload_to_youtube_async_wraps_unexpected_errors(
+        self,
+        mock_build: Mock,
+        mock_upload_retry: AsyncMock,
+        mock_load_creds: Mock,
+        sample_settings: Dict[str, Any],
+        mock_video_path: Path,
+    ) -> None:
+        """Test dass unerwartete Fehler als YouTubeUploadError gemeldet werden."""
+        mock_upload_retry.side_effect = RuntimeError("boom")
+
+        with pytest.raises(YouTubeUploadError, match="Unerwarteter Fehler"):
+            asyncio.run(upload_to_youtube_async(str(mock_video_path), sample_settings))
+
+
+class TestBackoffDelay:
+    """Tests für _backoff_delay Funktion."""
+
+    @pytest.mark.parametrize(
+        "attempt,jitter,expected",
+        [(1, 0.0, 5.0), (2, 0.5, 15.0), (3, -0.5, 10.0), (10, 0.0, MAX_RETRY_DELAY)],
+    )
+    def test_backoff_delay_capped_with_jitter(
+        self, attempt: int, jitter: float, expected: float
+    ) -> None:
+        """Test exponentielles Wachstum, Deckel und Jitter-Faktor."""
+        with patch("upload.youtube.random.uniform", return_value=jitter):
+            assert _backoff_delay(attempt) == pytest.approx(expected)
+
+
+class TestRetryAfter:
+    """Tests für _retry_after Funktion."""
+
+    @pytest.mark.parametrize(
+        "headers,expected",
+        [
+            ({"retry-after": "7"}, 7.0),
+            ({"retry-after": "0"}, 1.0),
+            ({"retry-after": "3600"}, MAX_RETRY_DELAY),
+            ({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"}, 1.0),
+            ({"retry-after": "bald"}, None),
+            ({}, None),
+        ],
+    )
+    def test_retry_after_parses_and_clamps(
+        self, headers: Dict[str, str], expected: Any
+    ) -> None:
+        """Test Sekunden- und Datumsformat sowie Begrenzung."""
+        assert _retry_after(headers) == expected
+
+
+class TestRetryWait:
+    """Tests für _retry_wait Funktion."""
+
+    @pytest.mark.parametrize("status", [408, 425, 429, 500, 503, 520])
+    def test_retry_wait_retries_transient_status(self, status: int) -> None:
+        """Test dass transiente Status-Codes einen weiteren Versuch bekommen."""
+        assert _retry_wait(HttpError(Mock(status=status), b""), 1, None) > 0
+
+    @pytest.mark.parametrize("status", [400, 401, 403, 404])
+    def test_retry_wait_raises_on_permanent_status(self, status: int) -> None:
+        """Test dass permanente Fehler sofort abbrechen."""
+        with pytest.raises(YouTubeUploadError, match="Permanenter"):
+            _retry_wait(HttpError(Mock(status=status), b""), 1, None)
+
+
+class TestCircuitBreaker:
+    """Tests für den Circuit Breaker über mehrere Uploads."""
+
+    def test_breaker_opens_after_threshold(self) -> None:
+        """Test dass nach BREAKER_THRESHOLD Fehlschlägen sofort abgelehnt wird."""
+        for _ in range(BREAKER_THRESHOLD - 1):
+            _record_upload_result(False)
+        _check_circuit()
+
+        _record_upload_result(False)
+        with pytest.raises(YouTubeUploadError, match="Circuit-Breaker offen"):
+            _check_circuit()
+
+    @patch("upload.youtube.time.monotonic")
+    def test_breaker_allows_single_probe_after_cooldown(
+        self, mock_monotonic: Mock
+    ) -> None:
+        """Test dass nach dem Cooldown genau ein Probe-Upload durchkommt."""
+        mock_monotonic.return_value = 1000.0
+        for _ in range(BREAKER_THRESHOLD):
+            _record_upload_result(False)
+
+        mock_monotonic.return_value = 1000.0 + BREAKER_COOLDOWN
+        _check_circuit()
+        with pytest.raises(YouTubeUploadError):
+            _check_circuit()
+
+        _record_upload_result(True)
+        _check_circuit()
+
+    @patch("upload.youtube._load_credentials")
+    def test_upload_fails_fast_when_open(
+        self, mock_load_creds: Mock, mock_video_path: Path
+    ) -> None:
+        """Test dass upload_to_youtube bei offenem Breaker nicht authentifiziert."""
+        for _ in range(BREAKER_THRESHOLD):
+            _record_upload_result(False)
+
+        with pytest.raises(YouTubeUploadError, match="Circuit-Breaker offen"):
+            upload_to_youtube(str(mock_video_path), {})
+        mock_load_creds.assert_not_called()
+
+
+class TestUploadWithRetry:
+    """Tests für _upload_with_retry Funktion."""
+
+    @patch("upload.youtube.time.sleep")
+    def test_upload_with_retry_reuses_request(
+        self, mock_sleep: Mock, mock_video_path: Path, temp_dir: Path
+    ) -> None:
+        """Test dass ein Retry denselben Request fortsetzt statt neu zu starten."""
+        request = MagicMock()
+        request.resumable_uri = "https://upload.example/session"
+        request.resumable_progress = 262144
+        request.next_chunk.side_effect = [
+            (MagicMock(), None),
+            ConnectionError("weg"),
+            (None, {"id": "abc"}),
+        ]
+        youtube = MagicMock()
+        youtube.videos.return_value.insert.return_value = request
+        state_path = temp_dir / "state" / "yt.json"
+
+        _upload_with_retry(youtube, {}, MagicMock(), mock_video_path, state_path)
+
+        youtube.videos.return_value.insert.assert_called_once()
+        assert request._in_error_state is True
+        assert not state_path.exists()
+        mock_sleep.assert_called_once()
+
+    @patch("upload.youtube.time.sleep")
+    def test_upload_with_retry_restores_saved_session(
+        self, mock_sleep: Mock, mock_video_path: Path, temp_dir: Path
+    ) -> None:
+        """Test dass eine gespeicherte Session beim Start übernommen wird."""
+        state_path = temp_dir / "yt.json"
+        state_path.write_text(
+            '{"uri": "https://upload.example/session", "progress": 262144}'
+        )
+        request = MagicMock()
+        request.next_chunk.return_value = (None, {"id": "abc"})
+        youtube = MagicMock()
+        youtube.videos.return_value.insert.return_value = request
+
+        _upload_with_retry(youtube, {}, MagicMock(), mock_video_path, state_path)
+
+        assert request.resumable_uri == "https://upload.example/session"
+        assert request.resumable_progress == 262144
+        assert not state_path.exists()
+        mock_sleep.assert_not_called()
+
+    @patch("upload.youtube.time.sleep")
+    def test_upload_with_retry_rebuilds_expired_session(
+        self, mock_sleep: Mock, mock_video_path: Path, temp_dir: Path
+    ) -> None:
+        """Test dass eine abgelaufene Session (410) einen neuen Request erzeugt."""
+        expired = MagicMock()
+        expired.resumable_uri = "https://upload.example/session"
+        expired.next_chunk.side_effect = HttpError(Mock(status=410), b"")
+        fresh = MagicMock()
+        fresh.next_chunk.return_value = (None, {"id": "abc"})
+        youtube = MagicMock()
+        youtube.videos.return_value.insert.side_effect = [expired, fresh]
+
+        _upload_with_retry(
+            youtube, {}, MagicMock(), mock_video_path, temp_dir / "yt.json"
+        )
+
+        assert youtube.videos.return_value.insert.call_count == 2
+        fresh.next_chunk.assert_called_once()
+        mock_sleep.assert_called_once_with(0.0)
+
+    @patch("upload.youtube.asyncio.sleep", new_callable=AsyncMock)
+    def test_upload_with_retry_async_backs_off_without_blocking(
+        self, mock_sleep: AsyncMock, mock_video_path: Path
+    ) -> None:
+        """Test dass die Async-Variante per asyncio.sleep wartet und erneut versucht."""
+        request = MagicMock()
+        request.next_chunk.side_effect = [
+            HttpError(Mock(status=503), b""),
+            (None, {"id": "abc"}),
+        ]
+        youtube = MagicMock()
+        youtube.videos.return_value.insert.return_value = request
+
+        asyncio.run(
+            _upload_with_retry_async(youtube, {}, MagicMock(), mock_video_path)
+        )
+
+        mock_sleep.assert_awaited_once()
+        assert request.next_chunk.call_count == 2
+        youtube.videos.return_value.insert.assert_called_once()
+
+
+class TestUploadManyToYoutube:
+    """Tests für upload_many_to_youtube Funktion."""
+
+    @patch("upload.youtube._load_credentials")
+    @patch("upload.youtube._upload_with_retry")
+    @patch("upload.youtube.build")
+    def test_upload_many_skips_failures(
+        self,
+        mock_build: Mock,
+        mock_upload_retry: Mock,
+        mock_load_creds: Mock,
+        sample_settings: Dict[str, Any],
+        temp_dir: Path,
+    ) -> None:
+        """Test dass Fehler übersprungen werden und Auth nur einmal läuft."""
+        paths = []
+        for name in ("a.mp4", "b.mp4", "c.mp4"):
+            video = temp_dir / name
+            video.write_bytes(b"video")
+            paths.append(str(video))
+
+        def fake_upload(youtube: Any, body: Any, media: Any, video_file: Path, state: Any) -> None:
+            if video_file.name == "b.mp4":
+                raise YouTubeUploadError("kaputt")
+
+        mock_upload_retry.side_effect = fake_upload
+
+        uploaded = upload_many_to_youtube(paths, sample_settings, max_workers=1)
+
+        assert uploaded == [paths[0], paths[2]]
+        mock_load_creds.assert_called_once()
+        mock_build.assert_called_once()
+        assert mock_upload_retry.call_count == 3
+
+
+class TestUploadManyToYoutubeAsync:
+    """Tests für upload_many_to_youtube_async Funktion."""
+
+    @patch("upload.youtube._load_credentials")
+    @patch("upload.youtube.upload_to_youtube_async")
+    def test_upload_many_async_bounds_concurrency(
+        self,
+        mock_upload: Mock,
+        mock_load_creds: Mock,
+        sample_settings: Dict[str, Any],
+    ) -> None:
+        """Test dass höchstens max_workers Uploads gleichzeitig laufen."""
+        events: list[str] = []
+        mock_load_creds.side_effect = lambda settings: events.append("auth")
+        running = 0
+        peak = 0
+
+        async def fake_upload(video_path: str, settings: Dict[str, Any]) -> None:
+            nonlocal running, peak
+            events.append(video_path)
+            running += 1
+            peak = max(peak, running)
+            for _ in range(3):
+                await asyncio.sleep(0)
+            running -= 1
+
+        mock_upload.side_effect = fake_upload
+        paths = [f"{name}.mp4" for name in "abcde"]
+
+        uploaded = asyncio.run(
+            upload_many_to_youtube_async(paths, sample_settings, max_workers=2)
+        )
+
+        assert uploaded == paths
+        assert peak == 2
+        # Genau eine Authentifizierung, und zwar vor dem ersten Upload
+        assert events.count("auth") == 1
+        assert events[0] == "auth"
+
+    @patch("upload.youtube._load_credentials")
+    @patch("upload.youtube.upload_to_youtube_async", new_callable=AsyncMock)
+    def test_upload_many_async_skips_failures(
+        self,
+        mock_upload: AsyncMock,
+        mock_load_creds: Mock,
+        sample_settings: Dict[str, Any],
+    ) -> None:
+        """Test dass fehlgeschlagene Uploads bei skip_on_error übersprungen werden."""
+        mock_upload.side_effect = [None, YouTubeUploadError("kaputt"), None]
+
+        uploaded = asyncio.run(
+            upload_many_to_youtube_async(["a.mp4", "b.mp4", "c.mp4"], sample_settings)
+        )
+
+        assert uploaded == ["a.mp4", "c.mp4"]
+        assert mock_upload.await_count == 3
+
+    @patch("upload.youtube._load_credentials")
+    @patch("upload.youtube.upload_to_youtube_async", new_callable=AsyncMock)
+    def test_upload_many_async_raises_without_skip(
+        self,
+        mock_upload: AsyncMock,
+        mock_load_creds: Mock,
+        sample_settings: Dict[str, Any],
+    ) -> None:
+        """Test dass bei skip_on_error=False der erste Fehler weitergereicht wird."""
+        mock_upload.side_effect = [None, YouTubeUploadError("kaputt"), None]
+
+        with pytest.raises(YouTubeUploadError, match="kaputt"):
+            asyncio.run(
+                upload_many_to_youtube_async(
+                    ["a.mp4", "b.mp4", "c.mp4"], sample_settings, skip_on_error=False
+                )
+            )
+
+    @patch("upload.youtube._load_credentials")
+    @patch("upload.youtube.upload_to_youtube_async", new_callable=AsyncMock)
+    def test_upload_many_async_auth_error_stops_batch(
+        self,
+        mock_upload: AsyncMock,
+        mock_load_creds: Mock,
+        sample_settings: Dict[str, Any],
+    ) -> None:
+        """Test dass ein Auth-Fehler vor dem Fan-out abbricht."""
+        mock_load_creds.side_effect = YouTubeAuthError("Auth failed")
+
+        with pytest.raises(YouTubeAuthError):
+            asyncio.run(upload_many_to_youtube_async(["a.mp4"], sample_settings))
+        mock_upload.assert_not_awaited()
@@ -1,23 +1,84 @@
 from __future__ import annotations
 
+import math
+import threading
+import time
 from flask import Flask, jsonify, request
 
-from .settings_manager import load_settings, save_settings
+from . import json_provider, settings_manager
+
+
+# Fixed-Window-Limit für POST /settings (Schreibzugriffe pro Client-IP)
+SETTINGS_POST_LIMIT: int = 10
+SETTINGS_POST_WINDOW: float = 60.0  # Sekunden
+
+
+class FixedWindowLimiter:
+    """Einfaches Fixed-Window-Rate-Limit pro Schlüssel (z. B. Client-IP)."""
+
+    def __init__(self, limit: int, window: float) -> None:
+        self.limit = limit
+        self.window = window
+        self._lock = threading.Lock()
+        # Schlüssel → (Fensterbeginn monotonic, Anzahl Requests)
+        self._windows: dict[str, tuple[float, int]] = {}
+
+    def hit(self, key: str) -> float:
+        """Zählt einen Request und liefert die Wartezeit bei Überschreitung.
+
+        Args:
+            key: Schlüssel des Clients
+
+        Returns:
+            0 wenn zugelassen, sonst Sekunden bis zum nächsten Fenster
+        """
+        now = time.monotonic()
+        with self._lock:
+            start, count = self._windows.get(key, (now, 0))
+            if now - start >= self.window:
+                start, count = now, 0
+            if count >= self.limit:
+                return self.window - (now - start)
+            self._windows[key] = (start, count + 1)
+            if len(self._windows) > 1024:
+                self._windows = {
+                    k: v for k, v in self._windows.items() if now - v[0] < self.window
+                }
+            return 0.0
 
 
 def create_app() -> Flask:
     app = Flask(__name__)
+    json_provider.init_app(app)
+    post_limiter = FixedWindowLimiter(SETTINGS_POST_LIMIT, SETTINGS_POST_WINDOW)
 
     @app.get("/settings")
     def get_settings():
-        return jsonify(load_settings())
+        # Geparste Settings aus dem mtime-validierten Cache
+        return jsonify(settings_manager.get_settings(ttl=0))
 
     @app.post("/settings")
     def update_settings():
+        retry_after = post_limiter.hit(request.remote_addr or "unknown")
+        if retry_after:
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "code": "agent.rate_limited",
+                        "message": "Rate limit exceeded",
+                    }
+                ),
+                429,
+                {"Retry-After": str(math.ceil(retry_after))},
+            )
         payload = request.get_json(force=True)
         if not isinstance(payload, dict):
             return jsonify({"error": "Ungültige Payload"}), 400
-        save_settings(payload)
+        errors = settings_manager.validate_settings(payload)
+        if errors:
+            return jsonify({"error": "Ungültige Settings", "details": errors}), 400
+        settings_manager.save_settings(payload)
         return jsonify({"status": "ok"})
 
     return app
@@ -25,4 +86,3 @@ def create_app() -> Flask:
 
 if __name__ == "__main__":
     create_app().run(debug=True)
-
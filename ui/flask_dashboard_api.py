@@ -3,22 +3,166 @@ Flask API Module for Dashboard Integration
 Provides REST endpoints for the React Dashboard
 """
 
+import calendar
+import hashlib
+import itertools
 import json
 import os
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
-from functools import wraps
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
+from functools import lru_cache, wraps
 from pathlib import Path
+from uuid import uuid4
 
-from flask import Flask, request, jsonify, send_file
+from flask import Flask, Response, g, request, jsonify, send_file
 from flask_cors import CORS
+from werkzeug.sansio.multipart import (
+    Data, Epilogue, Field, File, MultipartDecoder, NeedData,
+)
 from werkzeug.utils import secure_filename
 
+from . import json_provider
+
+# Staging directory for uploads; point UPLOAD_TMPFS at a tmpfs mount to keep
+# short-lived upload files off the disk entirely
+UPLOAD_DIR = Path(os.environ.get('UPLOAD_TMPFS', 'uploads/temp'))
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB per read when streaming uploads to disk
+POLL_CACHE_TTL = 0.2  # Seconds a polled read-only payload is reused
+QUEUE_MAX_JOBS = 1000  # Oldest jobs are dropped from the in-memory queue beyond this
+
+
+# Static analytics figures (mock data) and their summary, computed once
+PLATFORM_STATS: List[Dict[str, Any]] = [
+    {'platform': 'YouTube', 'views': 125000, 'engagement': 8.5},
+    {'platform': 'TikTok', 'views': 89000, 'engagement': 12.3},
+    {'platform': 'Instagram', 'views': 45000, 'engagement': 9.8},
+    {'platform': 'Twitter', 'views': 23000, 'engagement': 5.2},
+]
+PLATFORM_SUMMARY: Dict[str, Any] = {
+    'totalViews': sum(p['views'] for p in PLATFORM_STATS),
+    'avgEngagement': sum(p['engagement'] for p in PLATFORM_STATS) / len(PLATFORM_STATS),
+    'topPlatform': max(PLATFORM_STATS, key=lambda p: p['views'])['platform'],
+}
+
+
+def _dumps(payload: Any) -> bytes:
+    """Serialize payload to JSON bytes (orjson when available)"""
+    if json_provider.orjson is not None:
+        return json_provider.orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
+
+
+# Clients resend the same filenames and platform lists; memoize both parsers
+_secure_filename = lru_cache(maxsize=512)(secure_filename)
+
+
+@lru_cache(maxsize=64)
+def _parse_platforms(raw: str) -> tuple:
+    """Parse a JSON platform list, falling back to YouTube if it is invalid"""
+    try:
+        platforms = json.loads(raw)
+    except json.JSONDecodeError:
+        return ('youtube',)
+    if not isinstance(platforms, list):
+        return ('youtube',)
+    return tuple(platforms)
+
+
+def _content_hasher():
+    """Hash object used to fingerprint uploads (BLAKE2b, 256 bit)"""
+    return hashlib.blake2b(digest_size=32)
+
+
+def _stream_to_file(stream, target: Path, hasher=None) -> int:
+    """Copy a readable stream to target in chunks and return the byte count
+    
+    If hasher is given it is fed every chunk on the way (no second read).
+    """
+    size = 0
+    with open(target, 'wb') as out:
+        while True:
+            chunk = stream.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            out.write(chunk)
+            if hasher is not None:
+                hasher.update(chunk)
+            size += len(chunk)
+    return size
+
+
+def _stream_multipart_upload(
+    stream, boundary: bytes, target: Path, hasher=None
+) -> Tuple[Optional[str], int, Dict[str, str]]:
+    """Parse a multipart body incrementally, writing the 'file' part to target
+    
+    The request stream is fed straight into Werkzeug's sans-IO decoder, so
+    file bytes go from the socket to target without being spooled by
+    Werkzeug first. target should be a private temporary name; the caller
+    moves it into place once the upload is complete. Other text fields are
+    collected in memory; additional file parts are discarded. If hasher is
+    given it is fed the bytes of the 'file' part.
+    
+    Returns (filename, size, fields); filename is the secured client file
+    name, None when no 'file' part was sent and '' when it had no usable
+    name. Raises ValueError for malformed or truncated bodies, removing
+    target.
+    """
+    decoder = MultipartDecoder(boundary)
+    fields: Dict[str, str] = {}
+    filename: Optional[str] = None
+    size = 0
+    out = None
+    field_name: Optional[str] = None
+    field_parts: List[bytes] = []
+    try:
+        event = None
+        while not isinstance(event, Epilogue):
+            chunk = stream.read(UPLOAD_CHUNK_SIZE)
+            decoder.receive_data(chunk or None)
+            event = decoder.next_event()
+            while not isinstance(event, (NeedData, Epilogue)):
+                if isinstance(event, File):
+                    field_name = None
+                    if event.name == 'file' and filename is None:
+                        filename = _secure_filename(event.filename or '')
+                        if filename:
+                            out = open(target, 'wb')
+                elif isinstance(event, Field):
+                    field_name, field_parts = event.name, []
+                elif isinstance(event, Data):
+                    if out is not None:
+                        out.write(event.data)
+                        if hasher is not None:
+                            hasher.update(event.data)
+                        size += len(event.data)
+                    elif field_name is not None:
+                        field_parts.append(event.data)
+                    if not event.more_data:
+                        if out is not None:
+                            out.close()
+                            out = None
+                        elif field_name is not None:
+                            fields[field_name] = b''.join(field_parts).decode('utf-8', 'replace')
+                            field_name = None
+                event = decoder.next_event()
+    except BaseException:
+        if out is not None:
+            out.close()
+        target.unlink(missing_ok=True)
+        raise
+    return filename, size, fields
+
+
 # Configure Flask App
 def create_app(config_path: str = 'config/settings.json') -> Flask:
     """Create and configure Flask application with CORS and error handling"""
     
     app = Flask(__name__)
+    json_provider.init_app(app)
     CORS(app, resources={r"/api/*": {"origins": "*"}})
     
     # Load configuration
@@ -54,7 +198,12 @@ def create_dashboard_routes(app: Flask, upload_manager, config: Dict[str, Any]):
     """
     
     # Mock data storage (in production, use database)
-    upload_queue: List[Dict[str, Any]] = []
+    upload_queue: deque = deque(maxlen=QUEUE_MAX_JOBS)
+    queue_index: Dict[str, Dict[str, Any]] = {}  # job id -> job (same objects)
+    queue_lock = threading.Lock()
+    job_counter = itertools.count(1)  # Sequential job ids, drawn under queue_lock
+    hash_index: Dict[str, Dict[str, Any]] = {}  # content hash -> live job
+    name_index: Dict[str, Dict[str, Any]] = {}  # stored filename -> live job
     analytics_data = {
         'totalUploads': 142,
         'successfulUploads': 138,
@@ -69,94 +218,224 @@ def create_dashboard_routes(app: Flask, upload_manager, config: Dict[str, Any]):
         {'name': 'Instagram', 'connected': True, 'icon': '📸'},
         {'name': 'Twitter', 'connected': False, 'icon': '𝕏'},
     ]
+    platforms_by_key = {p['name'].lower(): p for p in platforms_config}
+    
+    def is_live(job: Optional[Dict[str, Any]]) -> bool:
+        """Whether job still owns its file (not failed or cancelled)"""
+        return job is not None and job['status'] not in ('failed', 'cancelled')
+    
+    def queue_upload(part_path: Path, filename: str, size: int, title: str,
+                     description: str, platform_list: List[str], content_hash: str):
+        """Create an upload job for a received file and add it to the queue
+        
+        part_path is the private temp file the body was streamed to. Returns
+        (job, outcome): 'created' once the file was moved to filename,
+        'duplicate' if a live job has the same content hash, or 'conflict'
+        if a live job already stores a file under filename. In the latter
+        two cases the existing job is returned and part_path is left for
+        the caller to remove.
+        """
+        now = g.now_iso
+        with queue_lock:
+            existing = hash_index.get(content_hash)
+            if is_live(existing):
+                return existing, 'duplicate'
+            existing = name_index.get(filename)
+            if is_live(existing):
+                return existing, 'conflict'
+            os.replace(part_path, UPLOAD_DIR / filename)
+            upload_job = {
+                'id': f'job_{next(job_counter):012d}',
+                'title': title,
+                'description': description,
+                'platforms': platform_list,
+                'filename': filename,
+                'size': size,
+                'contentHash': content_hash,
+                'status': 'queued',
+                'progress': 0,
+                'createdAt': now,
+                'updatedAt': now,
+            }
+            if len(upload_queue) == upload_queue.maxlen:
+                # append() will drop the oldest job; keep the indexes in step
+                oldest = upload_queue[0]
+                queue_index.pop(oldest['id'], None)
+                if hash_index.get(oldest['contentHash']) is oldest:
+                    del hash_index[oldest['contentHash']]
+                if name_index.get(oldest['filename']) is oldest:
+                    del name_index[oldest['filename']]
+            upload_queue.append(upload_job)
+            queue_index[upload_job['id']] = upload_job
+            hash_index[content_hash] = upload_job
+            name_index[filename] = upload_job
+            analytics_data['totalUploads'] += 1
+        return upload_job, 'created'
+    
+    def queued_response(part_path: Path, filename: str, size: int, title: str,
+                        description: str, platform_list: List[str], content_hash: str):
+        """Queue a received upload
+        
+        New jobs get 201, duplicates reuse the existing job (200) and names
+        held by another live job are refused (409). Only part_path is ever
+        removed, never the file of an existing job.
+        """
+        upload_job, outcome = queue_upload(
+            part_path, filename, size, title, description, platform_list, content_hash
+        )
+        if outcome == 'created':
+            return jsonify(upload_job), 201
+        part_path.unlink(missing_ok=True)
+        if outcome == 'duplicate':
+            return jsonify(upload_job), 200
+        return jsonify({
+            'error': 'File name already in use',
+            'jobId': upload_job['id'],
+        }), 409
+    
+    # Serialized bodies of polled read-only endpoints: key -> (monotonic, body)
+    poll_cache: Dict[str, Any] = {}
+    
+    @app.before_request
+    def stamp_request():
+        """Format the request timestamp once for all handlers"""
+        g.now_iso = datetime.now().isoformat()
+    
+    def cached_json(key: str, build) -> Response:
+        """Serve build() as JSON, reusing the serialized body for POLL_CACHE_TTL"""
+        now = time.monotonic()
+        hit = poll_cache.get(key)
+        if hit is None or now - hit[0] >= POLL_CACHE_TTL:
+            hit = (now, app.json.dumps(build()))
+            poll_cache[key] = hit
+        return app.response_class(hit[1], mimetype='application/json')
+    
+    # Pre-serialized rarely-changing payloads: key -> (body, etag)
+    etag_cache: Dict[str, Any] = {}
+    
+    def etag_json(key: str, build) -> Response:
+        """Serve a cached serialized payload with ETag / 304 support"""
+        entry = etag_cache.get(key)
+        if entry is None:
+            body = _dumps(build())
+            entry = (body, hashlib.blake2b(body, digest_size=8).hexdigest())
+            etag_cache[key] = entry
+        response = app.response_class(entry[0], mimetype='application/json')
+        response.set_etag(entry[1], weak=True)
+        return response.make_conditional(request)
     
     # ============== STATS ENDPOINTS ==============
     
     @app.route('/api/stats', methods=['GET'])
     def get_stats():
         """Get dashboard statistics"""
-        return jsonify({
+        return cached_json('stats', lambda: {
             'totalUploads': analytics_data['totalUploads'],
             'successfulUploads': analytics_data['successfulUploads'],
             'failedUploads': analytics_data['failedUploads'],
             'totalViews': analytics_data['totalViews'],
             'totalEngagement': analytics_data['totalEngagement'],
-            'lastUpdated': datetime.now().isoformat(),
+            'lastUpdated': g.now_iso,
         }), 200
     
     # ============== UPLOAD QUEUE ENDPOINTS ==============
     
     @app.route('/api/queue', methods=['GET'])
     def get_upload_queue():
-        """Get current upload queue"""
+        """Get current upload queue
+        
+        Supports paging via ?offset=&limit= (defaults: whole queue), so
+        pollers only pay for the slice they display.
+        """
+        offset = max(request.args.get('offset', 0, type=int), 0)
+        limit = max(request.args.get('limit', QUEUE_MAX_JOBS, type=int), 0)
+        with queue_lock:
+            total = len(upload_queue)
+            jobs = list(itertools.islice(upload_queue, offset, offset + limit))
         return jsonify({
-            'jobs': upload_queue,
-            'count': len(upload_queue),
-            'lastUpdated': datetime.now().isoformat(),
+            'jobs': jobs,
+            'count': len(jobs),
+            'total': total,
+            'lastUpdated': g.now_iso,
         }), 200
     
     @app.route('/api/upload', methods=['POST'])
     def upload_video():
         """Handle video upload"""
+        part_path = UPLOAD_DIR / f'.{uuid4().hex}.part'
         try:
-            if 'file' not in request.files:
+            boundary = request.mimetype_params.get('boundary')
+            if request.mimetype != 'multipart/form-data' or not boundary:
                 return jsonify({'error': 'No file provided'}), 400
             
-            file = request.files['file']
-            title = request.form.get('title', 'Untitled')
-            description = request.form.get('description', '')
-            platforms = request.form.get('platforms', '[]')
-            
-            if file.filename == '':
-                return jsonify({'error': 'No file selected'}), 400
-            
-            # Parse platforms
+            # Parse the body ourselves instead of request.files: the file
+            # part is written to a private temp name while it is received,
+            # so a failed upload never touches files of queued jobs
+            UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+            hasher = _content_hasher()
             try:
-                platform_list = json.loads(platforms)
-            except json.JSONDecodeError:
-                platform_list = ['youtube']
-            
-            # Secure filename
-            filename = secure_filename(file.filename)
-            
-            # Create upload job
-            job_id = f"job_{datetime.now().timestamp()}"
-            upload_job = {
-                'id': job_id,
-                'title': title,
-                'description': description,
-                'platforms': platform_list,
-                'filename': filename,
-                'size': len(file.read()),
-                'status': 'queued',
-                'progress': 0,
-                'createdAt': datetime.now().isoformat(),
-                'updatedAt': datetime.now().isoformat(),
-            }
+                filename, size, form = _stream_multipart_upload(
+                    request.stream, boundary.encode('latin-1'), part_path, hasher
+                )
+            except ValueError as e:
+                return jsonify({'error': f'Invalid multipart body: {e}'}), 400
+            if filename is None:
+                return jsonify({'error': 'No file provided'}), 400
+            if not filename:
+                return jsonify({'error': 'No file selected'}), 400
             
-            # Reset file pointer
-            file.seek(0)
+            title = form.get('title', 'Untitled')
+            description = form.get('description', '')
+            platform_list = list(_parse_platforms(form.get('platforms', '[]')))
             
-            # Save file to temp directory
-            upload_dir = Path('uploads/temp')
-            upload_dir.mkdir(parents=True, exist_ok=True)
-            file.save(upload_dir / filename)
+            return queued_response(
+                part_path, filename, size, title, description, platform_list,
+                hasher.hexdigest(),
+            )
+        
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
+        finally:
+            part_path.unlink(missing_ok=True)
+    
+    @app.route('/api/upload/raw', methods=['POST'])
+    def upload_video_raw():
+        """Handle raw-body video upload (no multipart parsing)
+        
+        The request body is the file itself; metadata is passed as query
+        parameters (filename, title, description, platforms).
+        """
+        part_path = UPLOAD_DIR / f'.{uuid4().hex}.part'
+        try:
+            filename = _secure_filename(request.args.get('filename', ''))
+            if not filename:
+                return jsonify({'error': 'No filename provided'}), 400
             
-            # Add to queue
-            upload_queue.append(upload_job)
+            platform_list = list(_parse_platforms(request.args.get('platforms', '[]')))
             
-            # Update analytics
-            analytics_data['totalUploads'] += 1
+            UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+            hasher = _content_hasher()
+            size = _stream_to_file(request.stream, part_path, hasher)
             
-            return jsonify(upload_job), 201
+            return queued_response(
+                part_path,
+                filename,
+                size,
+                request.args.get('title', 'Untitled'),
+                request.args.get('description', ''),
+                platform_list,
+                hasher.hexdigest(),
+            )
         
         except Exception as e:
             return jsonify({'error': str(e)}), 500
+        finally:
+            part_path.unlink(missing_ok=True)
     
     @app.route('/api/upload/<job_id>', methods=['GET'])
     def get_upload_status(job_id: str):
         """Get upload job status"""
-        job = next((j for j in upload_queue if j['id'] == job_id), None)
+        job = queue_index.get(job_id)
         if not job:
             return jsonify({'error': 'Job not found'}), 404
         return jsonify(job), 200
@@ -164,16 +443,16 @@ def create_dashboard_routes(app: Flask, upload_manager, config: Dict[str, Any]):
     @app.route('/api/upload/<job_id>', methods=['DELETE'])
     def cancel_upload(job_id: str):
         """Cancel upload job"""
-        global upload_queue
-        job = next((j for j in upload_queue if j['id'] == job_id), None)
+        job = queue_index.get(job_id)
         if not job:
             return jsonify({'error': 'Job not found'}), 404
         
-        if job['status'] in ['completed', 'failed']:
-            return jsonify({'error': 'Cannot cancel completed/failed job'}), 400
-        
-        job['status'] = 'cancelled'
-        job['updatedAt'] = datetime.now().isoformat()
+        with queue_lock:
+            if job['status'] in ['completed', 'failed']:
+                return jsonify({'error': 'Cannot cancel completed/failed job'}), 400
+            
+            job['status'] = 'cancelled'
+            job['updatedAt'] = g.now_iso
         
         return jsonify({'message': 'Upload cancelled', 'job': job}), 200
     
@@ -182,26 +461,24 @@ def create_dashboard_routes(app: Flask, upload_manager, config: Dict[str, Any]):
     @app.route('/api/platforms', methods=['GET'])
     def get_platforms():
         """Get platform status"""
-        return jsonify({
+        return etag_json('platforms', lambda: {
             'platforms': platforms_config,
             'count': len(platforms_config),
-        }), 200
+        })
     
     @app.route('/api/platforms/<platform>/connect', methods=['POST'])
     def connect_platform(platform: str):
         """Connect to platform (auth flow)"""
         data = request.get_json() or {}
         
-        platform_obj = next(
-            (p for p in platforms_config if p['name'].lower() == platform.lower()),
-            None
-        )
+        platform_obj = platforms_by_key.get(platform.lower())
         
         if not platform_obj:
             return jsonify({'error': 'Platform not found'}), 404
         
         # In real implementation, handle OAuth flow here
         platform_obj['connected'] = True
+        etag_cache.pop('platforms', None)
         
         return jsonify({
             'message': f'Successfully connected to {platform}',
@@ -211,15 +488,13 @@ def create_dashboard_routes(app: Flask, upload_manager, config: Dict[str, Any]):
     @app.route('/api/platforms/<platform>/disconnect', methods=['POST'])
     def disconnect_platform(platform: str):
         """Disconnect from platform"""
-        platform_obj = next(
-            (p for p in platforms_config if p['name'].lower() == platform.lower()),
-            None
-        )
+        platform_obj = platforms_by_key.get(platform.lower())
         
         if not platform_obj:
             return jsonify({'error': 'Platform not found'}), 404
         
         platform_obj['connected'] = False
+        etag_cache.pop('platforms', None)
         
         return jsonify({
             'message': f'Successfully disconnected from {platform}',
@@ -228,11 +503,9 @@ def create_dashboard_routes(app: Flask, upload_manager, config: Dict[str, Any]):
     
     # ============== ANALYTICS ENDPOINTS ==============
     
-    @app.route('/api/analytics', methods=['GET'])
-    def get_analytics():
-        """Get detailed analytics"""
-        time_range = request.args.get('range', 'month')
-        
+    @lru_cache(maxsize=16)
+    def analytics_body(time_range: str, today: int) -> str:
+        """Serialized analytics payload; deterministic per range and weekday"""
         # Generate sample data based on time range
         if time_range == 'week':
             days = 7
@@ -241,9 +514,11 @@ def create_dashboard_routes(app: Flask, upload_manager, config: Dict[str, Any]):
         else:
             days = 30
         
+        # Weekday names via lookup table instead of a datetime per point
+        weekday_names = list(calendar.day_abbr)
         chart_data = [
             {
-                'date': (datetime.now() - timedelta(days=i)).strftime('%a'),
+                'date': weekday_names[(today - i) % 7],
                 'views': 2400 + (i * 100),
                 'engagement': 240 + (i * 10),
                 'likes': 120 + (i * 5),
@@ -251,37 +526,32 @@ def create_dashboard_routes(app: Flask, upload_manager, config: Dict[str, Any]):
             for i in range(days)
         ]
         
-        platform_stats = [
-            {'platform': 'YouTube', 'views': 125000, 'engagement': 8.5},
-            {'platform': 'TikTok', 'views': 89000, 'engagement': 12.3},
-            {'platform': 'Instagram', 'views': 45000, 'engagement': 9.8},
-            {'platform': 'Twitter', 'views': 23000, 'engagement': 5.2},
-        ]
-        
-        return jsonify({
+        return app.json.dumps({
             'timeRange': time_range,
             'chartData': chart_data,
-            'platformStats': platform_stats,
-            'summary': {
-                'totalViews': sum(p['views'] for p in platform_stats),
-                'avgEngagement': sum(p['engagement'] for p in platform_stats) / len(platform_stats),
-                'topPlatform': max(platform_stats, key=lambda p: p['views'])['platform'],
-            },
-        }), 200
+            'platformStats': PLATFORM_STATS,
+            'summary': PLATFORM_SUMMARY,
+        })
+    
+    @app.route('/api/analytics', methods=['GET'])
+    def get_analytics():
+        """Get detailed analytics"""
+        time_range = request.args.get('range', 'month')
+        body = analytics_body(time_range, datetime.now().weekday())
+        return app.response_class(body, mimetype='application/json'), 200
     
     # ============== SETTINGS ENDPOINTS ==============
     
     @app.route('/api/settings', methods=['GET'])
     def get_settings():
         """Get app settings"""
-        settings = {
+        return etag_json('settings', lambda: {
             'theme': 'dark',
             'notifications': True,
             'autoUpload': False,
             'maxRetries': 3,
             'uploadQuality': 'high',
-        }
-        return jsonify(settings), 200
+        })
     
     @app.route('/api/settings', methods=['POST'])
     def save_settings():
@@ -307,9 +577,9 @@ def create_dashboard_routes(app: Flask, upload_manager, config: Dict[str, Any]):
     @app.route('/api/health', methods=['GET'])
     def health_check():
         """Health check endpoint"""
-        return jsonify({
+        return cached_json('health', lambda: {
             'status': 'healthy',
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': g.now_iso,
             'queue_size': len(upload_queue),
         }), 200
 
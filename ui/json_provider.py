@@ -0,0 +1,34 @@
+"""Gemeinsamer orjson-JSON-Provider für die Flask-Apps."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ist optional
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON-Provider auf Basis von orjson (schnelleres Encode/Decode).
+
+    Typen, die orjson nicht kennt, laufen über den Default-Handler von Flask.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(
+            obj, default=self.default, option=orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
+def init_app(app: Flask) -> None:
+    """Setzt den OrjsonProvider für jsonify und get_json, sofern orjson installiert ist."""
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
@@ -1,19 +1,162 @@
 from __future__ import annotations
 
 import json
+import os
+import tempfile
+import threading
+import time
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ist optional
+    orjson = None
+
 SETTINGS_PATH = Path("./config/settings.json")
+SETTINGS_CACHE_TTL: float = 30.0  # Sekunden
+
+# Erwartete Typen bekannter Keys; unbekannte Keys werden nicht geprüft.
+# Einmal beim Import aufgebaut, damit jede Validierung nur Lookups kostet.
+_STR = (str,)
+_INT = (int,)
+_NUMBER = (int, float)
+_BOOL = (bool,)
+_LIST = (list,)
+_OPTIONAL_DICT = (dict, type(None))
+SETTINGS_SCHEMA: dict[str, tuple[type, ...]] = {
+    **dict.fromkeys(
+        (
+            "timezone",
+            "video_folder",
+            "temp_folder",
+            "reddit_subreddit",
+            "render_video_bitrate",
+            "render_audio_bitrate",
+            "render_preset",
+            "render_hwaccel",
+            "render_padding_color",
+            "render_intro_path",
+            "render_outro_path",
+            "render_loudness_stage",
+            "output_filename_template",
+            "default_title",
+            "description_template",
+            "youtube_privacy_status",
+            "youtube_category_id",
+            "youtube_credentials_path",
+            "youtube_token_path",
+        ),
+        _STR,
+    ),
+    "scheduler_jobstore_url": (str, type(None)),
+    **dict.fromkeys(
+        (
+            "scheduler_max_workers",
+            "scheduler_max_instances",
+            "reddit_limit",
+            "reddit_download_workers",
+            "youtube_chunk_size",
+            "youtube_parallel",
+            "youtube_max_bytes",
+        ),
+        _INT,
+    ),
+    "reddit_cache_ttl": _NUMBER,
+    **dict.fromkeys(("scheduler_async", "render_vertical"), _BOOL),
+    **dict.fromkeys(("reddit_subreddits", "hashtags"), _LIST),
+    "upload_times": (dict,),
+    **dict.fromkeys(
+        ("render_watermark", "render_background_music", "render_loudness"),
+        _OPTIONAL_DICT,
+    ),
+}
+
+_cache_lock = threading.Lock()
+# (Prüfzeitpunkt monotonic, (mtime_ns, Größe) der Datei, geladene Settings)
+_settings_cache: tuple[float, tuple[int, int], dict[str, Any]] | None = None
 
 
 def load_settings() -> dict[str, Any]:
-    with SETTINGS_PATH.open("r", encoding="utf-8") as file:
-        return json.load(file)
+    # Als Bytes lesen: orjson bzw. json parsen UTF-8 direkt ohne str-Umweg
+    raw = SETTINGS_PATH.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def get_settings(ttl: float = SETTINGS_CACHE_TTL) -> dict[str, Any]:
+    """Liefert die Settings aus dem Cache.
+
+    Innerhalb von ``ttl`` Sekunden wird die Datei gar nicht angefasst; danach
+    entscheiden mtime und Größe, ob neu geparst werden muss.
+    """
+    global _settings_cache
+
+    now = time.monotonic()
+    with _cache_lock:
+        cached = _settings_cache
+        if cached is not None and now - cached[0] < ttl:
+            return dict(cached[2])
+
+        stat = SETTINGS_PATH.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        if cached is not None and cached[1] == key:
+            data = cached[2]
+        else:
+            data = load_settings()
+        _settings_cache = (now, key, data)
+        return dict(data)
+
+
+def invalidate_settings_cache() -> None:
+    global _settings_cache
+    with _cache_lock:
+        _settings_cache = None
+
+
+def validate_settings(data: dict[str, Any]) -> list[str]:
+    """Prüft die Typen bekannter Keys gegen SETTINGS_SCHEMA.
+
+    Returns:
+        Liste mit Fehlermeldungen (leer wenn gültig)
+    """
+    errors: list[str] = []
+    for key, value in data.items():
+        expected = SETTINGS_SCHEMA.get(key)
+        if expected is None:
+            continue
+        # bool ist Subklasse von int, zählt aber nicht als Zahl
+        if isinstance(value, expected) and not (
+            isinstance(value, bool) and bool not in expected
+        ):
+            continue
+        names = " | ".join(t.__name__ for t in expected)
+        errors.append(f"{key}: erwartet {names}, erhalten {type(value).__name__}")
+    return errors
 
 
 def save_settings(data: dict[str, Any]) -> None:
-    SETTINGS_PATH.parent.mkdir(exist_ok=True)
-    with SETTINGS_PATH.open("w", encoding="utf-8") as file:
-        json.dump(data, file, indent=2, ensure_ascii=False)
+    """Schreibt die Settings atomar (Temp-Datei + os.replace).
 
+    Leser sehen so immer entweder die alte oder die neue Datei, nie einen
+    halb geschriebenen Stand.
+    """
+    SETTINGS_PATH.parent.mkdir(exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(
+        dir=SETTINGS_PATH.parent, prefix=f".{SETTINGS_PATH.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=2, ensure_ascii=False)
+        # mkstemp legt 0600 an; Rechte der bisherigen Datei übernehmen
+        try:
+            mode = SETTINGS_PATH.stat().st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o644
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, SETTINGS_PATH)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    invalidate_settings_cache()
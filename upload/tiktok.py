@@ -135,12 +135,18 @@ Code-Template (Business-API):
   from requests_oauthlib import OAuth2Session
   
   client = OAuth2Session(client_id, token=token)
+  # Dateiobjekt als data= übergeben: requests streamt direkt aus der Datei,
+  # statt wie bei files= den ganzen multipart-Body im Speicher aufzubauen
+  # (für multipart mit Zusatzfeldern: requests_toolbelt.MultipartEncoder)
   with open(video_path, 'rb') as f:
-      files = {'video': f}
       response = client.post(
           'https://open.tiktokapis.com/v1/video/upload/',
-          files=files,
-          data={'description': settings.get('tiktok_description', '')}
+          data=f,
+          params={'description': settings.get('tiktok_description', '')},
+          headers={
+              'Content-Type': 'video/mp4',
+              'Content-Length': str(os.path.getsize(video_path)),
+          },
       )
       return response.json()
 
@@ -6,11 +6,25 @@ mit automatischem Token-Refresh, Retry-Mechanismen und strukturiertem Logging.
 
 from __future__ import annotations
 
+import asyncio
+import email.utils
+import hashlib
+import json
 import logging
+import os
+import random
+import stat
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
+import httplib2
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaFileUpload
@@ -26,8 +40,43 @@ logger = logging.getLogger(__name__)
 SCOPES: list[str] = ["https://www.googleapis.com/auth/youtube.upload"]
 BUNDLE_NAME: str = "SocialVideoAutoPublisher"
 MAX_RETRIES: int = 3
-RETRY_DELAY: int = 5  # Sekunden
-TIMEOUT: int = 300  # 5 Minuten für Upload-Timeout
+RETRY_DELAY: int = 5  # Sekunden (Basis des exponentiellen Backoffs)
+MAX_RETRY_DELAY: float = 30.0  # Obergrenze einer Wartezeit in Sekunden
+RETRY_JITTER: float = 0.5  # ±50 % Streuung gegen synchrone Retries
+# Wiederholbare HTTP-Status: Timeout (408), Too Early (425), Rate-Limit (429)
+# und alle Server-Fehler (5xx); alle übrigen gelten als permanent
+TRANSIENT_HTTP_STATUS: frozenset[int] = frozenset({408, 425, 429, *range(500, 600)})
+# Antworten auf Chunk-PUTs, mit denen der Server eine abgelaufene
+# Resumable-Session meldet; dann wird einmal neu ab Byte 0 begonnen
+SESSION_EXPIRED_STATUS: frozenset[int] = frozenset({404, 410})
+TIMEOUT: int = 300  # 5 Minuten Socket-Timeout pro HTTP-Request
+_MB: int = 1024 * 1024
+# YouTube lehnt Videos über 256 GB ab; ab 128 GiB (früheres Limit, für
+# viele Konten weiterhin gültig) wird nur gewarnt
+MAX_VIDEO_BYTES: int = 256 * 1024**3
+LARGE_VIDEO_BYTES: int = 128 * 1024**3
+# Resumable-Uploads verlangen Chunks in Vielfachen von 256 KiB
+CHUNK_ALIGNMENT: int = 256 * 1024
+DEFAULT_CHUNK_SIZE: int = 100 * _MB  # 100 MiB pro next_chunk()
+# Resumable-Session-URI und bestätigter Offset je Video, damit ein Upload
+# nach Fehler oder Neustart nicht wieder bei Byte 0 beginnt
+RESUME_STATE_DIR: Path = Path("./state/youtube")
+PARALLEL_UPLOADS: int = 4  # Default für youtube_parallel (Quota pro Kanal)
+# Access-Tokens leben 1 h; 5 Minuten Puffer vor dem Ablauf
+CREDENTIALS_CACHE_TTL: float = 55 * 60  # Sekunden
+# Circuit Breaker: nach so vielen Uploads in Folge, die an transienten
+# Fehlern scheitern, werden weitere Uploads für BREAKER_COOLDOWN abgelehnt
+BREAKER_THRESHOLD: int = 5
+BREAKER_COOLDOWN: float = 60.0  # Sekunden
+
+_credentials_lock = threading.Lock()
+# (Hash der client_secret.json bzw. Pfad, token_path) → (Ladezeitpunkt, Credentials)
+_credentials_cache: dict[tuple[bytes | str, str], tuple[float, Credentials]] = {}
+# Pro Thread zuletzt gebauter API-Service als (Credentials, Service)
+_service_local = threading.local()
+_breaker_lock = threading.Lock()
+# Gescheiterte Uploads in Folge und Öffnungszeitpunkt (monotonic)
+_breaker_state: dict[str, float] = {"fails": 0, "opened_at": 0.0}
 
 
 class YouTubeUploadError(Exception):
@@ -42,10 +91,94 @@ class YouTubeAuthError(YouTubeUploadError):
     pass
 
 
+def _store_token(token_file_path: Path, token_json: str) -> bool:
+    """Schreibt token.json atomar, aber nur wenn sich der Inhalt geändert hat.
+
+    Args:
+        token_file_path: Ziel der Token-Datei
+        token_json: Serialisierte Credentials
+
+    Returns:
+        True wenn geschrieben wurde, False bei unverändertem Inhalt
+    """
+    new_bytes = token_json.encode("utf-8")
+    try:
+        if token_file_path.read_bytes() == new_bytes:
+            return False
+    except FileNotFoundError:
+        pass
+
+    token_file_path.parent.mkdir(parents=True, exist_ok=True)
+    # mkstemp legt die Datei mit Modus 0600 an (Token enthält Refresh-Token)
+    fd, tmp_name = tempfile.mkstemp(
+        dir=token_file_path.parent, prefix=f".{token_file_path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as token_file:
+            token_file.write(new_bytes)
+        os.replace(tmp_name, token_file_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return True
+
+
+@lru_cache(maxsize=16)
+def _secret_digest(credentials_path: str, mtime_ns: int, size: int) -> bytes:
+    """Hasht die client_secret.json; Ergebnis gilt pro (Pfad, mtime, Größe).
+
+    Args:
+        credentials_path: Pfad zur credentials.json
+        mtime_ns: Änderungszeit in Nanosekunden (Teil des Cache-Schlüssels)
+        size: Dateigröße in Bytes (Teil des Cache-Schlüssels)
+
+    Returns:
+        blake2b-Digest des Dateiinhalts
+
+    Raises:
+        OSError: Wenn die Datei nicht lesbar ist
+    """
+    secret = Path(credentials_path).read_bytes()
+    return hashlib.blake2b(secret, digest_size=16).digest()
+
+
+def _credentials_cache_key(
+    credentials_path: str, token_path: str
+) -> tuple[bytes | str, str]:
+    """Bildet den Speicher-Cache-Schlüssel aus dem Inhalt der client_secret.json.
+
+    Wird die Datei unter gleichem Pfad ausgetauscht (anderes Projekt), ändert
+    sich der Schlüssel und es werden keine fremden Credentials geliefert. Ohne
+    lesbare Datei (z. B. nur token.json vorhanden) dient der Pfad als Schlüssel.
+    Der Digest wird pro (Pfad, mtime, Größe) gecacht, sodass ein Cache-Treffer
+    nur ein stat kostet.
+
+    Args:
+        credentials_path: Pfad zur credentials.json
+        token_path: Pfad zur token.json
+
+    Returns:
+        (blake2b-Digest oder Pfad, token_path)
+    """
+    try:
+        st = os.stat(credentials_path)
+        digest = _secret_digest(credentials_path, st.st_mtime_ns, st.st_size)
+    except OSError:
+        return credentials_path, token_path
+    return digest, token_path
+
+
+def _remember_credentials(key: tuple[bytes | str, str], creds: Credentials) -> None:
+    """Legt Credentials mit aktuellem Zeitstempel im Speicher-Cache ab."""
+    with _credentials_lock:
+        _credentials_cache[key] = (time.monotonic(), creds)
+
+
 def _load_credentials(settings: dict[str, Any]) -> Credentials:
     """Lädt oder aktualisiert YouTube-OAuth2-Credentials.
 
     Verwaltet Token-Caching und automatisches Refresh. Unterstützt:
+    - Prozess-lokalen Cache gültiger Credentials (CREDENTIALS_CACHE_TTL)
     - Token-Caching in Dateisystem
     - Automatisches Token-Refresh bei Ablauf
     - Neue Authentifizierung bei ungültigen Tokens
@@ -66,8 +199,19 @@ def _load_credentials(settings: dict[str, Any]) -> Credentials:
     )
     token_path = settings.get("youtube_token_path", "./config/token.json")
 
-    logger.debug(f"YouTube-Credentials-Pfad: {credentials_path}")
-    logger.debug(f"YouTube-Token-Pfad: {token_path}")
+    logger.debug("YouTube-Credentials-Pfad: %s", credentials_path)
+    logger.debug("YouTube-Token-Pfad: %s", token_path)
+
+    cache_key = _credentials_cache_key(credentials_path, token_path)
+    with _credentials_lock:
+        cached = _credentials_cache.get(cache_key)
+    if (
+        cached is not None
+        and time.monotonic() - cached[0] < CREDENTIALS_CACHE_TTL
+        and cached[1].valid
+    ):
+        logger.debug("YouTube-Credentials aus Speicher-Cache")
+        return cached[1]
 
     creds: Optional[Credentials] = None
 
@@ -79,7 +223,7 @@ def _load_credentials(settings: dict[str, Any]) -> Credentials:
             logger.debug("Token erfolgreich geladen")
     except Exception as exc:
         logger.warning(
-            f"Fehler beim Laden des gecachten Tokens: {exc} - Neue Auth erforderlich"
+            "Fehler beim Laden des gecachten Tokens: %s - Neue Auth erforderlich", exc
         )
         creds = None
 
@@ -87,6 +231,7 @@ def _load_credentials(settings: dict[str, Any]) -> Credentials:
     try:
         if creds and creds.valid:
             logger.info("YouTube-Token gültig")
+            _remember_credentials(cache_key, creds)
             return creds
 
         if creds and creds.expired and creds.refresh_token:
@@ -104,22 +249,36 @@ def _load_credentials(settings: dict[str, Any]) -> Credentials:
                 raise YouTubeAuthError(error_msg)
 
             flow = InstalledAppFlow.from_client_secrets_file(credentials_path, SCOPES)
-            creds = flow.run_console()
+            # run_console() gibt es ab google-auth-oauthlib 1.0 nicht mehr;
+            # ohne Browser wird die URL ausgegeben und der Redirect auf einem
+            # lokalen Port mit zufälliger Nummer entgegengenommen
+            creds = flow.run_local_server(
+                port=0,
+                open_browser=False,
+                authorization_prompt_message=(
+                    "Bitte diese URL öffnen, um den Upload zu autorisieren: {url}"
+                ),
+                success_message=(
+                    "Authentifizierung abgeschlossen, das Fenster kann geschlossen werden."
+                ),
+            )
             logger.info("Neue Authentifizierung erfolgreich")
 
         # Token cachen
         try:
-            token_file_path = Path(token_path)
-            token_file_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(token_file_path, "w", encoding="utf-8") as token_file:
-                token_file.write(creds.to_json())
-            logger.debug(f"Token gecacht in {token_path}")
+            if _store_token(Path(token_path), creds.to_json()):
+                logger.debug("Token gecacht in %s", token_path)
+            else:
+                logger.debug("Token unverändert, %s nicht neu geschrieben", token_path)
         except Exception as exc:
-            logger.warning(f"Token-Caching fehlgeschlagen (nicht kritisch): {exc}")
+            logger.warning("Token-Caching fehlgeschlagen (nicht kritisch): %s", exc)
 
+        _remember_credentials(cache_key, creds)
         return creds
 
     except google.auth.exceptions.GoogleAuthError as exc:
+        with _credentials_lock:
+            _credentials_cache.pop(cache_key, None)
         error_msg = f"Google-Authentifizierungsfehler: {exc}"
         logger.error(error_msg, exc_info=True)
         raise YouTubeAuthError(error_msg) from exc
@@ -129,39 +288,270 @@ def _load_credentials(settings: dict[str, Any]) -> Credentials:
         raise YouTubeAuthError(error_msg) from exc
 
 
-def _validate_video_file(video_path: str) -> Path:
-    """Validiert dass die Video-Datei existiert und lesbar ist.
+def _build_service(creds: Credentials) -> Any:
+    """Baut einen YouTube-API-Service auf eigener httplib2-Instanz mit TIMEOUT.
+
+    Args:
+        creds: Authentifizierte Credentials
+
+    Returns:
+        YouTube-API-Service
+    """
+    http = AuthorizedHttp(creds, http=httplib2.Http(timeout=TIMEOUT))
+    return build("youtube", "v3", http=http, cache_discovery=False)
+
+
+def _youtube_service(creds: Credentials) -> Any:
+    """Liefert den YouTube-API-Service für creds, einmal gebaut pro Thread.
+
+    Solange dieselben (gecachten) Credentials genutzt werden, entfällt das
+    erneute Aufbauen der API-Oberfläche aus dem Discovery-Dokument. Der
+    Service wird nicht zwischen Threads geteilt, da httplib2 nicht
+    threadsicher ist.
+
+    Alle Requests des Service (Metadaten und Upload-Chunks) laufen über
+    dieselbe httplib2-Instanz; deren Keep-Alive-Verbindung wird damit für
+    alle Videos des Threads wiederverwendet, und Antworten werden per
+    ``accept-encoding: gzip`` komprimiert angefordert.
+
+    Args:
+        creds: Authentifizierte Credentials
+
+    Returns:
+        YouTube-API-Service
+    """
+    cached = getattr(_service_local, "service", None)
+    if cached is None or cached[0] is not creds:
+        logger.debug("Erstelle YouTube-API-Service")
+        cached = (creds, _build_service(creds))
+        _service_local.service = cached
+    return cached[1]
+
+
+def _check_circuit() -> None:
+    """Lehnt Uploads ab, solange der Circuit Breaker offen ist.
+
+    Nach Ablauf von BREAKER_COOLDOWN wird genau ein Probe-Upload
+    durchgelassen (half-open); alle anderen warten eine weitere Periode.
+
+    Raises:
+        YouTubeUploadError: Wenn der Circuit Breaker offen ist
+    """
+    with _breaker_lock:
+        if _breaker_state["fails"] < BREAKER_THRESHOLD:
+            return
+        now = time.monotonic()
+        remaining = BREAKER_COOLDOWN - (now - _breaker_state["opened_at"])
+        if remaining <= 0:
+            _breaker_state["opened_at"] = now
+            logger.info("YouTube-Circuit-Breaker halb offen, lasse Probe-Upload zu")
+            return
+    error_msg = f"YouTube-Circuit-Breaker offen, nächster Versuch in {remaining:.0f}s"
+    logger.warning(error_msg)
+    raise YouTubeUploadError(error_msg)
+
+
+def _record_upload_result(success: bool) -> None:
+    """Aktualisiert den Circuit Breaker nach einem abgeschlossenen Upload.
+
+    Args:
+        success: True nach Erfolg, False nach Scheitern an transienten Fehlern
+    """
+    with _breaker_lock:
+        if success:
+            _breaker_state["fails"] = 0
+            return
+        _breaker_state["fails"] += 1
+        if _breaker_state["fails"] >= BREAKER_THRESHOLD:
+            _breaker_state["opened_at"] = time.monotonic()
+            logger.error(
+                "YouTube-Circuit-Breaker geöffnet nach %d gescheiterten Uploads",
+                _breaker_state["fails"],
+            )
+
+
+def _validate_video_file(
+    video_path: str, settings: Optional[dict[str, Any]] = None
+) -> Path:
+    """Validiert dass die Video-Datei existiert, lesbar und nicht zu groß ist.
+
+    Läuft vor der Authentifizierung, damit ein sicher scheiternder Upload
+    ohne OAuth-Roundtrip abgebrochen wird.
 
     Args:
         video_path: Pfad zur Video-Datei
+        settings: Optionales Konfigurationsdictionary mit Key
+            youtube_max_bytes (int, Default: MAX_VIDEO_BYTES)
 
     Returns:
         Path-Objekt der Video-Datei
 
     Raises:
-        YouTubeUploadError: Wenn Datei nicht existiert oder nicht lesbar
+        YouTubeUploadError: Wenn Datei nicht existiert, nicht lesbar oder zu groß
     """
-    video_file = Path(video_path)
-
-    if not video_file.exists():
+    # Ein einziger stat-Aufruf für alle Prüfungen (spürbar auf NFS/SMB)
+    try:
+        st = os.stat(video_path)
+    except (FileNotFoundError, NotADirectoryError):
         error_msg = f"Video-Datei nicht gefunden: {video_path}"
         logger.error(error_msg)
-        raise YouTubeUploadError(error_msg)
+        raise YouTubeUploadError(error_msg) from None
 
-    if not video_file.is_file():
+    if not stat.S_ISREG(st.st_mode):
         error_msg = f"Pfad ist keine Datei: {video_path}"
         logger.error(error_msg)
         raise YouTubeUploadError(error_msg)
 
-    if not video_file.stat().st_size > 0:
+    if st.st_size == 0:
         error_msg = f"Video-Datei ist leer: {video_path}"
         logger.error(error_msg)
         raise YouTubeUploadError(error_msg)
 
-    file_size_mb = video_file.stat().st_size / (1024 * 1024)
-    logger.info(f"Video-Datei validiert: {video_path} ({file_size_mb:.1f} MB)")
+    max_bytes = (settings or {}).get("youtube_max_bytes", MAX_VIDEO_BYTES)
+    if st.st_size > max_bytes:
+        error_msg = (
+            f"Video-Datei zu groß für YouTube: {video_path} "
+            f"({st.st_size / _MB:.1f} MB, Maximum {max_bytes / _MB:.1f} MB)"
+        )
+        logger.error(error_msg)
+        raise YouTubeUploadError(error_msg)
+    if st.st_size > LARGE_VIDEO_BYTES:
+        logger.warning(
+            "Video-Datei über 128 GiB, viele Konten sind darauf begrenzt: %s",
+            video_path,
+        )
+
+    file_size_mb = st.st_size / _MB
+    logger.info("Video-Datei validiert: %s (%.1f MB)", video_path, file_size_mb)
+
+    return Path(video_path)
+
+
+def _chunk_size(settings: dict[str, Any]) -> int:
+    """Liefert die Chunk-Größe für den Resumable Upload.
+
+    Args:
+        settings: Konfigurationsdictionary mit optionalem Key
+            youtube_chunk_size (int, Bytes)
+
+    Returns:
+        Chunk-Größe in Bytes
+
+    Raises:
+        YouTubeUploadError: Wenn der Wert kein positives Vielfaches von 256 KiB ist
+    """
+    chunk_size = settings.get("youtube_chunk_size", DEFAULT_CHUNK_SIZE)
+    if (
+        isinstance(chunk_size, bool)
+        or not isinstance(chunk_size, int)
+        or chunk_size <= 0
+        or chunk_size % CHUNK_ALIGNMENT
+    ):
+        error_msg = (
+            f"Ungültige youtube_chunk_size: {chunk_size!r} "
+            f"(erwartet positives Vielfaches von {CHUNK_ALIGNMENT})"
+        )
+        logger.error(error_msg)
+        raise YouTubeUploadError(error_msg)
+    return chunk_size
+
+
+def _resume_state_path(video_file: Path) -> Path:
+    """Liefert den Pfad der Resume-Datei für ein Video.
+
+    Größe und mtime gehen in den Schlüssel ein, damit eine geänderte Datei
+    keine alte Upload-Session fortsetzt.
+
+    Args:
+        video_file: Path-Objekt der Video-Datei
+
+    Returns:
+        Pfad der JSON-Datei unter RESUME_STATE_DIR
+    """
+    st = video_file.stat()
+    key = f"{video_file.resolve()}:{st.st_size}:{st.st_mtime_ns}"
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    return RESUME_STATE_DIR / f"yt_{digest}.json"
+
+
+def _save_resume_state(request: Any, state_path: Path) -> None:
+    """Speichert Session-URI und bestätigten Offset eines laufenden Uploads.
+
+    Args:
+        request: HttpRequest des Resumable Uploads
+        state_path: Ziel der Resume-Datei
+    """
+    try:
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+        state_path.write_text(
+            json.dumps(
+                {"uri": request.resumable_uri, "progress": request.resumable_progress}
+            ),
+            encoding="utf-8",
+        )
+    except Exception as exc:
+        logger.warning("Resume-Status nicht gespeichert (nicht kritisch): %s", exc)
 
-    return video_file
+
+def _restore_resume_state(request: Any, state_path: Path) -> None:
+    """Setzt einen gespeicherten Upload auf einem neuen HttpRequest fort.
+
+    Der Request fragt vor dem nächsten Chunk den tatsächlichen Offset beim
+    Server ab (leerer PUT mit ``Content-Range: bytes */size``) und sendet
+    erst ab dort weiter.
+
+    Args:
+        request: Frischer HttpRequest des Resumable Uploads
+        state_path: Pfad der Resume-Datei
+    """
+    try:
+        state = json.loads(state_path.read_text(encoding="utf-8"))
+        uri, progress = state["uri"], int(state["progress"])
+    except FileNotFoundError:
+        return
+    except Exception as exc:
+        logger.warning("Resume-Status unlesbar, starte neu: %s", exc)
+        return
+
+    logger.info("Setze YouTube-Upload bei Byte %d fort", progress)
+    request.resumable_uri = uri
+    request.resumable_progress = progress
+    # googleapiclient fragt im Fehlerzustand zuerst den Server-Offset ab
+    request._in_error_state = True
+
+
+def _video_body(settings: dict[str, Any]) -> dict[str, Any]:
+    """Baut die Video-Metadaten für videos().insert aus den Settings.
+
+    Args:
+        settings: Konfigurationsdictionary
+
+    Returns:
+        Request-Body mit snippet und status
+    """
+    title = settings.get("default_title", "Automated Compilation")
+    description = settings.get(
+        "description_template", "Automatisiert generierte Compilation."
+    )
+    tags = settings.get("hashtags", [])
+    category_id = settings.get("youtube_category_id", "24")
+    privacy_status = settings.get("youtube_privacy_status", "private")
+
+    logger.debug("Video-Titel: %s", title)
+    logger.debug("Privatsphäre: %s", privacy_status)
+
+    return {
+        "snippet": {
+            "title": title,
+            "description": description,
+            "tags": tags,
+            "categoryId": category_id,
+        },
+        "status": {
+            "privacyStatus": privacy_status,
+            "selfDeclaredMadeForKids": False,
+        },
+    }
 
 
 def upload_to_youtube(video_path: str, settings: dict[str, Any]) -> None:
@@ -183,6 +573,8 @@ def upload_to_youtube(video_path: str, settings: dict[str, Any]) -> None:
             - youtube_privacy_status (str): Privatsphäre-Status
             - youtube_credentials_path (str): Pfad zur credentials.json
             - youtube_token_path (str): Pfad zur token.json
+            - youtube_chunk_size (int, optional): Bytes pro Upload-Chunk
+            - youtube_max_bytes (int, optional): Maximale Dateigröße in Bytes
 
     Raises:
         YouTubeUploadError: Bei kritischen Upload-Fehlern nach Retries
@@ -193,51 +585,34 @@ def upload_to_youtube(video_path: str, settings: dict[str, Any]) -> None:
         WARNING: Transiente Fehler bei Retries
         ERROR: Kritische Upload-Fehler
     """
-    logger.info(f"Starte YouTube-Upload für {video_path}")
+    logger.info("Starte YouTube-Upload für %s", video_path)
     log_event("YouTube: Upload gestartet")
 
     try:
-        # Schritt 1: Video-Datei validieren
-        video_file = _validate_video_file(video_path)
+        # Schritt 1: Circuit Breaker, Video-Datei und Chunk-Größe prüfen
+        _check_circuit()
+        video_file = _validate_video_file(video_path, settings)
+        chunk_size = _chunk_size(settings)
 
         # Schritt 2: Authentifizieren
         logger.debug("Authentifiziere mit YouTube-API")
         creds = _load_credentials(settings)
 
-        # Schritt 3: YouTube-Service erstellen
-        logger.debug("Erstelle YouTube-API-Service")
-        youtube = build("youtube", "v3", credentials=creds, cache_discovery=False)
+        # Schritt 3: YouTube-Service holen (pro Thread und Credentials gecacht)
+        youtube = _youtube_service(creds)
 
         # Schritt 4: Metadaten vorbereiten
-        title = settings.get("default_title", "Automated Compilation")
-        description = settings.get(
-            "description_template", "Automatisiert generierte Compilation."
-        )
-        tags = settings.get("hashtags", [])
-        category_id = settings.get("youtube_category_id", "24")
-        privacy_status = settings.get("youtube_privacy_status", "private")
-
-        logger.debug(f"Video-Titel: {title}")
-        logger.debug(f"Privatsphäre: {privacy_status}")
-
-        body: dict[str, Any] = {
-            "snippet": {
-                "title": title,
-                "description": description,
-                "tags": tags,
-                "categoryId": category_id,
-            },
-            "status": {
-                "privacyStatus": privacy_status,
-                "selfDeclaredMadeForKids": False,
-            },
-        }
+        body = _video_body(settings)
 
         # Schritt 5: Upload mit Retry-Mechanismus
+        # Feste Chunks statt chunksize=-1: begrenzt den Speicherbedarf und
+        # die bei einem Fehler erneut zu sendende Datenmenge
         media = MediaFileUpload(
-            video_file.as_posix(), chunksize=-1, resumable=True
+            video_file.as_posix(), chunksize=chunk_size, resumable=True
+        )
+        _upload_with_retry(
+            youtube, body, media, video_file, _resume_state_path(video_file)
         )
-        _upload_with_retry(youtube, body, media, video_file)
 
     except (YouTubeUploadError, YouTubeAuthError):
         raise
@@ -248,89 +623,464 @@ def upload_to_youtube(video_path: str, settings: dict[str, Any]) -> None:
         raise YouTubeUploadError(error_msg) from exc
 
 
+def _new_upload_request(
+    youtube: Any, body: dict[str, Any], media: MediaFileUpload, state_path: Optional[Path]
+) -> Any:
+    """Erzeugt den Insert-Request und setzt eine gespeicherte Session fort."""
+    request = youtube.videos().insert(part="snippet,status", body=body, media_body=media)
+    if state_path is not None:
+        _restore_resume_state(request, state_path)
+    return request
+
+
+def _finish_upload(response: dict[str, Any], state_path: Optional[Path]) -> None:
+    """Räumt den Resume-Status auf und protokolliert den erfolgreichen Upload."""
+    _record_upload_result(True)
+    if state_path is not None:
+        state_path.unlink(missing_ok=True)
+    video_id = response.get("id")
+    logger.info("YouTube-Upload erfolgreich abgeschlossen (Video-ID: %s)", video_id)
+    log_event(f"YouTube: Upload abgeschlossen ({video_id})")
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponentielles Backoff mit Obergrenze und Jitter.
+
+    Args:
+        attempt: Nummer des fehlgeschlagenen Versuchs (ab 1)
+
+    Returns:
+        Wartezeit in Sekunden
+    """
+    base = min(MAX_RETRY_DELAY, RETRY_DELAY * (2 ** (attempt - 1)))
+    return base * (1 + random.uniform(-RETRY_JITTER, RETRY_JITTER))
+
+
+def _retry_after(resp: Any) -> Optional[float]:
+    """Liest den Retry-After-Header einer Fehlerantwort.
+
+    Unterstützt Sekunden und HTTP-Datum; das Ergebnis wird auf
+    [1, MAX_RETRY_DELAY] begrenzt.
+
+    Args:
+        resp: httplib2-Response (dict mit kleingeschriebenen Headern)
+
+    Returns:
+        Wartezeit in Sekunden oder None ohne (gültigen) Header
+    """
+    value = resp.get("retry-after") if isinstance(resp, dict) else None
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    return min(MAX_RETRY_DELAY, max(1.0, seconds))
+
+
+def _retry_wait(exc: Exception, attempt: int, state_path: Optional[Path]) -> float:
+    """Entscheidet nach einem fehlgeschlagenen Versuch, ob erneut versucht wird.
+
+    Args:
+        exc: HttpError, ConnectionError oder TimeoutError des Versuchs
+        attempt: Nummer des fehlgeschlagenen Versuchs (ab 1)
+        state_path: Optionaler Pfad der Resume-Datei
+
+    Returns:
+        Wartezeit in Sekunden bis zum nächsten Versuch
+
+    Raises:
+        YouTubeUploadError: Bei permanentem Fehler oder nach dem letzten Versuch
+    """
+    is_last_attempt = attempt == MAX_RETRIES
+
+    if isinstance(exc, HttpError):
+        error_code = exc.resp.status
+
+        # Permanente Fehler (alles außerhalb von TRANSIENT_HTTP_STATUS)
+        if error_code not in TRANSIENT_HTTP_STATUS:
+            error_msg = f"Permanenter YouTube-Fehler ({error_code}): {exc}"
+            logger.error(error_msg)
+            # Session ist unbrauchbar (z. B. abgelaufen): nächster Lauf startet neu
+            if state_path is not None:
+                state_path.unlink(missing_ok=True)
+            log_event(f"YouTube: Permanenter Fehler {error_code}")
+            raise YouTubeUploadError(error_msg) from exc
+
+        # Transiente Fehler (5xx, 429, 425, 408)
+        if is_last_attempt:
+            _record_upload_result(False)
+            error_msg = f"YouTube-Upload nach {MAX_RETRIES} Versuchen fehlgeschlagen: {exc}"
+            logger.error(error_msg, exc_info=True)
+            log_event(
+                f"YouTube: Upload nach {MAX_RETRIES} Versuchen fehlgeschlagen"
+            )
+            raise YouTubeUploadError(error_msg) from exc
+
+        # Vom Server vorgegebene Wartezeit hat Vorrang vor dem Backoff
+        wait_time = _retry_after(exc.resp)
+        if wait_time is None:
+            wait_time = _backoff_delay(attempt)
+        logger.warning(
+            "Transienter YouTube-Fehler (%d). Retry nach %.1fs (Versuch %d/%d): %s",
+            error_code, wait_time, attempt, MAX_RETRIES, exc,
+        )
+        return wait_time
+
+    if is_last_attempt:
+        _record_upload_result(False)
+        error_msg = (
+            f"Netzwerkfehler nach {MAX_RETRIES} Versuchen: {exc}"
+        )
+        logger.error(error_msg, exc_info=True)
+        log_event(f"YouTube: Netzwerkfehler nach {MAX_RETRIES} Versuchen")
+        raise YouTubeUploadError(error_msg) from exc
+
+    wait_time = _backoff_delay(attempt)
+    logger.warning(
+        "Netzwerkfehler. Retry nach %.1fs (Versuch %d/%d): %s",
+        wait_time, attempt, MAX_RETRIES, exc,
+    )
+    return wait_time
+
+
+def _prepare_retry(
+    exc: Exception,
+    attempt: int,
+    request: Any,
+    youtube: Any,
+    body: dict[str, Any],
+    media: MediaFileUpload,
+    state_path: Optional[Path],
+) -> tuple[Any, float]:
+    """Bereitet nach einem fehlgeschlagenen Versuch den nächsten vor.
+
+    Der Request samt Resumable-Session wird weiterverwendet; vor dem nächsten
+    Chunk fragt er den bestätigten Offset beim Server ab. Nur eine abgelaufene
+    Session (SESSION_EXPIRED_STATUS) führt zu einem neuen Insert-Request.
+
+    Args:
+        exc: Fehler des Versuchs
+        attempt: Nummer des fehlgeschlagenen Versuchs (ab 1)
+        request: Bisheriger HttpRequest
+        youtube: Google YouTube API Service
+        body: Video-Metadaten
+        media: MediaFileUpload-Objekt
+        state_path: Optionaler Pfad der Resume-Datei
+
+    Returns:
+        (Request für den nächsten Versuch, Wartezeit in Sekunden)
+
+    Raises:
+        YouTubeUploadError: Bei permanentem Fehler oder nach dem letzten Versuch
+    """
+    if (
+        isinstance(exc, HttpError)
+        and exc.resp.status in SESSION_EXPIRED_STATUS
+        and request.resumable_uri is not None
+        and attempt < MAX_RETRIES
+    ):
+        logger.warning(
+            "YouTube-Upload-Session abgelaufen (%d), starte Upload neu", exc.resp.status
+        )
+        if state_path is not None:
+            state_path.unlink(missing_ok=True)
+        return _new_upload_request(youtube, body, media, None), 0.0
+
+    wait_time = _retry_wait(exc, attempt, state_path)
+    if request.resumable_uri is not None:
+        # Auch nach Netzwerkfehlern erst den Server-Offset abfragen
+        request._in_error_state = True
+    return request, wait_time
+
+
 def _upload_with_retry(
-    youtube: Any, body: dict[str, Any], media: MediaFileUpload, video_file: Path
+    youtube: Any,
+    body: dict[str, Any],
+    media: MediaFileUpload,
+    video_file: Path,
+    state_path: Optional[Path] = None,
 ) -> None:
     """Führt YouTube-Upload mit Retry-Logik durch.
 
-    Implementiert exponentielles Backoff für transiente Fehler:
+    Implementiert exponentielles Backoff (gedeckelt, mit Jitter) für
+    transiente Fehler; ein Retry-After-Header des Servers hat Vorrang:
     - Netzwerkfehler (ConnectionError, Timeout)
-    - Rate-Limiting (429)
+    - Rate-Limiting (429), Timeout (408), Too Early (425)
     - Server-Fehler (500-599)
 
-    Permanente Fehler werden sofort weitergeleitet.
+    Permanente Fehler werden sofort weitergeleitet. Wiederholungen setzen die
+    bestehende Resumable-Session fort, statt den Upload neu zu beginnen.
+
+    Mit ``state_path`` werden Session-URI und Offset nach jedem Chunk
+    gespeichert; Wiederholungen (auch nach einem Neustart) setzen dort fort.
 
     Args:
         youtube: Google YouTube API Service
         body: Video-Metadaten
         media: MediaFileUpload-Objekt
         video_file: Path-Objekt der Video-Datei
+        state_path: Optionaler Pfad der Resume-Datei
 
     Raises:
         YouTubeUploadError: Bei kritischen Upload-Fehlern
     """
-    last_exception: Optional[Exception] = None
-
+    request = _new_upload_request(youtube, body, media, state_path)
     for attempt in range(1, MAX_RETRIES + 1):
         try:
             logger.info(
-                f"YouTube-Upload-Versuch {attempt}/{MAX_RETRIES} für {video_file.name}"
+                "YouTube-Upload-Versuch %d/%d für %s", attempt, MAX_RETRIES, video_file.name
             )
-            request = youtube.videos().insert(part="snippet,status", body=body, media_body=media)
             response = None
 
             while response is None:
                 _, response = request.next_chunk()
+                if response is None and state_path is not None:
+                    _save_resume_state(request, state_path)
 
-            video_id = response.get("id")
-            logger.info(f"YouTube-Upload erfolgreich abgeschlossen (Video-ID: {video_id})")
-            log_event(f"YouTube: Upload abgeschlossen ({video_id})")
+            _finish_upload(response, state_path)
             return
 
-        except HttpError as exc:
-            last_exception = exc
-            error_code = exc.resp.status
+        except (HttpError, ConnectionError, TimeoutError) as exc:
+            request, wait_time = _prepare_retry(
+                exc, attempt, request, youtube, body, media, state_path
+            )
+            time.sleep(wait_time)
 
-            # Permanente Fehler (4xx außer 429, 408)
-            if error_code < 500 and error_code not in (429, 408):
-                error_msg = f"Permanenter YouTube-Fehler ({error_code}): {exc}"
-                logger.error(error_msg)
-                log_event(f"YouTube: Permanenter Fehler {error_code}")
-                raise YouTubeUploadError(error_msg) from exc
-
-            # Transiente Fehler (5xx, 429, 408)
-            is_last_attempt = attempt == MAX_RETRIES
-            if is_last_attempt:
-                error_msg = f"YouTube-Upload nach {MAX_RETRIES} Versuchen fehlgeschlagen: {exc}"
-                logger.error(error_msg, exc_info=True)
-                log_event(
-                    f"YouTube: Upload nach {MAX_RETRIES} Versuchen fehlgeschlagen"
-                )
-                raise YouTubeUploadError(error_msg) from exc
 
-            wait_time = RETRY_DELAY * (2 ** (attempt - 1))  # Exponentielles Backoff
-            logger.warning(
-                f"Transienter YouTube-Fehler ({error_code}). "
-                f"Retry nach {wait_time}s (Versuch {attempt}/{MAX_RETRIES}): {exc}"
+async def _upload_with_retry_async(
+    youtube: Any,
+    body: dict[str, Any],
+    media: MediaFileUpload,
+    video_file: Path,
+    state_path: Optional[Path] = None,
+) -> None:
+    """Async-Variante von _upload_with_retry.
+
+    Die blockierenden next_chunk()-Aufrufe laufen in einem Worker-Thread,
+    das Backoff wartet per ``asyncio.sleep`` statt einen Thread zu blockieren.
+
+    Args:
+        youtube: Google YouTube API Service (nicht mit anderen Uploads teilen)
+        body: Video-Metadaten
+        media: MediaFileUpload-Objekt
+        video_file: Path-Objekt der Video-Datei
+        state_path: Optionaler Pfad der Resume-Datei
+
+    Raises:
+        YouTubeUploadError: Bei kritischen Upload-Fehlern
+    """
+    request = _new_upload_request(youtube, body, media, state_path)
+    for attempt in range(1, MAX_RETRIES + 1):
+        try:
+            logger.info(
+                "YouTube-Upload-Versuch %d/%d für %s", attempt, MAX_RETRIES, video_file.name
             )
-            time.sleep(wait_time)
+            response = None
 
-        except (ConnectionError, TimeoutError) as exc:
-            last_exception = exc
-            is_last_attempt = attempt == MAX_RETRIES
+            while response is None:
+                _, response = await asyncio.to_thread(request.next_chunk)
+                if response is None and state_path is not None:
+                    _save_resume_state(request, state_path)
 
-            if is_last_attempt:
-                error_msg = (
-                    f"Netzwerkfehler nach {MAX_RETRIES} Versuchen: {exc}"
-                )
-                logger.error(error_msg, exc_info=True)
-                log_event(f"YouTube: Netzwerkfehler nach {MAX_RETRIES} Versuchen")
-                raise YouTubeUploadError(error_msg) from exc
-
-            wait_time = RETRY_DELAY * (2 ** (attempt - 1))
-            logger.warning(
-                f"Netzwerkfehler. Retry nach {wait_time}s "
-                f"(Versuch {attempt}/{MAX_RETRIES}): {exc}"
+            _finish_upload(response, state_path)
+            return
+
+        except (HttpError, ConnectionError, TimeoutError) as exc:
+            request, wait_time = _prepare_retry(
+                exc, attempt, request, youtube, body, media, state_path
             )
-            time.sleep(wait_time)
+            await asyncio.sleep(wait_time)
+
+
+def upload_many_to_youtube(
+    video_paths: Iterable[str],
+    settings: dict[str, Any],
+    skip_on_error: bool = True,
+    max_workers: Optional[int] = None,
+) -> list[str]:
+    """Lädt mehrere Videos parallel auf YouTube hoch.
+
+    Credentials und Metadaten werden einmal erzeugt und geteilt. Jeder
+    Worker-Thread nutzt seinen eigenen API-Service (siehe _youtube_service);
+    jedes Video bekommt sein eigenes MediaFileUpload.
+
+    Args:
+        video_paths: Iterable mit Pfaden der Video-Dateien
+        settings: Konfigurationsdictionary (wie upload_to_youtube), zusätzlich
+            youtube_parallel (int, optional): Gleichzeitige Uploads
+        skip_on_error: Bei True: Fehler überspringen und weitermachen
+                      Bei False: Beim ersten Fehler abbrechen
+        max_workers: Überschreibt youtube_parallel
+
+    Returns:
+        Liste der erfolgreich hochgeladenen Pfade (in Eingabereihenfolge)
+
+    Raises:
+        YouTubeAuthError: Bei Authentifizierungsfehlern
+        YouTubeUploadError: Bei skip_on_error=False und Upload-Fehler
+
+    Logs:
+        INFO: Anzahl erfolgreicher/fehlgeschlagener Uploads
+        WARNING: Upload-Fehler (wenn skip_on_error=True)
+    """
+    path_list = list(video_paths)
+    if not path_list:
+        return []
+
+    chunk_size = _chunk_size(settings)
+    creds = _load_credentials(settings)
+    body = _video_body(settings)
+    if max_workers is None:
+        max_workers = settings.get("youtube_parallel", PARALLEL_UPLOADS)
+    workers = max(1, min(max_workers, len(path_list)))
+
+    def upload_one(video_path: str) -> str:
+        try:
+            _check_circuit()
+            video_file = _validate_video_file(video_path, settings)
+            youtube = _youtube_service(creds)
+            media = MediaFileUpload(
+                video_file.as_posix(), chunksize=chunk_size, resumable=True
+            )
+            _upload_with_retry(
+                youtube, body, media, video_file, _resume_state_path(video_file)
+            )
+            return video_path
+        except YouTubeUploadError:
+            raise
+        except Exception as exc:
+            error_msg = f"Unerwarteter Fehler bei YouTube-Upload: {exc}"
+            logger.error(error_msg, exc_info=True)
+            raise YouTubeUploadError(error_msg) from exc
+
+    uploaded: list[str] = []
+    failed: list[str] = []
+    logger.info("Starte %d YouTube-Uploads mit %d Workern", len(path_list), workers)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(upload_one, path) for path in path_list]
+        for path, future in zip(path_list, futures):
+            try:
+                uploaded.append(future.result())
+            except YouTubeUploadError as exc:
+                if not skip_on_error:
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+                logger.warning("YouTube-Upload übersprungen: %s (%s)", path, exc)
+                failed.append(path)
+
+    logger.info(
+        "YouTube-Batch abgeschlossen: %d erfolgreich, %d fehlgeschlagen",
+        len(uploaded), len(failed),
+    )
+    log_event(f"YouTube: {len(uploaded)}/{len(path_list)} Videos hochgeladen")
+    return uploaded
+
+
+async def upload_to_youtube_async(video_path: str, settings: dict[str, Any]) -> None:
+    """Async-Variante von upload_to_youtube.
+
+    Authentifizierung, Service-Aufbau und Chunk-Uploads laufen in
+    Worker-Threads; Wartezeiten zwischen Versuchen blockieren keinen Thread.
+
+    Args:
+        video_path: Pfad zur hochzuladenden Video-Datei
+        settings: Konfigurationsdictionary (wie upload_to_youtube)
+
+    Raises:
+        YouTubeUploadError: Bei kritischen Upload-Fehlern nach Retries
+        YouTubeAuthError: Bei Authentifizierungsfehlern
+    """
+    logger.info("Starte YouTube-Upload für %s", video_path)
+    log_event("YouTube: Upload gestartet")
 
+    try:
+        _check_circuit()
+        video_file = _validate_video_file(video_path, settings)
+        chunk_size = _chunk_size(settings)
+        creds = await asyncio.to_thread(_load_credentials, settings)
+        # Eigener Service je Upload: httplib2 ist nicht threadsicher
+        youtube = await asyncio.to_thread(_build_service, creds)
+        media = MediaFileUpload(
+            video_file.as_posix(), chunksize=chunk_size, resumable=True
+        )
+        await _upload_with_retry_async(
+            youtube, _video_body(settings), media, video_file,
+            _resume_state_path(video_file),
+        )
+
+    except (YouTubeUploadError, YouTubeAuthError):
+        raise
+    except Exception as exc:
+        error_msg = f"Unerwarteter Fehler bei YouTube-Upload: {exc}"
+        logger.error(error_msg, exc_info=True)
+        log_event(f"YouTube: Unerwarteter Fehler ({exc})")
+        raise YouTubeUploadError(error_msg) from exc
+
+
+async def upload_many_to_youtube_async(
+    video_paths: Iterable[str],
+    settings: dict[str, Any],
+    skip_on_error: bool = True,
+    max_workers: Optional[int] = None,
+) -> list[str]:
+    """Async-Variante von upload_many_to_youtube.
+
+    Die Uploads laufen per ``asyncio.gather``, begrenzt durch eine Semaphore
+    mit youtube_parallel (bzw. max_workers) Plätzen.
+
+    Args:
+        video_paths: Iterable mit Pfaden der Video-Dateien
+        settings: Konfigurationsdictionary (wie upload_many_to_youtube)
+        skip_on_error: Bei True: Fehler überspringen und weitermachen
+                      Bei False: Erster Fehler wird weitergereicht
+        max_workers: Überschreibt youtube_parallel
+
+    Returns:
+        Liste der erfolgreich hochgeladenen Pfade (in Eingabereihenfolge)
+
+    Raises:
+        YouTubeAuthError: Bei Authentifizierungsfehlern
+        YouTubeUploadError: Bei skip_on_error=False und Upload-Fehler
+    """
+    path_list = list(video_paths)
+    if not path_list:
+        return []
+
+    # Einmal vorab authentifizieren; die Uploads treffen dann den Speicher-Cache
+    await asyncio.to_thread(_load_credentials, settings)
+    if max_workers is None:
+        max_workers = settings.get("youtube_parallel", PARALLEL_UPLOADS)
+    semaphore = asyncio.Semaphore(max(1, max_workers))
+
+    async def upload_one(video_path: str) -> str:
+        async with semaphore:
+            await upload_to_youtube_async(video_path, settings)
+        return video_path
+
+    results = await asyncio.gather(
+        *(upload_one(path) for path in path_list), return_exceptions=skip_on_error
+    )
+
+    uploaded: list[str] = []
+    for path, result in zip(path_list, results):
+        if isinstance(result, BaseException):
+            if not isinstance(result, YouTubeUploadError):
+                raise result
+            logger.warning("YouTube-Upload übersprungen: %s (%s)", path, result)
+        else:
+            uploaded.append(result)
+
+    logger.info(
+        "YouTube-Batch abgeschlossen: %d erfolgreich, %d fehlgeschlagen",
+        len(uploaded), len(path_list) - len(uploaded),
+    )
+    log_event(f"YouTube: {len(uploaded)}/{len(path_list)} Videos hochgeladen")
+    return uploaded